@@ -0,0 +1,89 @@
+# coding: utf-8
+"""BulkDataWriter throughput against a local stub server.
+
+    python benchmarks/bench_bulk_write.py --points 20000 --concurrency 1 2 4 8
+
+The stub answers `add_list_data` after a fixed per-request latency plus a
+per-point cost, and rejects batches above `--max-batch` with 413, as a
+server behind a request size limit would. Each concurrency level writes the
+same points and reports points/sec and the batch size the writer settled on.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import swagger_client  # noqa: E402
+from swagger_client.bulk import AdaptiveBatchSize, BulkDataWriter  # noqa: E402
+from swagger_client.configuration import ValidationContext  # noqa: E402
+from test.stub_server import StubServer  # noqa: E402
+
+
+def make_points(count):
+    """Returns `count` DataCreationDTO sharing one validation context."""
+    context = ValidationContext()
+    provenance = swagger_client.DataProvenanceModel(
+        uri='http://opensilex.org/id/provenance/1', _configuration=context)
+    return [swagger_client.DataCreationDTO(
+        _date='2024-01-01T10:00:00Z',
+        target='http://opensilex.org/id/so/1',
+        variable='http://opensilex.org/id/variable/1',
+        value=i * 0.5, provenance=provenance,
+        _configuration=context) for i in range(count)]
+
+
+def make_handler(latency, point_cost, max_batch):
+    def handler(request):
+        batch = request.json()
+        if len(batch) > max_batch:
+            return 413, 'Payload Too Large'
+        time.sleep(latency + point_cost * len(batch))
+        return 201, {'metadata': {}, 'result': [''] * len(batch)}
+    return handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--points', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, nargs='+',
+                        default=[1, 2, 4, 8])
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='initial batch size')
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='stub latency per request, in seconds')
+    parser.add_argument('--point-cost', type=float, default=0.00002,
+                        help='stub latency per point, in seconds')
+    parser.add_argument('--max-batch', type=int, default=5000,
+                        help='largest batch the stub accepts')
+    parser.add_argument('--target-latency', type=float, default=0.25)
+    args = parser.parse_args()
+
+    points = make_points(args.points)
+    handler = make_handler(args.latency, args.point_cost, args.max_batch)
+    print('%d points' % args.points)
+    with StubServer(handler) as server:
+        for concurrency in args.concurrency:
+            configuration = swagger_client.Configuration()
+            configuration.host = server.url
+            configuration.connection_pool_maxsize = max(
+                concurrency, configuration.connection_pool_maxsize)
+            data_api = swagger_client.DataApi(
+                swagger_client.ApiClient(configuration))
+            batch_size = AdaptiveBatchSize(
+                initial=args.batch_size, maximum=50000,
+                target_latency=args.target_latency)
+            with BulkDataWriter(data_api, 'token', concurrency=concurrency,
+                                batch_size=batch_size) as writer:
+                writer.write_all(points)
+            print('concurrency %-3d %8.2f s  %10.0f points/s  '
+                  'final batch size %d' % (concurrency, writer.elapsed,
+                                           writer.rate(), batch_size.size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+# coding: utf-8
+"""Deserialization benchmarks on a synthetic `search_data_list` page.
+
+    python benchmarks/bench_deserialize.py --rows 5000
+
+Each case decodes the same JSON body into `list[DataGetSearchDTO]` and
+reports the best wall time over `--repeat` runs. `ApiClient.deserialize`
+runs the compiled type plans of swagger_client.deserializer, measured
+against the generic deserializer they replace, kept in
+test/reference_deserializer.py.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import urllib3  # noqa: E402
+
+import swagger_client  # noqa: E402
+from swagger_client import deserializer  # noqa: E402
+from swagger_client.rest import RESTResponse  # noqa: E402
+from test import reference_deserializer  # noqa: E402
+
+
+def make_page(rows):
+    """Returns the JSON body of a data page with `rows` observations."""
+    return json.dumps([{
+        'uri': 'http://opensilex.org/id/data/%d' % i,
+        'date': '2024-01-%02dT10:00:00+0100' % (i % 28 + 1),
+        'target': 'http://opensilex.org/id/so/%d' % (i % 500),
+        'variable': 'http://opensilex.org/id/variable/%d' % (i % 20),
+        'value': i * 0.5,
+        'confidence': 0.9,
+        'provenance': {
+            'uri': 'http://opensilex.org/id/provenance/importer',
+            'prov_used': [{'uri': 'http://opensilex.org/id/device/1',
+                           'rdf_type': 'vocabulary:SensingDevice'}],
+        },
+        'metadata': {'source': 'bench'},
+        'publisher': 'http://opensilex.org/id/user/admin',
+        'issued': '2024-02-01T00:00:00Z',
+    } for i in range(rows)]).encode('utf8')
+
+
+def make_client(**settings):
+    configuration = swagger_client.Configuration()
+    for key, value in settings.items():
+        setattr(configuration, key, value)
+    return swagger_client.ApiClient(configuration)
+
+
+def per_instance_configuration(client, body):
+    """The pre-context behaviour: one Configuration() per model.
+
+    Without a default configuration every Configuration() also attaches a
+    new StreamHandler to the package loggers, so this case degrades
+    quadratically with the number of models built in the process.
+    """
+    data = client.codec.loads(body)
+    result = []
+    for row in data:
+        provenance = row['provenance']
+        result.append(swagger_client.DataGetSearchDTO(
+            uri=row['uri'], _date=row['date'], target=row['target'],
+            variable=row['variable'], value=row['value'],
+            confidence=row['confidence'],
+            provenance=swagger_client.DataProvenanceModel(
+                uri=provenance['uri'],
+                prov_used=[swagger_client.ProvEntityModel(**used)
+                           for used in provenance['prov_used']]),
+            metadata=row['metadata'], publisher=row['publisher'],
+            issued=row['issued']))
+    return result
+
+
+def shared_context(client, body):
+    context = swagger_client.configuration.ValidationContext()
+    data = client.codec.loads(body)
+    result = []
+    for row in data:
+        provenance = row['provenance']
+        result.append(swagger_client.DataGetSearchDTO(
+            uri=row['uri'], _date=row['date'], target=row['target'],
+            variable=row['variable'], value=row['value'],
+            confidence=row['confidence'],
+            provenance=swagger_client.DataProvenanceModel(
+                uri=provenance['uri'],
+                prov_used=[swagger_client.ProvEntityModel(
+                    _configuration=context, **used)
+                    for used in provenance['prov_used']],
+                _configuration=context),
+            metadata=row['metadata'], publisher=row['publisher'],
+            issued=row['issued'], _configuration=context))
+    return result
+
+
+def deserialize(client, body):
+    response = RESTResponse(urllib3.HTTPResponse(body=body, status=200))
+    return client.deserialize(response, 'list[DataGetSearchDTO]')
+
+
+def generic_deserialize(client, body, trusted=False):
+    """The generic deserializer used before the compiled decoders, which
+    parses the type string of every value and resolves model classes by
+    name each time."""
+    data = client.codec.loads(body)
+    context = swagger_client.configuration.ValidationContext()
+    return reference_deserializer.deserialize(
+        data, 'list[DataGetSearchDTO]', context, trusted)
+
+
+def generic_deserialize_trusted(client, body):
+    return generic_deserialize(client, body, trusted=True)
+
+
+def compiled_decoder(client, body):
+    """The compiled decoder alone, without the response handling of
+    ApiClient.deserialize."""
+    data = client.codec.loads(body)
+    context = swagger_client.configuration.ValidationContext()
+    return deserializer.compile_type('list[DataGetSearchDTO]')(data, context)
+
+
+def columns(client, body):
+    from swagger_client import columnar
+    return columnar.decode_data_columns(client.codec.loads(body))
+
+
+def cases():
+    """Returns the benchmark cases as (label, client, callable) tuples."""
+    try:
+        import numpy  # noqa: F401
+        extra = [('columnar.decode_data_columns', make_client(), columns)]
+    except ImportError:
+        extra = []
+    return [
+        ('models, Configuration() per instance', make_client(),
+         per_instance_configuration),
+        ('models, shared ValidationContext', make_client(), shared_context),
+        ('generic deserializer', make_client(), generic_deserialize),
+        ('generic deserializer, trusted', make_client(),
+         generic_deserialize_trusted),
+        ('deserializer.compile_type', make_client(), compiled_decoder),
+        ('ApiClient.deserialize', make_client(), deserialize),
+        ('ApiClient.deserialize, trusted',
+         make_client(trusted_deserialization=True), deserialize),
+    ] + extra
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--with-default', action='store_true',
+                        help='call Configuration.set_default() first, which '
+                             'makes every Configuration() copy the default')
+    args = parser.parse_args()
+
+    if args.with_default:
+        swagger_client.Configuration.set_default(
+            swagger_client.Configuration())
+
+    body = make_page(args.rows)
+    print('%d rows, %.1f MB of JSON' % (args.rows, len(body) / 1e6))
+    for label, client, func in cases():
+        best = min(timeit.repeat(lambda: func(client, body),
+                                 number=1, repeat=args.repeat))
+        print('%-45s %8.3f s  %10.0f rows/s' % (label, best,
+                                                args.rows / best))
+
+
+if __name__ == '__main__':
+    main()
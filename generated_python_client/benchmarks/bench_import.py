@@ -0,0 +1,53 @@
+# coding: utf-8
+"""Cold-start benchmark of `import swagger_client`.
+
+    python benchmarks/bench_import.py --repeat 10
+
+Each case runs in a fresh interpreter and reports the best wall time of
+the import statement plus the attribute accesses listed.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+CASES = [
+    ('two APIs (import_data.py)',
+     'swagger_client.DataApi; swagger_client.ScientificObjectsApi'),
+    ('ApiClient only', 'swagger_client.ApiClient'),
+    ('everything (the former eager import)',
+     '[getattr(swagger_client, name) for name in swagger_client.__all__]'),
+]
+
+SCRIPT = '''
+import time
+start = time.perf_counter()
+import swagger_client
+{access}
+print(time.perf_counter() - start)
+'''
+
+
+def run(access):
+    output = subprocess.check_output(
+        [sys.executable, '-c', SCRIPT.format(access=access)], cwd=ROOT)
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for label, access in CASES:
+        best = min(run(access) for _ in range(args.repeat))
+        print('%-40s %8.1f ms' % (label, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
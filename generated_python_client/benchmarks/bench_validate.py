@@ -0,0 +1,71 @@
+# coding: utf-8
+"""Local validation of a synthetic data CSV file.
+
+    python benchmarks/bench_validate.py --rows 1000000 --errors 0.001
+
+Writes a file in the OpenSILEX data format with a decimal, an integer and a
+boolean variable, spoils a fraction `--errors` of its cells, and reports
+the time DataCsvValidator takes to check it, with rows/sec.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from swagger_client.csv_validation import DataCsvValidator  # noqa: E402
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+DATATYPES = {'Height': XSD + 'decimal', 'Leaf count': XSD + 'integer',
+             'Flowering': XSD + 'boolean'}
+BAD_CELLS = ['12,5', 'abc', '2024-13-01', 'NA']
+
+
+def write_file(path, rows, errors):
+    rng = random.Random(0)
+    with open(path, 'w') as f:
+        f.write('experiment,target,date *,Height,Leaf count,Flowering\n')
+        f.write('Experiment,Target,Date,Height,Leaf count,Flowering\n')
+        f.write('string,string,date,decimal,integer,boolean\n')
+        for i in range(rows):
+            cells = ['Experiment A', 'plant %d' % (i % 5000),
+                     '2024-%02d-%02dT10:%02d:00+01:00' % (
+                         i % 12 + 1, i % 28 + 1, i % 60),
+                     '%.2f' % (i * 0.01), str(i % 40),
+                     'true' if i % 2 else 'false']
+            if rng.random() < errors:
+                cells[rng.randrange(2, 6)] = rng.choice(BAD_CELLS)
+            f.write(','.join(cells) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--errors', type=float, default=0.001,
+                        help='fraction of rows with a bad cell')
+    parser.add_argument('--chunk-size', type=int, default=200000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        write_file(path, args.rows, args.errors)
+        validator = DataCsvValidator(DATATYPES, chunk_size=args.chunk_size)
+        start = time.time()
+        report = validator.validate(path)
+        elapsed = time.time() - start
+    finally:
+        os.remove(path)
+    print(report.summary())
+    print('%d rows in %.2f s, %.0f rows/s' % (report.rows, elapsed,
+                                             report.rows / elapsed))
+
+
+if __name__ == '__main__':
+    main()
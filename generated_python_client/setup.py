@@ -38,6 +38,12 @@ setup(
     url="",
     keywords=["Swagger", "OpenSilex API"],
     install_requires=REQUIRES,
+    extras_require={
+        "asyncio": ["aiohttp>=3.0"],
+        "orjson": ["orjson"],
+        "columnar": ["numpy"],
+        "validation": ["numpy", "pandas"],
+    },
     packages=find_packages(),
     include_package_data=True,
     long_description="""\
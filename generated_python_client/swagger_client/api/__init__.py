@@ -2,31 +2,42 @@ from __future__ import absolute_import
 
 # flake8: noqa
 
+# Attributes are imported on first access, see lazy_import.attach.
+from swagger_client import lazy_import
+
 # import apis into api package
-from swagger_client.api.agroportal_api_api import AgroportalAPIApi
-from swagger_client.api.annotations_api import AnnotationsApi
-from swagger_client.api.area_api import AreaApi
-from swagger_client.api.authentication_api import AuthenticationApi
-from swagger_client.api.brapi_api import BRAPIApi
-from swagger_client.api.data_api import DataApi
-from swagger_client.api.devices_api import DevicesApi
-from swagger_client.api.documents_api import DocumentsApi
-from swagger_client.api.events_api import EventsApi
-from swagger_client.api.experiments_api import ExperimentsApi
-from swagger_client.api.factors_api import FactorsApi
-from swagger_client.api.faidare_api import FaidareApi
-from swagger_client.api.germplasm_api import GermplasmApi
-from swagger_client.api.metrics_api import MetricsApi
-from swagger_client.api.ontology_api import OntologyApi
-from swagger_client.api.organizations_api import OrganizationsApi
-from swagger_client.api.positions_api import PositionsApi
-from swagger_client.api.projects_api import ProjectsApi
-from swagger_client.api.scientific_objects_api import ScientificObjectsApi
-from swagger_client.api.security_api import SecurityApi
-from swagger_client.api.species_api import SpeciesApi
-from swagger_client.api.staple_api_api import StapleAPIApi
-from swagger_client.api.system_api import SystemApi
-from swagger_client.api.uri_search_api import UriSearchApi
-from swagger_client.api.variables_api import VariablesApi
-from swagger_client.api.vue_js_api import VueJsApi
-from swagger_client.api.vue_js___ontology_extension_api import VueJsOntologyExtensionApi
+_lazy_attributes = {
+    'AgroportalAPIApi': 'swagger_client.api.agroportal_api_api',
+    'AnnotationsApi': 'swagger_client.api.annotations_api',
+    'AreaApi': 'swagger_client.api.area_api',
+    'AuthenticationApi': 'swagger_client.api.authentication_api',
+    'BRAPIApi': 'swagger_client.api.brapi_api',
+    'DataApi': 'swagger_client.api.data_api',
+    'DevicesApi': 'swagger_client.api.devices_api',
+    'DocumentsApi': 'swagger_client.api.documents_api',
+    'EventsApi': 'swagger_client.api.events_api',
+    'ExperimentsApi': 'swagger_client.api.experiments_api',
+    'FactorsApi': 'swagger_client.api.factors_api',
+    'FaidareApi': 'swagger_client.api.faidare_api',
+    'GermplasmApi': 'swagger_client.api.germplasm_api',
+    'MetricsApi': 'swagger_client.api.metrics_api',
+    'OntologyApi': 'swagger_client.api.ontology_api',
+    'OrganizationsApi': 'swagger_client.api.organizations_api',
+    'PositionsApi': 'swagger_client.api.positions_api',
+    'ProjectsApi': 'swagger_client.api.projects_api',
+    'ScientificObjectsApi': 'swagger_client.api.scientific_objects_api',
+    'SecurityApi': 'swagger_client.api.security_api',
+    'SpeciesApi': 'swagger_client.api.species_api',
+    'StapleAPIApi': 'swagger_client.api.staple_api_api',
+    'SystemApi': 'swagger_client.api.system_api',
+    'UriSearchApi': 'swagger_client.api.uri_search_api',
+    'VariablesApi': 'swagger_client.api.variables_api',
+    'VueJsApi': 'swagger_client.api.vue_js_api',
+    'VueJsOntologyExtensionApi': 'swagger_client.api.vue_js___ontology_extension_api',
+}
+
+__all__ = sorted(_lazy_attributes)
+
+__getattr__, __dir__ = lazy_import.attach(__name__, _lazy_attributes)
+if __getattr__ is None:
+    del __getattr__, __dir__
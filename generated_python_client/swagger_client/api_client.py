@@ -12,7 +12,6 @@
 from __future__ import absolute_import
 
 import datetime
-import json
 import mimetypes
 from multiprocessing.pool import ThreadPool
 import os
@@ -23,9 +22,14 @@ import tempfile
 import six
 from six.moves.urllib.parse import quote
 
-from swagger_client.configuration import Configuration
+from swagger_client.configuration import Configuration, ValidationContext
 import swagger_client.models
+from swagger_client import deserializer
+from swagger_client import envelope
+from swagger_client import json_codec
 from swagger_client import rest
+from swagger_client.multipart import FileContent
+from swagger_client.single_flight import SingleFlight
 
 
 class ApiClient(object):
@@ -65,10 +69,11 @@ class ApiClient(object):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
+        self.codec = json_codec.get_codec(configuration.json_codec)
 
         # Use the pool property to lazily initialize the ThreadPool.
         self._pool = None
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self.create_rest_client(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -76,11 +81,26 @@ class ApiClient(object):
         # Set default User-Agent.
         self.user_agent = 'Swagger-Codegen/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        # see single_flight.SingleFlight
+        self.single_flight = (SingleFlight()
+                              if configuration.coalesce_requests else None)
 
     def __del__(self):
         if self._pool is not None:
             self._pool.close()
-            self._pool.join()
+            try:
+                self._pool.join()
+            except RuntimeError:
+                # the last reference was dropped by a task of the pool
+                pass
+
+    def create_rest_client(self, configuration):
+        """Creates the transport used to perform HTTP requests.
+
+        :param configuration: .Configuration object for this client
+        :return: rest.RESTClientObject
+        """
+        return rest.RESTClientObject(configuration)
 
     @property
     def pool(self):
@@ -88,6 +108,11 @@ class ApiClient(object):
             self._pool = ThreadPool()
         return self._pool
 
+    @property
+    def pool_stats(self):
+        """Statistics of the connection pools, see pooling.PoolStats."""
+        return getattr(self.rest_client, 'pool_stats', None)
+
     @property
     def user_agent(self):
         """User agent for this API client"""
@@ -107,6 +132,58 @@ class ApiClient(object):
             _return_http_data_only=None, collection_formats=None,
             _preload_content=True, _request_timeout=None):
 
+        url, header_params, query_params, post_params, body = \
+            self.prepare_request(resource_path, path_params, query_params,
+                                 header_params, body, post_params, files,
+                                 auth_settings, collection_formats)
+
+        # perform request and return response
+        def send():
+            return self.request(
+                method, url, query_params=query_params, headers=header_params,
+                post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        if (self.single_flight is not None and method == 'GET' and
+                _preload_content):
+            # identical GETs in flight share one response, deserialized by
+            # each caller into objects of its own
+            key = (url, tuple((k, str(v)) for k, v in query_params or ()),
+                   tuple(sorted(header_params.items())))
+            request = send
+
+            def send():
+                return self.single_flight.do(key, request)
+
+        cache = self.configuration.response_cache
+        if (cache is not None and _preload_content and
+                cache.is_read(method, resource_path)):
+            response_data = cache.fetch(resource_path, send, method, url,
+                                        query_params, header_params, body)
+        elif cache is not None and cache.is_write(method, resource_path):
+            try:
+                response_data = send()
+            finally:
+                # even a failed write may have changed the resources
+                cache.invalidate(resource_path)
+        else:
+            response_data = send()
+
+        return self.handle_response(response_data, response_type,
+                                    _return_http_data_only, _preload_content)
+
+    def prepare_request(self, resource_path, path_params=None,
+                        query_params=None, header_params=None, body=None,
+                        post_params=None, files=None, auth_settings=None,
+                        collection_formats=None):
+        """Builds the url, headers, query, form and body of a request.
+
+        Shared by the synchronous and asyncio clients so that both send
+        byte-identical requests for the same generated API call.
+
+        :return: tuple (url, header_params, query_params, post_params, body)
+        """
         config = self.configuration
 
         # header parameters
@@ -154,13 +231,17 @@ class ApiClient(object):
         # request url
         url = self.configuration.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
+        return url, header_params, query_params, post_params, body
+
+    def handle_response(self, response_data, response_type=None,
+                        _return_http_data_only=None, _preload_content=True):
+        """Deserializes a response and shapes the value returned to callers.
 
+        :param response_data: RESTResponse, or the raw response object when
+                              `_preload_content` is False.
+        :return: the deserialized data, or a tuple (data, status, headers)
+                 unless `_return_http_data_only` is set.
+        """
         self.last_response = response_data
 
         return_data = response_data
@@ -203,6 +284,8 @@ class ApiClient(object):
                          for sub_obj in obj)
         elif isinstance(obj, (datetime.datetime, datetime.date)):
             return obj.isoformat()
+        elif isinstance(obj, FileContent):
+            return obj
 
         if isinstance(obj, dict):
             obj_dict = obj
@@ -226,59 +309,38 @@ class ApiClient(object):
         :param response_type: class literal for
             deserialized object, or string of class name.
 
-        :return: deserialized object.
+        :return: deserialized object. When the server wrapped it in the
+            OpenSILEX envelope, the object with the response MetadataDTO:
+            a ResponseList, which is a list, for list results, or a
+            ResponseEnvelope for models; see envelope.wrap.
         """
         # handle file downloading
         # save response body into a tmp file and return the instance
         if response_type == "file":
             return self.__deserialize_file(response)
 
-        # fetch data from response object
+        # fetch data from response object, parsing the undecoded body
+        # when the transport kept it
+        raw_data = getattr(response, 'raw_data', None)
+        if raw_data is None:
+            raw_data = response.data
         try:
-            data = json.loads(response.data)
+            data = self.codec.loads(raw_data)
         except ValueError:
             data = response.data
 
-        return self.__deserialize(data, response_type)
-
-    def __deserialize(self, data, klass):
-        """Deserializes dict, list, str into an object.
-
-        :param data: dict, list or str.
-        :param klass: class literal, or string of class name.
-
-        :return: object.
-        """
-        if data is None:
-            return None
-
-        if type(klass) == str:
-            if klass.startswith('list['):
-                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('dict('):
-                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(swagger_client.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        # every model built from this response shares one context
+        context = ValidationContext(self.client_side_validation)
+        trusted = self.configuration.trusted_deserialization
+        decoder = deserializer.compile_type(response_type, trusted)
+        if (isinstance(data, dict) and 'result' in data and
+                'metadata' in data and
+                deserializer.unwraps_envelope(response_type)):
+            decode_metadata = deserializer.compile_type('MetadataDTO',
+                                                        trusted)
+            return envelope.wrap(decoder(data['result'], context),
+                                 decode_metadata(data['metadata'], context))
+        return decoder(data, context)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -435,7 +497,9 @@ class ApiClient(object):
         """Builds form parameters.
 
         :param post_params: Normal form parameters.
-        :param files: File parameters.
+        :param files: File parameters: file paths, or (filename, content)
+                      or (filename, content, mimetype) tuples, content
+                      being bytes or a multipart.FileContent.
         :return: Form parameters with files.
         """
         params = []
@@ -449,13 +513,23 @@ class ApiClient(object):
                     continue
                 file_names = v if type(v) is list else [v]
                 for n in file_names:
-                    with open(n, 'rb') as f:
-                        filename = os.path.basename(f.name)
-                        filedata = f.read()
-                        mimetype = (mimetypes.guess_type(filename)[0] or
+                    if isinstance(n, tuple):
+                        # (filename, content[, mimetype]) built in memory
+                        filename, filedata = n[0], n[1]
+                        mimetype = (n[2] if len(n) > 2 else
+                                    mimetypes.guess_type(filename)[0] or
                                     'application/octet-stream')
                         params.append(
                             tuple([k, tuple([filename, filedata, mimetype])]))
+                        continue
+                    # read by chunks while the request is sent, see
+                    # multipart.MultipartEncoder
+                    filename = os.path.basename(n)
+                    filedata = FileContent(n)
+                    mimetype = (mimetypes.guess_type(filename)[0] or
+                                'application/octet-stream')
+                    params.append(
+                        tuple([k, tuple([filename, filedata, mimetype])]))
 
         return params
 
@@ -532,108 +606,17 @@ class ApiClient(object):
         if content_disposition:
             filename = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?',
                                  content_disposition).group(1)
-            path = os.path.join(os.path.dirname(path), filename)
+            path = os.path.join(os.path.dirname(path),
+                                os.path.basename(filename))
 
-        with open(path, "w") as f:
-            f.write(response.data)
+        # the undecoded body, as files are not text; see download.py to
+        # stream large files to disk instead
+        data = getattr(response, 'raw_data', None)
+        if data is None:
+            data = response.data
+        if isinstance(data, six.text_type):
+            data = data.encode('utf-8')
+        with open(path, "wb") as f:
+            f.write(data)
 
         return path
-
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return a original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason="Failed to parse `{0}` as date object".format(string)
-            )
-
-    def __deserialize_datatime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason=(
-                    "Failed to parse `{0}` as datetime object"
-                    .format(string)
-                )
-            )
-
-    def __hasattr(self, object, name):
-        return name in object.__class__.__dict__
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if (not klass.swagger_types and
-                not self.__hasattr(klass, 'get_real_child_model')):
-            return data
-
-        kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
@@ -0,0 +1,92 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+# flake8: noqa
+
+from swagger_client.async_api_client import AsyncApiClient
+from swagger_client.api.agroportal_api_api import AgroportalAPIApi
+from swagger_client.api.annotations_api import AnnotationsApi
+from swagger_client.api.area_api import AreaApi
+from swagger_client.api.authentication_api import AuthenticationApi
+from swagger_client.api.brapi_api import BRAPIApi
+from swagger_client.api.data_api import DataApi
+from swagger_client.api.devices_api import DevicesApi
+from swagger_client.api.documents_api import DocumentsApi
+from swagger_client.api.events_api import EventsApi
+from swagger_client.api.experiments_api import ExperimentsApi
+from swagger_client.api.factors_api import FactorsApi
+from swagger_client.api.faidare_api import FaidareApi
+from swagger_client.api.germplasm_api import GermplasmApi
+from swagger_client.api.metrics_api import MetricsApi
+from swagger_client.api.ontology_api import OntologyApi
+from swagger_client.api.organizations_api import OrganizationsApi
+from swagger_client.api.positions_api import PositionsApi
+from swagger_client.api.projects_api import ProjectsApi
+from swagger_client.api.scientific_objects_api import ScientificObjectsApi
+from swagger_client.api.security_api import SecurityApi
+from swagger_client.api.species_api import SpeciesApi
+from swagger_client.api.staple_api_api import StapleAPIApi
+from swagger_client.api.system_api import SystemApi
+from swagger_client.api.uri_search_api import UriSearchApi
+from swagger_client.api.variables_api import VariablesApi
+from swagger_client.api.vue_js_api import VueJsApi
+from swagger_client.api.vue_js___ontology_extension_api import VueJsOntologyExtensionApi
+
+
+def _async_api(api_class):
+    """Returns a subclass of `api_class` bound to an AsyncApiClient.
+
+    The generated methods are reused unchanged: with an AsyncApiClient
+    underneath they return awaitables instead of results.
+    """
+    def __init__(self, api_client=None):
+        if api_client is None:
+            api_client = AsyncApiClient()
+        api_class.__init__(self, api_client)
+
+    return type('Async' + api_class.__name__, (api_class,), {
+        '__init__': __init__,
+        '__doc__': 'asyncio variant of %s.' % api_class.__name__,
+        '__module__': __name__,
+    })
+
+
+AsyncAgroportalAPIApi = _async_api(AgroportalAPIApi)
+AsyncAnnotationsApi = _async_api(AnnotationsApi)
+AsyncAreaApi = _async_api(AreaApi)
+AsyncAuthenticationApi = _async_api(AuthenticationApi)
+AsyncBRAPIApi = _async_api(BRAPIApi)
+AsyncDataApi = _async_api(DataApi)
+AsyncDevicesApi = _async_api(DevicesApi)
+AsyncDocumentsApi = _async_api(DocumentsApi)
+AsyncEventsApi = _async_api(EventsApi)
+AsyncExperimentsApi = _async_api(ExperimentsApi)
+AsyncFactorsApi = _async_api(FactorsApi)
+AsyncFaidareApi = _async_api(FaidareApi)
+AsyncGermplasmApi = _async_api(GermplasmApi)
+AsyncMetricsApi = _async_api(MetricsApi)
+AsyncOntologyApi = _async_api(OntologyApi)
+AsyncOrganizationsApi = _async_api(OrganizationsApi)
+AsyncPositionsApi = _async_api(PositionsApi)
+AsyncProjectsApi = _async_api(ProjectsApi)
+AsyncScientificObjectsApi = _async_api(ScientificObjectsApi)
+AsyncSecurityApi = _async_api(SecurityApi)
+AsyncSpeciesApi = _async_api(SpeciesApi)
+AsyncStapleAPIApi = _async_api(StapleAPIApi)
+AsyncSystemApi = _async_api(SystemApi)
+AsyncUriSearchApi = _async_api(UriSearchApi)
+AsyncVariablesApi = _async_api(VariablesApi)
+AsyncVueJsApi = _async_api(VueJsApi)
+AsyncVueJsOntologyExtensionApi = _async_api(VueJsOntologyExtensionApi)
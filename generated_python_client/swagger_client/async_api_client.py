@@ -0,0 +1,126 @@
+# coding: utf-8
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+
+from swagger_client.api_client import ApiClient
+from swagger_client import async_rest
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio API client for the generated API classes.
+
+    Request building, serialization and deserialization are inherited from
+    ApiClient; only the transport differs. Any generated API class bound to
+    an AsyncApiClient returns awaitables instead of results, so the same
+    parameter tables drive both clients:
+
+    >>> client = AsyncApiClient(configuration)
+    >>> data = await DataApi(client).search_data_list(token, page_size=100)
+
+    The client should be closed with `await client.close()`, or used as an
+    `async with` context manager, to release its connections.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    def create_rest_client(self, configuration):
+        """Creates the aiohttp based transport.
+
+        :param configuration: .Configuration object for this client
+        :return: async_rest.AsyncRESTClientObject
+        """
+        return async_rest.AsyncRESTClientObject(configuration)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the HTTP session held by this client."""
+        await self.rest_client.close()
+
+    async def __call_api(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None):
+
+        url, header_params, query_params, post_params, body = \
+            self.prepare_request(resource_path, path_params, query_params,
+                                 header_params, body, post_params, files,
+                                 auth_settings, collection_formats)
+
+        # perform request and return response
+        def send():
+            return self.request(
+                method, url, query_params=query_params,
+                headers=header_params, post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        # the cache logic of ApiClient, awaiting the request
+        cache = self.configuration.response_cache
+        if (cache is not None and _preload_content and
+                cache.is_read(method, resource_path)):
+            key, response_data = cache.lookup(resource_path, method, url,
+                                              query_params, header_params,
+                                              body)
+            if response_data is None:
+                generation = cache.generation(resource_path)
+                response_data = await send()
+                cache.store(resource_path, key, response_data, generation)
+        elif cache is not None and cache.is_write(method, resource_path):
+            try:
+                response_data = await send()
+            finally:
+                cache.invalidate(resource_path)
+        else:
+            response_data = await send()
+
+        return self.handle_response(response_data, response_type,
+                                    _return_http_data_only, _preload_content)
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None,
+                 _preload_content=True, _request_timeout=None):
+        """Makes the HTTP request and returns an awaitable of the result.
+
+        Takes the same parameters as ApiClient.call_api.
+
+        :return:
+            If async_req parameter is True, the request is scheduled right
+            away on the running event loop and an asyncio.Task is returned.
+            Otherwise a coroutine is returned, which must be awaited.
+        """
+        coroutine = self.__call_api(resource_path, method,
+                                    path_params, query_params, header_params,
+                                    body, post_params, files,
+                                    response_type, auth_settings,
+                                    _return_http_data_only,
+                                    collection_formats,
+                                    _preload_content, _request_timeout)
+        if async_req:
+            return asyncio.ensure_future(coroutine)
+        return coroutine
@@ -0,0 +1,424 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import asyncio
+import logging
+import re
+import ssl
+import time
+
+import certifi
+# python 2 and python 3 compatibility library
+from six.moves.urllib.parse import urlencode
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError('Swagger python asyncio client requires aiohttp.')
+
+from swagger_client import json_codec
+from swagger_client import pooling
+from swagger_client import rest
+from swagger_client.governor import is_overload
+from swagger_client.multipart import FileContent
+from swagger_client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+
+class RESTResponse(rest.RESTResponse):
+
+    def __init__(self, resp, raw_data):
+        super(RESTResponse, self).__init__(resp, raw_data)
+        self.aiohttp_response = resp
+
+
+class AsyncRESTClientObject(object):
+    """asyncio counterpart of rest.RESTClientObject backed by aiohttp.
+
+    The aiohttp session is opened lazily on the first request so that the
+    client can be built outside of a running event loop.
+
+    The connections are configured from the same `Configuration` settings
+    as rest.RESTClientObject: at most `connection_pool_maxsize` per host
+    and `connection_pool_num_pools` times as many in all, default timeouts
+    from `connect_timeout` and `read_timeout`, and TCP keep-alive from
+    `tcp_keepalive` (aiohttp 3.12 or later). aiohttp never opens extra
+    connections, so requests always wait for a free one, as with
+    `connection_pool_block`; `connection_pool_timeout` bounds that wait,
+    the opening of the connection included.
+    """
+
+    def __init__(self, configuration, pools_size=None, maxsize=None):
+        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        if pools_size is None:
+            pools_size = configuration.connection_pool_num_pools
+        self.maxsize = maxsize
+        self.pools_size = pools_size
+        self.tcp_keepalive = configuration.tcp_keepalive
+        self.default_timeout = self._default_timeout(configuration)
+        self.codec = json_codec.get_codec(configuration.json_codec)
+        self.proxy = configuration.proxy
+        self.configuration = configuration
+        self.retry_policy = configuration.retry_policy
+
+        if configuration.verify_ssl:
+            # ca_certs
+            if configuration.ssl_ca_cert:
+                ca_certs = configuration.ssl_ca_cert
+            else:
+                # if not set certificate file, use Mozilla's root certificates.
+                ca_certs = certifi.where()
+            ssl_context = ssl.create_default_context(cafile=ca_certs)
+            if configuration.assert_hostname is False:
+                ssl_context.check_hostname = False
+        else:
+            ssl_context = False
+        if configuration.cert_file:
+            if ssl_context is False:
+                ssl_context = ssl.create_default_context()
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            ssl_context.load_cert_chain(configuration.cert_file,
+                                        keyfile=configuration.key_file)
+        self.ssl_context = ssl_context
+
+        self._session = None
+
+    @staticmethod
+    def _default_timeout(configuration):
+        """Returns the aiohttp.ClientTimeout of the requests sent with no
+        `_request_timeout`, or None to keep that of aiohttp."""
+        if (configuration.connect_timeout is None and
+                configuration.read_timeout is None and
+                configuration.connection_pool_timeout is None):
+            return None
+        return aiohttp.ClientTimeout(
+            total=None, connect=configuration.connection_pool_timeout,
+            sock_connect=configuration.connect_timeout,
+            sock_read=configuration.read_timeout)
+
+    @property
+    def session(self):
+        """The aiohttp.ClientSession, created on first use."""
+        if self._session is None or self._session.closed:
+            options = {}
+            if self.tcp_keepalive is not None:
+                options['socket_factory'] = \
+                    pooling.keepalive_socket_factory(self.tcp_keepalive)
+            connector = aiohttp.TCPConnector(
+                limit=self.maxsize * self.pools_size,
+                limit_per_host=self.maxsize, ssl=self.ssl_context, **options)
+            session_options = {}
+            if self.default_timeout is not None:
+                session_options['timeout'] = self.default_timeout
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  **session_options)
+        return self._session
+
+    async def close(self):
+        """Closes the underlying aiohttp session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Perform requests, retrying them as the retry policy of the
+        configuration, if any, tells, each attempt once the governor of the
+        configuration, if any, lets it go; see `send` for the parameters.
+        """
+        def send():
+            return self.send(method, url, query_params, dict(headers or {}),
+                             body, post_params, _preload_content,
+                             _request_timeout)
+
+        # read on each request, as it may be set after the client is built
+        governor = self.configuration.governor
+        if governor is not None:
+            group = governor.group(method, url, post_params, _preload_content)
+            send_once = send
+
+            def send():
+                return self._governed(governor, group, send_once,
+                                      not _preload_content)
+
+        policy = self.retry_policy
+        if policy is None:
+            return await send()
+        policy.stats._count(requests=1)
+        attempt = 0
+        while True:
+            policy.stats._count(attempts=1)
+            try:
+                return await send()
+            except (ApiException, aiohttp.ClientError,
+                    asyncio.TimeoutError) as e:
+                delay = policy.next_delay(
+                    method, url, e, attempt,
+                    self._retry_reason(policy, method, url, e))
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _governed(self, governor, group, send, streamed):
+        """Awaits `send()` once a slot of `group` and a token are available,
+        without blocking the event loop: the limits, shared with threads,
+        are polled. A streamed response keeps its slot until its
+        connection is released or closed, see Governor.hold."""
+        limit = governor.limits[group]
+        since = time.time()
+        while not limit.try_acquire(since):
+            await asyncio.sleep(0.01)
+        start = time.time()
+        try:
+            if governor.bucket is not None:
+                wait = governor.bucket.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+                start = time.time()
+            response = await send()
+        except Exception as e:
+            overloaded = (is_overload(e) or
+                          isinstance(e, asyncio.TimeoutError))
+            limit.release(start, time.time() - start, overloaded)
+            raise
+        if streamed:
+            # aiohttp releases the connection through _release_connection,
+            # from release() and once the body is read
+            return governor.hold(response, limit, start,
+                                 ('_release_connection', 'close'))
+        limit.release(start, time.time() - start)
+        return response
+
+    def _retry_reason(self, policy, method, url, error):
+        """The aiohttp counterpart of RetryPolicy.reason."""
+        if isinstance(error, aiohttp.ClientConnectorError):
+            # the request was not sent
+            return type(error).__name__
+        if isinstance(error, (aiohttp.ClientOSError,
+                              aiohttp.ServerDisconnectedError,
+                              aiohttp.ClientPayloadError,
+                              asyncio.TimeoutError)):
+            if policy.is_idempotent(method, url):
+                return type(error).__name__
+            return None
+        return policy.reason(method, url, error)
+
+    async def send(self, method, url, query_params=None, headers=None,
+                   body=None, post_params=None, _preload_content=True,
+                   _request_timeout=None):
+        """Sends a request once.
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading the
+                                 response data. Default is True.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or []
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0],
+                    sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        if query_params:
+            url += '?' + urlencode(query_params)
+
+        args = {
+            "headers": headers,
+            "proxy": self.proxy,
+        }
+        if timeout is not None:
+            args["timeout"] = timeout
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                request_body = '{}'
+                if body is not None:
+                    request_body = self.codec.dumps(body)
+                args["data"] = request_body
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                args["data"] = urlencode(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # the boundary is generated by aiohttp, which therefore
+                # owns the Content-Type header.
+                del headers['Content-Type']
+                args["data"] = self._multipart(post_params)
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is
+            # provided in serialized form
+            elif isinstance(body, str):
+                args["data"] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            r = await self.session.request(method, url, **args)
+        except aiohttp.ClientSSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        if _preload_content:
+            data = await r.read()
+            r.release()
+            r = RESTResponse(r, data)
+
+            # log response body
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", r.data)
+
+            if not 200 <= r.status <= 299:
+                raise ApiException(http_resp=r)
+        elif not 200 <= r.status <= 299:
+            data = await r.read()
+            r.release()
+            raise ApiException(http_resp=RESTResponse(r, data))
+
+        return r
+
+    def _multipart(self, post_params):
+        """Builds a multipart/form-data body from prepared post parameters.
+
+        :param post_params: list of (name, value) tuples, where value is
+                            either a plain field or a
+                            (filename, filedata, mimetype) tuple,
+                            filedata being bytes or a FileContent.
+        """
+        writer = aiohttp.MultipartWriter('form-data')
+        for name, value in post_params:
+            if isinstance(value, tuple):
+                filename, filedata, mimetype = value
+                if isinstance(filedata, FileContent):
+                    # aiohttp reads the file by chunks, then closes it
+                    filedata = filedata.open()
+                part = writer.append(filedata, {'Content-Type': mimetype})
+                part.set_content_disposition('form-data', name=name,
+                                             filename=filename)
+            else:
+                part = writer.append(str(value))
+                part.set_content_disposition('form-data', name=name)
+        return writer
+
+    async def GET(self, url, headers=None, query_params=None,
+                  _preload_content=True, _request_timeout=None):
+        return (await self.request("GET", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   query_params=query_params))
+
+    async def HEAD(self, url, headers=None, query_params=None,
+                   _preload_content=True, _request_timeout=None):
+        return (await self.request("HEAD", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   query_params=query_params))
+
+    async def OPTIONS(self, url, headers=None, query_params=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None):
+        return (await self.request("OPTIONS", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def DELETE(self, url, headers=None, query_params=None, body=None,
+                     _preload_content=True, _request_timeout=None):
+        return (await self.request("DELETE", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def POST(self, url, headers=None, query_params=None,
+                   post_params=None, body=None, _preload_content=True,
+                   _request_timeout=None):
+        return (await self.request("POST", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def PUT(self, url, headers=None, query_params=None,
+                  post_params=None, body=None, _preload_content=True,
+                  _request_timeout=None):
+        return (await self.request("PUT", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def PATCH(self, url, headers=None, query_params=None,
+                    post_params=None, body=None, _preload_content=True,
+                    _request_timeout=None):
+        return (await self.request("PATCH", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
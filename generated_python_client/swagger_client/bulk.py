@@ -0,0 +1,448 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+
+from six.moves import queue
+import urllib3
+
+from swagger_client.pagination import is_retryable
+from swagger_client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_transient(error):
+    """Tells whether a failed upload is due to the server rather than to its
+    points, so that it may succeed when sent again later, in smaller
+    batches: payload too large (413), rate limiting (429), server errors
+    (5xx), timeouts and connection errors are. Unlike governor.is_overload,
+    it does not tell the server is overloaded.
+    """
+    if isinstance(error, ApiException) and error.status == 413:
+        return True
+    return is_retryable(error)
+
+
+def was_not_sent(error):
+    """Tells whether a failed upload provably did not reach the server, so
+    that sending it again can't write its data twice: the connection
+    could not be opened, or the server refused the request before handling
+    it (503, and 429 with a Retry-After)."""
+    if isinstance(error, ApiException):
+        if error.status == 503:
+            return True
+        return error.status == 429 and bool(_retry_after(error))
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        error = error.reason
+    return isinstance(error, (urllib3.exceptions.NewConnectionError,
+                              urllib3.exceptions.ConnectTimeoutError))
+
+
+def may_have_been_sent(error):
+    """Tells whether a failed upload may have been written all the same:
+    the response timed out, or the connection broke while it was awaited.
+    """
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        error = error.reason
+    return isinstance(error, (urllib3.exceptions.ReadTimeoutError,
+                              urllib3.exceptions.ProtocolError))
+
+
+def _retry_after(error):
+    """Returns the Retry-After delay of a failed response, in seconds, or
+    None."""
+    value = (getattr(error, 'headers', None) or {}).get('Retry-After')
+    if value and value.strip().isdigit():
+        return float(value)
+    return None
+
+
+def is_duplicate(error):
+    """Tells whether an upload was rejected because some of its data
+    already exists (`DUPLICATE_DATA_KEY`)."""
+    if not isinstance(error, ApiException) or not error.body:
+        return False
+    body = error.body
+    if isinstance(body, bytes):
+        body = body.decode('utf8', 'replace')
+    return 'DUPLICATE_DATA_KEY' in body
+
+
+class Batch(list):
+    """Points uploaded together, in write order.
+
+    :param points: the points.
+    :param start: position of the first point among all the points written
+                  to the BulkDataWriter.
+    """
+
+    def __init__(self, points, start=0):
+        super(Batch, self).__init__(points)
+        self.start = start
+
+    def split(self, size):
+        """Returns the batch cut into batches of at most `size` points."""
+        return [Batch(self[i:i + size], self.start + i)
+                for i in range(0, len(self), size)]
+
+
+class Watermark(object):
+    """Number of leading points done with, when batches complete out of
+    order.
+
+    Feed it every batch once uploaded or failed for good: `value` is the
+    number of points, counted in write order, all of whose batches are
+    done, which is where an interrupted import resumes.
+
+    :param value: number of points already done with.
+    """
+
+    def __init__(self, value=0):
+        self.value = value
+        # start -> end of the batches done beyond `value`
+        self._done = {}
+        self._lock = threading.Lock()
+
+    def add(self, batch):
+        """Records a done batch.
+
+        :param batch: Batch.
+        :return: the new value if it advanced, else None.
+        """
+        with self._lock:
+            self._done[batch.start] = batch.start + len(batch)
+            advanced = False
+            while self.value in self._done:
+                self.value = self._done.pop(self.value)
+                advanced = True
+            return self.value if advanced else None
+
+
+class AdaptiveBatchSize(object):
+    """Batch size adjusted to the latency of the uploads.
+
+    The size grows by half while uploads of full batches take less than
+    `target_latency` seconds, is scaled down to the target when they take
+    longer, and is halved when an upload is too large or could not be
+    handled by the server (see BulkDataWriter).
+
+    :param initial: initial batch size.
+    :param minimum: smallest batch size.
+    :param maximum: largest batch size.
+    :param target_latency: upload time aimed at, in seconds.
+    """
+
+    def __init__(self, initial=1000, minimum=10, maximum=50000,
+                 target_latency=2.0):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Invalid batch sizes, must satisfy "
+                             "1 <= minimum <= initial <= maximum")
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self._lock = threading.Lock()
+
+    def record(self, size, latency):
+        """Adjusts the size after a successful upload.
+
+        :param size: number of points uploaded.
+        :param latency: upload time, in seconds.
+        """
+        with self._lock:
+            if latency > self.target_latency:
+                scaled = int(size * self.target_latency / latency)
+                self.size = max(self.minimum, min(self.size, scaled))
+            elif size * 2 >= self.size:
+                # only batches close to the current size tell it is too small
+                self.size = min(self.maximum, self.size + self.size // 2 + 1)
+
+    def shrink(self, limit=None):
+        """Halves the size after an overload.
+
+        :param limit: new largest batch size, when the server told a batch
+                      is too large (413).
+        """
+        with self._lock:
+            if limit is not None:
+                self.maximum = max(self.minimum, min(self.maximum, limit))
+            self.size = max(self.minimum, min(self.size // 2, self.maximum))
+
+
+class BulkDataWriter(object):
+    """Uploads data points with `DataApi.add_list_data`, by batches sent
+    concurrently.
+
+    Points passed to `write` are grouped into batches of the current
+    AdaptiveBatchSize, which `concurrency` worker threads upload over the
+    api client's connection pool (its `connection_pool_maxsize` should be
+    at least `concurrency`). At most `queue_depth` batches wait for a
+    worker: `write` blocks beyond that, which bounds memory.
+
+    An upload is only sent again when that can't write its points twice:
+    when it provably did not reach the server (see was_not_sent), was
+    rejected as too large (413), or may have been written but timed out
+    (see may_have_been_sent), in which case a resend rejected with
+    `DUPLICATE_DATA_KEY` tells the first attempt went through and counts as
+    a success. Other failures, such as 500 or 502, are not retried. The
+    batch size is reduced, the batch split to it and its parts sent again;
+    a batch that can't be split is retried up to `retries` times with
+    exponential backoff, or as long as a Retry-After asks. Connection
+    errors retried by the RetryPolicy of the api client, if any, are not
+    retried again.
+
+    A batch failing with an error matched by `bisect_on`, such as
+    is_duplicate, is cut in halves which are uploaded again, recursively,
+    to isolate the offending points: the other points are written at the
+    cost of about d * log2(n) more requests for d offending points in a
+    batch of n, and each offending point fails alone.
+
+    A batch failing otherwise, or out of retries, and each offending point
+    are handed to `on_error(batch, error)`. Each uploaded
+    batch is handed to `on_success(batch)`. Both callbacks run on the
+    worker threads. Batches are Batch lists, whose `start` tells where they
+    stand among the points written; see Watermark.
+
+    >>> with BulkDataWriter(DataApi(client), token, concurrency=4) as writer:
+    ...     for point in data_points:
+    ...         writer.write(point)
+    >>> print(writer.points_written, writer.rate())
+
+    :param data_api: DataApi instance.
+    :param authorization: authentication token.
+    :param concurrency: number of uploads in flight.
+    :param batch_size: AdaptiveBatchSize, or initial batch size.
+    :param queue_depth: number of batches waiting for a worker, defaults to
+                        `2 * concurrency`.
+    :param retries: number of retries of a batch that can't be split.
+    :param backoff: delay in seconds before the first retry, doubled on
+                    each further retry.
+    :param request_timeout: timeout of each upload, see `_request_timeout`
+                            of the generated methods.
+    :param bisect_on: callable(error) telling whether a failed batch
+                      should be bisected.
+    :param on_success: callable(batch) called for each uploaded batch.
+    :param on_error: callable(batch, error) called for each failed batch.
+    """
+
+    def __init__(self, data_api, authorization, concurrency=4,
+                 batch_size=1000, queue_depth=None, retries=3, backoff=0.5,
+                 request_timeout=None, bisect_on=None, on_success=None,
+                 on_error=None):
+        if concurrency < 1:
+            raise ValueError("Invalid value for `concurrency`, must be a "
+                             "value greater than or equal to `1`")
+        self.data_api = data_api
+        self.authorization = authorization
+        self.concurrency = concurrency
+        if not isinstance(batch_size, AdaptiveBatchSize):
+            batch_size = AdaptiveBatchSize(
+                initial=batch_size, minimum=min(10, batch_size),
+                maximum=max(50000, batch_size))
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.request_timeout = request_timeout
+        self.bisect_on = bisect_on
+        self.on_success = on_success
+        self.on_error = on_error
+
+        self.points_queued = 0
+        self.points_written = 0
+        self.points_failed = 0
+        self.points_cancelled = 0
+        self.batches_written = 0
+        self.started = None
+        self.elapsed = None
+
+        self._buffer = []
+        self._queue = queue.Queue(maxsize=queue_depth or 2 * concurrency)
+        self._workers = []
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._cancelled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, point):
+        """Adds a data point, uploaded with the next batch."""
+        if self._closed:
+            raise ValueError("write to a closed BulkDataWriter")
+        if self._cancelled:
+            with self._stats_lock:
+                self.points_cancelled += 1
+            return
+        self._buffer.append(point)
+        if len(self._buffer) >= self.batch_size.size:
+            self.flush()
+
+    def write_all(self, points):
+        """Adds every data point of an iterable."""
+        for point in points:
+            self.write(point)
+
+    def flush(self):
+        """Queues the buffered points as a batch."""
+        if not self._buffer:
+            return
+        if not self._workers:
+            self._start()
+        batch = Batch(self._buffer, self.points_queued)
+        self._buffer = []
+        self.points_queued += len(batch)
+        self._queue.put(batch)
+
+    def close(self):
+        """Uploads the buffered points and waits for every upload."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        if self.started is not None:
+            self.elapsed = time.time() - self.started
+
+    def cancel(self):
+        """Stops uploading: the points not sent yet, and those written
+        from now on, are dropped and counted in `points_cancelled`. The
+        uploads in flight complete."""
+        self._cancelled = True
+
+    def rate(self):
+        """Returns the number of points written per second."""
+        elapsed = self.elapsed
+        if elapsed is None and self.started is not None:
+            elapsed = time.time() - self.started
+        if not elapsed:
+            return 0.0
+        return self.points_written / elapsed
+
+    def _start(self):
+        self.started = time.time()
+        for i in range(self.concurrency):
+            worker = threading.Thread(target=self._work,
+                                      name='bulk-data-writer-%d' % i)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            self._send(batch)
+
+    def _notify(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception:
+            # a failing callback must not stop the worker
+            logger.exception("bulk data writer callback failed")
+
+    def _upload(self, batch):
+        kwargs = {'body': batch}
+        if self.request_timeout is not None:
+            kwargs['_request_timeout'] = self.request_timeout
+        return self.data_api.add_list_data(self.authorization, **kwargs)
+
+    def _send(self, batch):
+        # (batch, attempt, whether an attempt may have been written) still
+        # to upload, split batches in order
+        pending = [(batch, 0, False)]
+        while pending:
+            batch, attempt, maybe_sent = pending.pop()
+            if self._cancelled:
+                with self._stats_lock:
+                    self.points_cancelled += len(batch)
+                continue
+            start = time.time()
+            try:
+                self._upload(batch)
+            except Exception as e:
+                if maybe_sent and is_duplicate(e):
+                    # written by the attempt which timed out
+                    self._written(batch)
+                    continue
+                if self.bisect_on is not None and self.bisect_on(e):
+                    if len(batch) > 1:
+                        halves = batch.split((len(batch) + 1) // 2)
+                        pending.extend((half, attempt, maybe_sent)
+                                       for half in reversed(halves))
+                    else:
+                        self._failed(batch, e)
+                    continue
+                too_large = (isinstance(e, ApiException) and
+                             e.status == 413)
+                maybe_sent = maybe_sent or may_have_been_sent(e)
+                if not (too_large or was_not_sent(e) or
+                        may_have_been_sent(e)):
+                    self._failed(batch, e)
+                    continue
+                self.batch_size.shrink(len(batch) - 1 if too_large else None)
+                size = self.batch_size.size
+                if len(batch) > size:
+                    pending.extend((part, attempt, maybe_sent) for part in
+                                   reversed(batch.split(size)))
+                elif self._cancelled:
+                    # dropped on the next turn
+                    pending.append((batch, attempt, maybe_sent))
+                elif attempt < self._retries(e):
+                    time.sleep(max(self.backoff * 2 ** attempt,
+                                   _retry_after(e) or 0))
+                    pending.append((batch, attempt + 1, maybe_sent))
+                else:
+                    self._failed(batch, e)
+                continue
+            self.batch_size.record(len(batch), time.time() - start)
+            self._written(batch)
+
+    def _retries(self, error):
+        """Returns the number of retries of a batch failing with `error`."""
+        policy = getattr(self.data_api.api_client.configuration,
+                         'retry_policy', None)
+        # the policy retries the connection errors of any request, the
+        # path, that of add_list_data, not being one of its safe paths
+        if policy is not None and \
+                policy.reason('POST', '/core/data', error) is not None:
+            return 0
+        return self.retries
+
+    def _written(self, batch):
+        with self._stats_lock:
+            self.points_written += len(batch)
+            self.batches_written += 1
+        if self.on_success is not None:
+            self._notify(self.on_success, batch)
+
+    def _failed(self, batch, error):
+        with self._stats_lock:
+            self.points_failed += len(batch)
+        if self.on_error is not None:
+            self._notify(self.on_error, batch, error)
+        else:
+            logger.error("failed to write %d data points: %s", len(batch),
+                         error)
@@ -0,0 +1,438 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from collections import Counter, OrderedDict
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+import six
+
+from swagger_client.governor import READ_ONLY_POST_PATHS
+from swagger_client.rest import RESTResponse
+
+
+# (path regex, seconds) of the read-mostly endpoints cached by default
+DEFAULT_TTLS = (
+    (r'^/ontology/', 600),
+    (r'^/core/variables/datatypes$', 3600),
+    (r'^/core/species$', 3600),
+    (r'^/core/data/mathematicalOperators$', 3600),
+    (r'^/vuejs/config$', 3600),
+)
+
+# POST endpoints which only read, cached as GETs
+DEFAULT_READ_PATHS = (r'^/ontology/uris_labels$', r'/by_uris$')
+
+# resource types whose writes also change other resource types
+DEFAULT_RELATED = {'vuejs': ('ontology',)}
+
+
+class CachedResponse(RESTResponse):
+    """RESTResponse rebuilt from a cache entry."""
+
+    def __init__(self, status, reason, headers, raw_data):
+        self.urllib3_response = None
+        self.status = status
+        self.reason = reason
+        self.headers = dict(headers)
+        self.raw_data = raw_data
+        self._data = None
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        # header names are case-insensitive
+        name = name.lower()
+        for key, value in six.iteritems(self.headers):
+            if key.lower() == name:
+                return value
+        return default
+
+
+class CacheEntry(object):
+    """Response stored in a cache backend.
+
+    :param resource: resource type of the request, see resource_type.
+    :param expires: time after which the entry is stale.
+    """
+
+    def __init__(self, resource, expires, status, reason, headers, body):
+        self.resource = resource
+        self.expires = expires
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    @property
+    def size(self):
+        return len(self.body) + sum(len(k) + len(v)
+                                    for k, v in self.headers.items()) + 100
+
+    def response(self):
+        return CachedResponse(self.status, self.reason, self.headers,
+                              self.body)
+
+
+class MemoryCache(object):
+    """In-memory cache backend, evicting the least recently used entries
+    beyond `max_bytes` bytes.
+
+    :param max_bytes: size of the entries kept, bodies and headers.
+    """
+
+    def __init__(self, max_bytes=64 << 20):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # most recently used last
+                del self._entries[key]
+                self._entries[key] = entry
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._remove(key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.bytes += entry.size
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def invalidate(self, resources):
+        """Removes the entries of the resource types; returns their count."""
+        with self._lock:
+            keys = [key for key, entry in six.iteritems(self._entries)
+                    if entry.resource in resources]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+
+class SqliteCache(object):
+    """Cache backend persisted in a sqlite database, shared by runs and by
+    processes, evicting the least recently used entries beyond `max_bytes`
+    bytes.
+
+    :param path: path of the database file.
+    :param max_bytes: size of the entries kept, bodies and headers.
+    """
+
+    def __init__(self, path, max_bytes=256 << 20):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, '
+            'resource TEXT, expires REAL, accessed REAL, size INTEGER, '
+            'status INTEGER, reason TEXT, headers TEXT, body BLOB)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS entries_accessed '
+                         'ON entries (accessed)')
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute(
+                'SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    @property
+    def bytes(self):
+        with self._lock:
+            return self._db.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute(
+                'SELECT resource, expires, status, reason, headers, body '
+                'FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE entries SET accessed = ? WHERE key = ?',
+                             (time.time(), key))
+        resource, expires, status, reason, headers, body = row
+        return CacheEntry(resource, expires, status, reason,
+                          json.loads(headers), bytes(body))
+
+    def set(self, key, entry):
+        if entry.size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO entries VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, entry.resource, entry.expires, time.time(), entry.size,
+                 entry.status, entry.reason, json.dumps(entry.headers),
+                 sqlite3.Binary(entry.body)))
+            total = self._db.execute(
+                'SELECT SUM(size) FROM entries').fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(total - self.max_bytes)
+
+    def delete(self, key):
+        with self._lock:
+            self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def invalidate(self, resources):
+        resources = list(resources)
+        with self._lock:
+            return self._db.execute(
+                'DELETE FROM entries WHERE resource IN (%s)' %
+                ','.join('?' * len(resources)), resources).rowcount
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM entries')
+
+    def close(self):
+        self._db.close()
+
+    def _evict(self, excess):
+        freed = 0
+        for key, size in self._db.execute(
+                'SELECT key, size FROM entries ORDER BY accessed').fetchall():
+            self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+            self.evictions += 1
+            freed += size
+            if freed >= excess:
+                return
+
+
+def resource_type(resource_path):
+    """Returns the resource type of an endpoint path: its first segment,
+    after `core` for the core API, e.g. `variables` for
+    `/core/variables/{uri}` and `ontology` for `/ontology/subclasses_of`."""
+    parts = [p for p in resource_path.split('/') if p]
+    if parts and parts[0] == 'core' and len(parts) > 1:
+        return parts[1]
+    return parts[0] if parts else ''
+
+
+class ResponseCache(object):
+    """Cache of the responses of read-mostly endpoints, for ApiClient.
+
+    The successful responses of GETs, and of POSTs of `read_paths`, whose
+    endpoint path matches a regex of `ttls`, are kept for the number of
+    seconds given with the first regex matching, in `backend`, a
+    MemoryCache by default or a SqliteCache; a None TTL is not cached.
+    Entries are keyed by URL, query, headers, token included, and body, and
+    deserialized anew on every hit, so that callers never share objects.
+
+    Any other request, as those of the `create_*`, `update_*` and
+    `delete_*` methods, invalidates the entries of its resource type, see
+    resource_type, and of the types `related` lists for it; but for the
+    POSTs of `read_only_paths`, such as searches and counts, which neither
+    are cached nor change anything. ApiClient and AsyncApiClient sharing a
+    cache see the writes of one another. A read whose resource type is
+    invalidated while it is in flight is not cached, its response being
+    possibly stale (see generation).
+
+    >>> configuration.response_cache = ResponseCache(
+    ...     SqliteCache('opensilex-cache.db'),
+    ...     ttls=[(r'^/core/experiments/\\{uri\\}$', 60)] + list(DEFAULT_TTLS))
+    >>> ...
+    >>> print(configuration.response_cache.as_dict())
+
+    :param backend: MemoryCache, SqliteCache, or any object with the same
+                    `get`, `set`, `delete`, `invalidate` and `clear`.
+    :param ttls: (endpoint path regex, seconds) pairs.
+    :param read_paths: regexes of the paths of POST endpoints which only
+                       read, cached as GETs.
+    :param read_only_paths: regexes of the paths of other POST endpoints
+                            which only read, not cached.
+    :param related: dict of resource type to the resource types its writes
+                    also invalidate.
+    """
+
+    def __init__(self, backend=None, ttls=DEFAULT_TTLS,
+                 read_paths=DEFAULT_READ_PATHS,
+                 read_only_paths=READ_ONLY_POST_PATHS, related=None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.read_paths = [re.compile(p) for p in read_paths]
+        self.read_only_paths = [re.compile(p) for p in read_only_paths]
+        self.related = dict(DEFAULT_RELATED if related is None else related)
+        self._lock = threading.Lock()
+        # resource type -> number of invalidations, see generation
+        self._generations = Counter()
+        # serializes the stores with the invalidations
+        self._store_lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+        self.invalidations = 0
+
+    def ttl(self, resource_path):
+        """Returns the TTL of an endpoint path, or None if not cached."""
+        for pattern, ttl in self.ttls:
+            if pattern.search(resource_path):
+                return ttl
+        return None
+
+    def is_read(self, method, resource_path):
+        """Tells whether a request is a read, whose response is cached."""
+        if method == 'GET':
+            return True
+        return method == 'POST' and any(
+            p.search(resource_path) for p in self.read_paths)
+
+    def is_write(self, method, resource_path):
+        """Tells whether a request may change resources, invalidating
+        their entries."""
+        if method in ('GET', 'HEAD', 'OPTIONS'):
+            return False
+        return not (method == 'POST' and any(
+            p.search(resource_path)
+            for p in self.read_paths + self.read_only_paths))
+
+    def key(self, method, url, query_params, headers, body):
+        data = json.dumps([method, url, [[k, str(v)] for k, v in
+                                         query_params or ()],
+                           sorted((headers or {}).items()), body],
+                          sort_keys=True, default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def fetch(self, resource_path, send, method, url, query_params=None,
+              headers=None, body=None):
+        """Returns the cached response of a read, or the response of
+        `send()`, cached when successful.
+
+        :param resource_path: endpoint path, as `/core/variables/{uri}`.
+        :param send: callable sending the request.
+        :return: RESTResponse.
+        """
+        key, response = self.lookup(resource_path, method, url,
+                                    query_params, headers, body)
+        if response is None:
+            generation = self.generation(resource_path)
+            response = send()
+            self.store(resource_path, key, response, generation)
+        return response
+
+    def lookup(self, resource_path, method, url, query_params=None,
+               headers=None, body=None):
+        """Looks a read up, for the callers which send it themselves, as
+        AsyncApiClient.
+
+        :return: tuple (key, response), the key being None when the
+                 endpoint is not cached and the response None on a miss.
+        """
+        ttl = self.ttl(resource_path)
+        if ttl is None:
+            return None, None
+        resource = resource_type(resource_path)
+        key = self.key(method, url, query_params, headers, body)
+        entry = self.backend.get(key)
+        if entry is not None and entry.expires > time.time():
+            self._count(self.hits, resource)
+            return key, entry.response()
+        if entry is not None:
+            self.backend.delete(key)
+        self._count(self.misses, resource)
+        return key, None
+
+    def generation(self, resource_path):
+        """Returns the number of invalidations of the resource type of an
+        endpoint path, taken before a read is sent and handed to store."""
+        return self._generations[resource_type(resource_path)]
+
+    def store(self, resource_path, key, response, generation=None):
+        """Caches the response of a read missed by lookup, if successful.
+
+        :param generation: generation of the resource type taken before the
+                           read was sent: the response is not cached when
+                           the type was invalidated since.
+        """
+        if key is None or response.status != 200:
+            return
+        entry = CacheEntry(
+            resource_type(resource_path),
+            time.time() + self.ttl(resource_path), response.status,
+            response.reason, dict(response.getheaders()), response.raw_data)
+        with self._store_lock:
+            if generation is not None and \
+                    generation != self._generations[entry.resource]:
+                return
+            self.backend.set(key, entry)
+
+    def invalidate(self, resource_path):
+        """Drops the entries a write to an endpoint path makes stale."""
+        resource = resource_type(resource_path)
+        resources = set([resource]) | set(self.related.get(resource, ()))
+        with self._store_lock:
+            for resource in resources:
+                self._generations[resource] += 1
+            removed = self.backend.invalidate(resources)
+        with self._lock:
+            self.invalidations += removed
+
+    def clear(self):
+        self.backend.clear()
+
+    def as_dict(self):
+        """Returns the hits and misses, in total and by resource type."""
+        with self._lock:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+            return {
+                'hits': hits,
+                'misses': misses,
+                'hit_ratio': float(hits) / (hits + misses)
+                if hits + misses else 0.0,
+                'by_resource': dict(
+                    (r, {'hits': self.hits[r], 'misses': self.misses[r]})
+                    for r in set(self.hits) | set(self.misses)),
+                'invalidations': self.invalidations,
+                'evictions': self.backend.evictions,
+                'entries': len(self.backend),
+                'bytes': self.backend.bytes,
+            }
+
+    def _count(self, counter, resource):
+        with self._lock:
+            counter[resource] += 1
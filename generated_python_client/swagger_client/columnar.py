@@ -0,0 +1,242 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('swagger_client.columnar requires numpy.')
+
+try:
+    from dateutil.parser import isoparse
+except ImportError:
+    isoparse = None
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+# int64 value numpy reads as NaT
+_NAT = np.iinfo(np.int64).min
+
+
+class DictionaryColumn(object):
+    """Dictionary-encoded string column.
+
+    :param codes: int32 array of indexes into `categories`, -1 for missing.
+    :param categories: list of the distinct values, in order of appearance.
+    """
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        code = self.codes[index]
+        return None if code < 0 else self.categories[code]
+
+    def to_pandas(self):
+        """Returns a pandas.Categorical sharing the codes buffer."""
+        import pandas
+        return pandas.Categorical.from_codes(self.codes, self.categories)
+
+    def to_arrow(self):
+        """Returns a pyarrow.DictionaryArray over the codes."""
+        import pyarrow
+        indices = pyarrow.array(self.codes, mask=self.codes < 0)
+        return pyarrow.DictionaryArray.from_arrays(
+            indices, pyarrow.array(self.categories, type=pyarrow.string()))
+
+
+class DataColumns(object):
+    """Columnar form of a data search result.
+
+    One entry per observation, in response order:
+
+    - `value`: float64, NaN when the value is missing or not numeric
+    - `date`: datetime64[ms], in UTC (dates without offset are read as UTC)
+    - `target`, `variable`, `provenance`: DictionaryColumn of URIs
+    - `confidence`: float64, NaN when missing
+
+    `metadata` holds the response envelope metadata, if any.
+    """
+
+    names = ('date', 'target', 'variable', 'value', 'confidence',
+             'provenance')
+
+    def __init__(self, value, date, target, variable, provenance, confidence,
+                 metadata=None):
+        self.value = value
+        self.date = date
+        self.target = target
+        self.variable = variable
+        self.provenance = provenance
+        self.confidence = confidence
+        self.metadata = metadata
+
+    def __len__(self):
+        return len(self.value)
+
+    def to_pandas(self):
+        """Returns a pandas.DataFrame; numeric columns are not copied."""
+        import pandas
+        columns = {}
+        for name in self.names:
+            column = getattr(self, name)
+            if isinstance(column, DictionaryColumn):
+                column = column.to_pandas()
+            columns[name] = column
+        return pandas.DataFrame(columns, copy=False)
+
+    def to_arrow(self):
+        """Returns a pyarrow.Table, target/variable/provenance as
+        dictionary arrays."""
+        import pyarrow
+        arrays = []
+        for name in self.names:
+            column = getattr(self, name)
+            if isinstance(column, DictionaryColumn):
+                arrays.append(column.to_arrow())
+            else:
+                arrays.append(pyarrow.array(column))
+        return pyarrow.Table.from_arrays(arrays, names=list(self.names))
+
+
+class _DictionaryEncoder(object):
+
+    def __init__(self, size):
+        self.codes = np.empty(size, dtype=np.int32)
+        self.index = {}
+        self.categories = []
+
+    def encode(self, position, value):
+        if value is None:
+            code = -1
+        else:
+            code = self.index.get(value)
+            if code is None:
+                code = self.index[value] = len(self.categories)
+                self.categories.append(value)
+        self.codes[position] = code
+
+    def column(self):
+        return DictionaryColumn(self.codes, self.categories)
+
+
+def _to_float(value):
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _epoch_ms(string):
+    try:
+        dt = datetime.datetime.fromisoformat(string)
+    except ValueError:
+        # before python 3.11 fromisoformat rejects `Z` and `+0100` offsets
+        if isoparse is None:
+            raise
+        dt = isoparse(string)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return (dt - _EPOCH) // _MILLISECOND
+
+
+def decode_data_columns(data):
+    """Decodes parsed data search JSON into DataColumns.
+
+    No model object is built: every row is read once and scattered into
+    preallocated column buffers.
+
+    :param data: list of data rows, or a response envelope holding them
+                 in `result`.
+    :return: DataColumns.
+    """
+    metadata = None
+    if isinstance(data, dict):
+        metadata = data.get('metadata')
+        data = data.get('result')
+    data = data or []
+    size = len(data)
+
+    value = np.empty(size, dtype=np.float64)
+    date = np.empty(size, dtype=np.int64)
+    confidence = np.empty(size, dtype=np.float64)
+    target = _DictionaryEncoder(size)
+    variable = _DictionaryEncoder(size)
+    provenance = _DictionaryEncoder(size)
+    # observations of several variables commonly share a date
+    dates = {}
+
+    for i, row in enumerate(data):
+        value[i] = _to_float(row.get('value'))
+        confidence[i] = _to_float(row.get('confidence'))
+
+        row_date = row.get('date')
+        if row_date is None:
+            date[i] = _NAT
+        else:
+            ms = dates.get(row_date)
+            if ms is None:
+                ms = dates[row_date] = _epoch_ms(row_date)
+            date[i] = ms
+
+        target.encode(i, row.get('target'))
+        variable.encode(i, row.get('variable'))
+        row_provenance = row.get('provenance')
+        if isinstance(row_provenance, dict):
+            row_provenance = row_provenance.get('uri')
+        provenance.encode(i, row_provenance)
+
+    return DataColumns(value=value,
+                       date=date.view('datetime64[ms]'),
+                       target=target.column(),
+                       variable=variable.column(),
+                       provenance=provenance.column(),
+                       confidence=confidence,
+                       metadata=metadata)
+
+
+def fetch_data_columns(api_method, *args, **kwargs):
+    """Calls a data search method and returns its result as DataColumns.
+
+    Works with any generated method returning data rows, such as
+    `DataApi.search_data_list`, `DataApi.search_data_list_by_targets` or
+    `ExperimentsApi.search_experiment_data_list`. The response body is
+    parsed by the client's JSON codec and decoded straight into columns.
+
+    >>> columns = fetch_data_columns(DataApi(client).search_data_list,
+    ...                              token, variables=[variable_uri])
+    >>> frame = columns.to_pandas()
+
+    :param api_method: bound method of a generated API instance.
+    :param args: positional arguments of the method.
+    :param kwargs: keyword arguments of the method.
+    :return: DataColumns.
+    """
+    api_client = api_method.__self__.api_client
+    kwargs['_preload_content'] = False
+    response = api_method(*args, **kwargs)
+    try:
+        data = api_client.codec.loads(response.data)
+    finally:
+        response.release_conn()
+    return decode_data_columns(data)
@@ -23,6 +23,33 @@ import six
 from six.moves import http_client as httplib
 
 
+class ValidationContext(object):
+    """Immutable stand-in for Configuration inside model instances.
+
+    Generated models only read `client_side_validation` from their
+    `_configuration`. One ValidationContext can therefore be shared by every
+    model built while deserializing a response, instead of constructing (or
+    copying the default) Configuration once per instance.
+
+    :param client_side_validation: whether model setters validate values.
+    """
+
+    __slots__ = ('client_side_validation',)
+
+    def __init__(self, client_side_validation=True):
+        object.__setattr__(self, 'client_side_validation',
+                           client_side_validation)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ValidationContext is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ValidationContext is immutable")
+
+    def __reduce__(self):
+        return (ValidationContext, (self.client_side_validation,))
+
+
 class Configuration(object):
     """NOTE: This class is auto generated by the swagger code generator program.
 
@@ -90,6 +117,35 @@ class Configuration(object):
         # requests to the same host, which is often the case here.
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        # Number of connection pools kept, one per host.
+        self.connection_pool_num_pools = 4
+        # Set this to True to make requests wait for a free connection when
+        # `connection_pool_maxsize` are in use, instead of opening extra
+        # connections which are closed afterwards, for up to
+        # `connection_pool_timeout` seconds (None waits forever).
+        self.connection_pool_block = False
+        self.connection_pool_timeout = None
+        # Default connect and read timeouts in seconds of the requests sent
+        # without `_request_timeout`; None waits forever.
+        self.connect_timeout = None
+        self.read_timeout = None
+        # Seconds of inactivity after which TCP keep-alive probes are sent
+        # on pooled connections, so that idle connections dropped by
+        # firewalls are noticed; None leaves the system default (off).
+        self.tcp_keepalive = None
+        # Set this to a retry.RetryPolicy to retry the requests failing with
+        # 429, 502, 503, 504, a connection error or a read timeout.
+        self.retry_policy = None
+        # Set this to a governor.Governor, shared by every api client of
+        # this configuration, to cap concurrent requests and their rate.
+        self.governor = None
+        # Set this to True to send identical GET requests made at the same
+        # time, as by parallel workers, only once.
+        self.coalesce_requests = False
+        # Set this to a cache.ResponseCache, shared by every api client of
+        # this configuration, to cache the responses of read-mostly
+        # endpoints.
+        self.response_cache = None
 
         # Proxy URL
         self.proxy = None
@@ -98,6 +154,15 @@ class Configuration(object):
 
         # Disable client side validation
         self.client_side_validation = True
+        # Build models from server responses without running the validating
+        # property setters. Request bodies built client side are unaffected.
+        self.trusted_deserialization = False
+
+        # JSON codec used for request and response bodies: the standard
+        # library json module by default; 'auto' picks the fastest installed
+        # backend (orjson, then ujson, then json), or set 'orjson', 'ujson'
+        # or a json_codec.JSONCodec instance.
+        self.json_codec = 'json'
 
     @classmethod
     def set_default(cls, default):
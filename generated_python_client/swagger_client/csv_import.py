@@ -0,0 +1,388 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from collections import deque
+import io
+from multiprocessing.pool import ThreadPool
+import os
+import re
+
+import six
+
+from swagger_client.data_csv import HEADER_ROWS
+from swagger_client.envelope import ResponseEnvelope
+from swagger_client.pagination import call_with_retries
+from swagger_client.retry import own_retries
+
+
+# report fields which, when not empty, make a file invalid along with the
+# `*_errors` ones
+_HEADER_ERRORS = ('missing_headers', 'empty_headers', 'invalid_header_uris')
+
+
+class CsvChunk(object):
+    """Part of a data CSV file, header rows included.
+
+    :param index: position of the chunk in the file, from 0.
+    :param first_row: number of data rows of the file before the chunk.
+    :param rows: number of data rows of the chunk.
+    :param content: bytes of the chunk, None once sent.
+    :param offset: position in bytes of the first data row of the chunk in
+                   the file, from which read_chunk reads the chunk again.
+    """
+
+    def __init__(self, index, first_row, rows, content, offset=None):
+        self.index = index
+        self.first_row = first_row
+        self.rows = rows
+        self.content = content
+        self.offset = offset
+
+
+def split_csv(file_path, chunk_rows=50000, chunk_bytes=16 << 20):
+    """Yields the CsvChunk of a data CSV file, lazily.
+
+    Each chunk starts with the header rows of the file, followed by at most
+    `chunk_rows` data rows and about `chunk_bytes` bytes. Rows are never
+    cut, including quoted cells spanning several lines.
+    """
+    with io.open(file_path, 'rb') as f:
+        header = b''.join(_records(f, HEADER_ROWS))
+        if not header.endswith(b'\n'):
+            header += b'\n'
+        index = first_row = 0
+        while True:
+            offset = f.tell()
+            size = len(header)
+            rows = []
+            for record in _records(f, chunk_rows):
+                if record.strip():
+                    rows.append(record)
+                    size += len(record)
+                if size >= chunk_bytes:
+                    break
+            if not rows:
+                return
+            yield CsvChunk(index, first_row, len(rows),
+                           header + b''.join(rows), offset)
+            index += 1
+            first_row += len(rows)
+
+
+def read_chunk(file_path, chunk):
+    """Reads the content of a chunk of split_csv again, from its offset.
+
+    :return: bytes of the chunk, header rows included.
+    """
+    with io.open(file_path, 'rb') as f:
+        header = b''.join(_records(f, HEADER_ROWS))
+        if not header.endswith(b'\n'):
+            header += b'\n'
+        f.seek(chunk.offset)
+        rows = []
+        while len(rows) < chunk.rows:
+            records = list(_records(f, chunk.rows - len(rows)))
+            if not records:
+                break
+            rows.extend(record for record in records if record.strip())
+    return header + b''.join(rows)
+
+
+def _records(f, count):
+    """Reads up to `count` CSV records, keeping quoted newlines inside."""
+    for _ in range(count):
+        record = f.readline()
+        if not record:
+            return
+        # an odd number of quotes leaves a quoted cell open
+        while record.count(b'"') % 2:
+            line = f.readline()
+            if not line:
+                break
+            record += line
+        yield record
+
+
+def _shift_key(key, offset):
+    return str(int(key) + offset) if re.match(r'^\d+$', key) else key
+
+
+def _shift(value, offset):
+    """Returns the cells of a chunk report with row indexes of the file."""
+    if isinstance(value, dict):
+        return dict((_shift_key(key, offset), _shift(cells, offset))
+                    for key, cells in six.iteritems(value))
+    if isinstance(value, list):
+        for cell in value:
+            if getattr(cell, 'row_index', None) is not None:
+                cell.row_index += offset
+        return value
+    return value
+
+
+def merge_reports(merged, report, offset=0):
+    """Merges a chunk validation report into the report of the file.
+
+    Row indexes of `report`, both in the cells and in the keys of the
+    error dicts, are shifted by `offset`, the number of data rows before
+    the chunk. Counts are summed, errors concatenated, `valid_csv` and the
+    steps are true if true for every chunk, `too_large_dataset` if true
+    for any chunk; headers are those of the first chunk.
+
+    :param merged: DataCSVValidationDTO, CSVValidationModel or
+                   DataCSVValidationModel to merge into, or None.
+    :param report: report of the same type.
+    :return: the merged report.
+    """
+    if report is None:
+        return merged
+    if merged is None:
+        merged = type(report)(_configuration=report._configuration)
+    for attr, kind in six.iteritems(report.swagger_types):
+        theirs = getattr(report, attr)
+        if theirs is None:
+            continue
+        mine = getattr(merged, attr)
+        if kind.startswith('dict(str, list['):
+            theirs = _shift(theirs, offset)
+            mine = mine or {}
+            for key, cells in six.iteritems(theirs):
+                mine.setdefault(key, []).extend(cells)
+            setattr(merged, attr, mine)
+        elif kind.startswith('dict('):
+            setattr(merged, attr, dict(mine or {}, **theirs))
+        elif kind == 'int':
+            if attr == 'size_max':
+                setattr(merged, attr, max(mine or 0, theirs))
+            else:
+                setattr(merged, attr, (mine or 0) + theirs)
+        elif kind == 'bool':
+            if attr == 'too_large_dataset':
+                setattr(merged, attr, bool(mine) or theirs)
+            else:
+                setattr(merged, attr, theirs if mine is None
+                        else mine and theirs)
+        elif kind == 'list[AnnotationModel]':
+            setattr(merged, attr, (mine or []) + theirs)
+        elif kind.startswith('list[') or kind == 'CsvHeader':
+            if mine is None:
+                setattr(merged, attr, theirs)
+        elif attr == 'error_message':
+            if mine is None:
+                setattr(merged, attr, theirs)
+            elif theirs not in mine.split('; '):
+                setattr(merged, attr, mine + '; ' + theirs)
+        elif kind == 'str':
+            # validation tokens are per chunk, see ChunkedImport.tokens
+            setattr(merged, attr, theirs if offset == 0 else None)
+        else:
+            setattr(merged, attr, merge_reports(mine, theirs, offset))
+    return merged
+
+
+class ChunkedImport(object):
+    """Outcome of a ChunkedCsvImporter run.
+
+    `report` is the merged DataCSVValidationDTO of the chunks, with row
+    indexes of the whole file; `failed` lists the (CsvChunk, error) of the
+    chunks whose request failed, without their content, see
+    ChunkedCsvImporter.retry_failed; `tokens` the validation token of each
+    chunk.
+    """
+
+    def __init__(self):
+        self.report = None
+        self.chunks = 0
+        self.rows = 0
+        self.failed = []
+        self.tokens = []
+
+    @property
+    def valid(self):
+        """Whether every chunk went through and was valid."""
+        if self.failed:
+            return False
+        if self.report is None:
+            return True
+        for errors in (self.report.data_errors, self.report.errors):
+            if errors is None:
+                continue
+            if getattr(errors, 'valid_csv', None) is False:
+                return False
+            for attr in errors.swagger_types:
+                if not getattr(errors, attr):
+                    continue
+                if attr.endswith('errors') or attr in _HEADER_ERRORS:
+                    return False
+        return True
+
+    @property
+    def rows_imported(self):
+        return getattr(self.report, 'nb_lines_imported', None) or 0
+
+
+class ChunkedCsvImporter(object):
+    """Imports large data CSV files with the server's CSV endpoints,
+    `DataApi.import_csv_data` and `DataApi.validate_csv`, chunk by chunk.
+
+    The file is split on the fly into chunks of at most `chunk_rows` rows
+    and about `chunk_bytes` bytes, each starting with the header rows (see
+    split_csv), which keeps every request under the server's size and time
+    limits. `concurrency` chunks are sent at once; the file is read ahead
+    by `concurrency` chunks at most, which bounds memory. The reports of the
+    chunks are merged into one, with row indexes of the whole file (see
+    merge_reports).
+
+    `import_file` validates every chunk first and only imports when the
+    whole file is valid, so that an error halfway through does not leave
+    half the file imported. Validation requests failing with a connection
+    error, 429 or 5xx are retried with exponential backoff; imports are
+    not, and their failed chunks are reported instead.
+
+    >>> importer = ChunkedCsvImporter(DataApi(client), token, provenance_uri,
+    ...                               experiment=experiment_uri)
+    >>> result = importer.import_file('data.csv')
+    >>> print(result.valid, result.rows_imported)
+
+    :param data_api: DataApi instance.
+    :param authorization: authentication token.
+    :param provenance: provenance URI of the data.
+    :param experiment: experiment URI of the data.
+    :param chunk_rows: largest number of data rows per chunk.
+    :param chunk_bytes: size of a chunk beyond which no row is added.
+    :param concurrency: number of chunks sent at once.
+    :param retries: number of retries of a validation request, when the
+                    api client has no RetryPolicy.
+    :param backoff: delay in seconds before the first retry, doubled on
+                    each further retry.
+    :param request_timeout: timeout of each request, see `_request_timeout`
+                            of the generated methods.
+    """
+
+    def __init__(self, data_api, authorization, provenance, experiment=None,
+                 chunk_rows=50000, chunk_bytes=16 << 20, concurrency=2,
+                 retries=3, backoff=0.5, request_timeout=None):
+        if concurrency < 1:
+            raise ValueError("Invalid value for `concurrency`, must be a "
+                             "value greater than or equal to `1`")
+        self.data_api = data_api
+        self.authorization = authorization
+        self.provenance = provenance
+        self.experiment = experiment
+        self.chunk_rows = chunk_rows
+        self.chunk_bytes = chunk_bytes
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.request_timeout = request_timeout
+
+    def validate_file(self, file_path):
+        """Validates every chunk of a file with `validate_csv`.
+
+        :return: ChunkedImport.
+        """
+        return self._run(file_path, self.validate_chunk)
+
+    def import_file(self, file_path, validate=True):
+        """Imports every chunk of a file with `import_csv_data`.
+
+        :param validate: whether to validate the whole file first, and
+                         import nothing if it is not valid.
+        :return: ChunkedImport, of the validation if it failed.
+        """
+        if validate:
+            result = self.validate_file(file_path)
+            if not result.valid:
+                return result
+        return self._run(file_path, self.import_chunk)
+
+    def retry_failed(self, file_path, result, validate=False):
+        """Sends the failed chunks of a run again, reading them from the
+        file by their row range.
+
+        :param result: ChunkedImport of `validate_file` or `import_file`.
+        :param validate: whether `result` is that of a validation, whose
+                         chunks are then validated again rather than
+                         imported.
+        :return: ChunkedImport of the failed chunks only.
+        """
+        chunks = [chunk for chunk, _ in result.failed]
+        for chunk in chunks:
+            chunk.content = read_chunk(file_path, chunk)
+        send = self.validate_chunk if validate else self.import_chunk
+        return self._run(file_path, send, chunks)
+
+    def validate_chunk(self, chunk, file_name):
+        return call_with_retries(
+            self.data_api.validate_csv,
+            (self.provenance, self._file(chunk, file_name),
+             self.authorization), self._kwargs(),
+            retries=own_retries(self.data_api.api_client, self.retries),
+            backoff=self.backoff)
+
+    def import_chunk(self, chunk, file_name):
+        return self.data_api.import_csv_data(
+            self.provenance, self._file(chunk, file_name),
+            self.authorization, **self._kwargs())
+
+    def _file(self, chunk, file_name):
+        name, extension = os.path.splitext(file_name)
+        return ('%s.part%04d%s' % (name, chunk.index, extension or '.csv'),
+                chunk.content, 'text/csv')
+
+    def _kwargs(self):
+        kwargs = {}
+        if self.experiment is not None:
+            kwargs['experiment'] = self.experiment
+        if self.request_timeout is not None:
+            kwargs['_request_timeout'] = self.request_timeout
+        return kwargs
+
+    def _run(self, file_path, send, chunks=None):
+        result = ChunkedImport()
+        file_name = os.path.basename(file_path)
+        if chunks is None:
+            chunks = split_csv(file_path, self.chunk_rows, self.chunk_bytes)
+        pool = ThreadPool(self.concurrency)
+        try:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, pool.apply_async(
+                    send, (chunk, file_name))))
+                if len(pending) >= self.concurrency:
+                    self._collect(result, *pending.popleft())
+            while pending:
+                self._collect(result, *pending.popleft())
+        finally:
+            pool.close()
+            pool.join()
+        return result
+
+    def _collect(self, result, chunk, thread):
+        result.chunks += 1
+        result.rows += chunk.rows
+        try:
+            report = thread.get()
+        except Exception as e:
+            result.failed.append((chunk, e))
+            return
+        finally:
+            # drop the content of the chunk as soon as it is sent, failed
+            # chunks are read again from their offset by retry_failed
+            chunk.content = None
+        if isinstance(report, ResponseEnvelope):
+            report = report.result
+        result.tokens.append(getattr(report, 'validation_token', None))
+        result.report = merge_reports(result.report, report, chunk.first_row)
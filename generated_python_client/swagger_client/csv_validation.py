@@ -0,0 +1,281 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import collections
+import csv
+import io
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    raise ImportError('swagger_client.csv_validation requires numpy and '
+                      'pandas.')
+
+from swagger_client.data_csv import (HEADER_ROWS, MISSING_VALUES, CsvLayout,
+                                     datatype_kind, detect_delimiter)
+
+
+# cells read beyond the header width, to report rows that are too long
+# instead of failing on them
+_EXTRA_COLUMNS = 8
+
+_DATE = r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])'
+_TIME = r'(?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d{1,9})?)?'
+_OFFSET = r'(?:Z|[+-](?:0\d|1[0-4]):?[0-5]\d)'
+DATE_PATTERN = r'%s(?:T%s%s?)?' % (_DATE, _TIME, _OFFSET)
+DATE_WITH_OFFSET_PATTERN = r'%s(?:T%s%s)?' % (_DATE, _TIME, _OFFSET)
+_NUMBER = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+_COMMA_DECIMAL = r'[+-]?\d*,\d+'
+_RAW_DATA = r'\[?\s*(?:%s(?:[\s,;|]+%s)*)?\s*\]?' % (_NUMBER, _NUMBER)
+_INTEGER = r'[+-]?\d+'
+_BOOLEANS = ('true', 'false', 'TRUE', 'FALSE', 'True', 'False', '1', '0')
+
+CsvError = collections.namedtuple('CsvError',
+                                  ['row', 'column', 'value', 'message'])
+
+
+class ValidationReport(object):
+    """Errors found in a data CSV file.
+
+    `errors` holds the first `max_errors` CsvError, with the line number
+    of their row in the file (the header rows being 1 to 3), the column
+    name, the cell value and a message; `counts` holds the number of
+    errors of each message, over the whole file.
+    """
+
+    def __init__(self, max_errors=10000):
+        self.max_errors = max_errors
+        self.rows = 0
+        self.errors = []
+        self.counts = collections.Counter()
+
+    @property
+    def valid(self):
+        return not self.counts
+
+    @property
+    def error_count(self):
+        return sum(self.counts.values())
+
+    def add(self, row, column, value, message):
+        self.counts[message] += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(CsvError(row, column, value, message))
+
+    def add_all(self, rows, column, values, message):
+        """Adds the errors of a column at the given rows, vectorized."""
+        if not len(rows):
+            return
+        self.counts[message] += len(rows)
+        room = self.max_errors - len(self.errors)
+        if room > 0:
+            self.errors.extend(CsvError(int(row), column, value, message)
+                               for row, value in zip(rows[:room],
+                                                     values[:room]))
+
+    def summary(self):
+        if self.valid:
+            return '%d rows, no error' % self.rows
+        return '%d rows, %d errors: %s' % (
+            self.rows, self.error_count,
+            ', '.join('%d %s' % (count, message)
+                      for message, count in self.counts.most_common()))
+
+    def write_csv(self, path):
+        """Writes the errors, sorted by row, to a CSV file."""
+        with io.open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(CsvError._fields)
+            writer.writerows(sorted(self.errors, key=lambda e: e.row or 0))
+
+
+class DataCsvValidator(object):
+    """Checks a data CSV file against the OpenSILEX format before upload.
+
+    The file is read by chunks of `chunk_size` rows into pandas string
+    columns, and each rule is checked on whole columns at once:
+
+    - the header has a date column and variable columns,
+    - every row has a date, and a target or a device unless
+      `require_target` is False,
+    - dates are ISO 8601, `YYYY-MM-DD` or `YYYY-MM-DDTHH:mm[:ss[.SSS]]`
+      with an optional offset (`Z`, `+01:00`, `+0100`), required when
+      `require_offset` is set, and are actual calendar dates,
+    - values match the datatype of their variable given in `datatypes`:
+      decimals use `.` as decimal separator, `NA`, `null` and `NaN` are
+      accepted for decimals only, integers, booleans and dates are checked
+      likewise; variables of unknown datatype are not checked,
+    - raw_data cells are lists of numbers,
+    - rows have no more cells than the header.
+
+    Blank cells are ignored, as the server does.
+
+    >>> validator = DataCsvValidator(datatypes={'Plant height': XSD_DECIMAL})
+    >>> report = validator.validate('data.csv')
+    >>> print(report.summary())
+    >>> report.write_csv('data.errors.csv')
+
+    :param datatypes: dict of variable reference, as written in the header,
+                      to the datatype URI of the variable.
+    :param require_target: whether rows without target need a device.
+    :param require_offset: whether dates with a time need an offset.
+    :param chunk_size: number of rows checked at once.
+    :param max_errors: number of errors kept in the report.
+    """
+
+    def __init__(self, datatypes=None, require_target=True,
+                 require_offset=False, chunk_size=200000, max_errors=10000):
+        self.datatypes = datatypes or {}
+        self.require_target = require_target
+        self.require_offset = require_offset
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+    def validate(self, file_path, delimiter=None):
+        """Returns the ValidationReport of a file."""
+        report = ValidationReport(self.max_errors)
+        delimiter = delimiter or detect_delimiter(file_path)
+        try:
+            layout = CsvLayout.read(file_path, delimiter)
+        except ValueError as e:
+            report.add(1, None, None, str(e))
+            return report
+        if (self.require_target and layout.target is None and
+                not layout.devices):
+            report.add(1, None, None, 'missing target or device column')
+
+        width = layout.width + _EXTRA_COLUMNS
+        try:
+            chunks = pd.read_csv(
+                file_path, sep=delimiter, header=None, skiprows=HEADER_ROWS,
+                names=range(width), dtype=str, keep_default_na=False,
+                na_filter=False, skip_blank_lines=False,
+                chunksize=self.chunk_size, encoding='utf-8')
+            first_row = HEADER_ROWS + 1
+            for chunk in chunks:
+                rows = np.arange(first_row, first_row + len(chunk))
+                report.rows += self.validate_chunk(layout, chunk, rows, report)
+                first_row += len(chunk)
+        except (pd.errors.ParserError, UnicodeDecodeError) as e:
+            report.add(None, None, None, 'unreadable file: %s' % e)
+        return report
+
+    def validate_chunk(self, layout, chunk, rows, report):
+        """Checks the rows of a DataFrame of string cells, numbered by
+        `rows`, and returns the number of non-blank rows."""
+        # cells missing at the end of short rows are NaN
+        columns = [chunk[i].fillna('').str.strip()
+                   for i in range(len(chunk.columns))]
+        blank = [column == '' for column in columns]
+        empty = np.logical_and.reduce([b.to_numpy() for b in blank])
+        if empty.any():
+            # blank lines are skipped, as by the server
+            keep = ~empty
+            columns = [column[keep] for column in columns]
+            blank = [b[keep] for b in blank]
+            rows = rows[keep]
+
+        too_long = np.zeros(len(rows), dtype=bool)
+        for i in range(layout.width, len(columns)):
+            too_long |= ~blank[i].to_numpy()
+        self._report(report, rows, too_long, None, None,
+                     'more cells than header columns')
+
+        date = layout.date
+        self._report(report, rows, blank[date].to_numpy(), 'date',
+                     columns[date], 'missing date')
+        self._check_dates(report, rows, columns[date], blank[date], 'date')
+
+        if self.require_target:
+            anchored = np.zeros(len(rows), dtype=bool)
+            for i in [layout.target] + layout.devices:
+                if i is not None:
+                    anchored |= ~blank[i].to_numpy()
+            if layout.target is not None or layout.devices:
+                self._report(report, rows, ~anchored, None, None,
+                             'missing target or device')
+
+        for column, reference, raw_column in layout.variables:
+            datatype = self.datatypes.get(reference)
+            if datatype is not None:
+                self._check_values(report, rows, columns[column],
+                                   blank[column], reference,
+                                   datatype_kind(datatype))
+            if raw_column is not None:
+                values = columns[raw_column]
+                bad = ~(blank[raw_column] | values.str.fullmatch(_RAW_DATA))
+                self._report(report, rows, bad.to_numpy(),
+                             layout.column_name(raw_column), values,
+                             'invalid raw_data, expected numbers')
+        return len(rows)
+
+    def _check_dates(self, report, rows, values, blank, name):
+        pattern = (DATE_WITH_OFFSET_PATTERN if self.require_offset
+                   else DATE_PATTERN)
+        matched = values.str.fullmatch(pattern) | blank
+        self._report(report, rows, (~matched).to_numpy(), name, values,
+                     'invalid date, expected ISO 8601')
+        # the pattern lets 2024-02-30 through
+        checked = values[matched & ~blank].str.slice(0, 10)
+        if len(checked):
+            days = pd.to_datetime(checked, format='%Y-%m-%d', errors='coerce')
+            invalid = days.isna().to_numpy()
+            positions = np.flatnonzero(matched & ~blank)[invalid]
+            report.add_all(rows[positions], name,
+                           values.to_numpy()[positions],
+                           'invalid date, no such day')
+
+    def _check_values(self, report, rows, values, blank, name, kind):
+        special = values.isin(MISSING_VALUES)
+        if kind in ('decimal', 'double', 'float'):
+            numbers = pd.to_numeric(values.where(~(blank | special)),
+                                    errors='coerce')
+            bad = (numbers.isna() & ~blank & ~special).to_numpy()
+            if bad.any():
+                comma = values.str.fullmatch(_COMMA_DECIMAL).to_numpy()
+                self._report(report, rows, bad & comma, name, values,
+                             "invalid decimal separator, expected '.'")
+                self._report(report, rows, bad & ~comma, name, values,
+                             'not a decimal')
+            return
+        self._report(report, rows, (special & ~blank).to_numpy(), name,
+                     values, 'NA, null and NaN are only allowed for '
+                             'decimals')
+        checked = ~(blank | special)
+        if kind in ('integer', 'int', 'long', 'short'):
+            bad = checked & ~values.str.fullmatch(_INTEGER)
+            self._report(report, rows, bad.to_numpy(), name, values,
+                         'not an integer')
+        elif kind == 'boolean':
+            bad = checked & ~values.isin(_BOOLEANS)
+            self._report(report, rows, bad.to_numpy(), name, values,
+                         'not a boolean')
+        elif kind in ('date', 'datetime'):
+            self._check_dates(report, rows, values, ~checked, name)
+
+    def _report(self, report, rows, mask, name, values, message):
+        if not mask.any():
+            return
+        positions = np.flatnonzero(mask)
+        cells = (values.to_numpy()[positions] if values is not None
+                 else [None] * len(positions))
+        report.add_all(rows[positions], name, cells, message)
+
+
+def validate_csv_file(file_path, datatypes=None, **kwargs):
+    """Returns the ValidationReport of a data CSV file, see
+    DataCsvValidator."""
+    return DataCsvValidator(datatypes, **kwargs).validate(file_path)
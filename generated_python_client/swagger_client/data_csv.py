@@ -0,0 +1,137 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import csv
+import io
+import re
+
+
+# the first three rows of a data CSV describe the columns
+HEADER_ROWS = 3
+# values standing for a missing decimal
+MISSING_VALUES = ('NA', 'null', 'NaN')
+
+
+def detect_delimiter(file_path):
+    """Returns the separator of a data CSV file, comma or semicolon."""
+    with io.open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+        line = csvfile.readline()
+    return ';' if line.count(';') > line.count(',') else ','
+
+
+def datatype_kind(datatype):
+    """Returns the local name of an XSD datatype URI, lower case:
+    `decimal`, `integer`, `boolean`, `date`, `datetime`, `string`...,
+    `decimal` when unknown."""
+    return re.split('[#:]', datatype or 'decimal')[-1].lower()
+
+
+def cell(row, column):
+    """Returns the stripped cell of a row, '' beyond its end."""
+    return row[column].strip() if column < len(row) else ''
+
+
+class CsvLayout(object):
+    """Columns of a data CSV file, in the OpenSILEX format, read from its
+    first header row.
+
+    The experiment and device columns are optional and can be repeated, the
+    target column is optional, the date column is required. Every other
+    column holds a variable, named by its name or URI in the header, and
+    can be followed by a `raw_data` column.
+
+    :param header: the first header row.
+    """
+
+    def __init__(self, header):
+        names = [name.strip().rstrip('*').strip() for name in header]
+        # some files number their header rows, as data/example_data.csv
+        if len(names) > 1 and names[0] == '1':
+            names = [None] + names[1:]
+            self.shift = 1
+        else:
+            self.shift = 0
+        self.width = len(names) - self.shift
+        self.experiments = []
+        self.devices = []
+        self.target = None
+        self.date = None
+        self.annotation = None
+        # [column, variable reference, raw_data column or None]
+        self.variables = []
+        for index, name in enumerate(names):
+            if name is None:
+                continue
+            column = index - self.shift
+            keyword = name.lower()
+            if keyword == 'experiment':
+                self.experiments.append(column)
+            elif keyword == 'device':
+                self.devices.append(column)
+            elif keyword == 'target':
+                self.target = column
+            elif keyword == 'date':
+                self.date = column
+            elif keyword == 'annotation':
+                self.annotation = column
+            elif keyword == 'raw_data':
+                if not self.variables or self.variables[-1][0] != column - 1:
+                    raise ValueError("raw_data column %d does not follow a "
+                                     "variable column" % (index + 1))
+                self.variables[-1][2] = column
+            elif name:
+                self.variables.append([column, name, None])
+        if self.date is None:
+            raise ValueError("The file has no date column")
+        if not self.variables:
+            raise ValueError("The file has no variable column")
+
+    @classmethod
+    def read(cls, file_path, delimiter=','):
+        """Returns the layout of a data CSV file."""
+        with io.open(file_path, 'r', encoding='utf-8', newline='') as f:
+            return cls(next(csv.reader(f, delimiter=delimiter), []))
+
+    def column_name(self, column):
+        """Returns a readable name of a column."""
+        if column == self.date:
+            return 'date'
+        if column == self.target:
+            return 'target'
+        if column == self.annotation:
+            return 'annotation'
+        if column in self.experiments:
+            return 'experiment'
+        if column in self.devices:
+            return 'device'
+        for variable_column, reference, raw_column in self.variables:
+            if column == variable_column:
+                return reference
+            if column == raw_column:
+                return 'raw_data of %s' % reference
+        return 'column %d' % (column + 1)
+
+    def references(self, rows):
+        """Returns the sets of distinct experiments, targets and devices of
+        (row number, offset, row) rows, which are consumed."""
+        experiments, targets, devices = set(), set(), set()
+        for _, _, row in rows:
+            experiments.update(cell(row, i) for i in self.experiments)
+            devices.update(cell(row, i) for i in self.devices)
+            if self.target is not None:
+                targets.add(cell(row, self.target))
+        for references in (experiments, targets, devices):
+            references.discard('')
+        return experiments, targets, devices
@@ -0,0 +1,309 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import re
+import threading
+
+# python 2 and python 3 compatibility library
+import six
+
+import swagger_client.models
+from swagger_client import rest
+
+try:
+    from dateutil.parser import isoparse, parse
+except ImportError:
+    isoparse = parse = None
+
+
+PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+NATIVE_TYPES_MAPPING = {
+    'int': int,
+    'long': int if six.PY3 else long,  # noqa: F821
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'date': datetime.date,
+    'datetime': datetime.datetime,
+    'object': object,
+}
+
+# (klass, trusted) -> decoder, see compile_type(); holds complete decoders
+# only, so that it is read without the lock
+_decoders = {}
+# model class -> plan, see model_plan()
+_model_plans = {}
+# klass -> bool, see unwraps_envelope()
+_envelope_types = {}
+# serializes compilations, whose decoders are published together once
+# complete
+_lock = threading.RLock()
+
+
+def compile_type(klass, trusted=False):
+    """Returns the decoder of a response type, compiling it on first use.
+
+    A decoder is a callable `decoder(data, context)` turning parsed JSON into
+    the objects ApiClient.deserialize has always returned for that type.
+    Type strings such as `list[DataGetSearchDTO]` or `dict(str, list[str])`
+    are parsed and model classes are resolved once, here, instead of for
+    every value.
+
+    :param klass: class literal, or string of class name.
+    :param trusted: build models without running their property setters,
+                    see Configuration.trusted_deserialization.
+    :return: callable (data, context) -> object, where context is the
+             ValidationContext handed to the models built.
+    """
+    key = (klass, trusted)
+    decoder = _decoders.get(key)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(key)
+            if decoder is None:
+                # decoders being built, seen by this compilation only: a
+                # model registers itself here before compiling its fields,
+                # so that self-referencing models resolve
+                building = {}
+                decoder = _resolve(klass, trusted, building)
+                _decoders.update(building)
+    return decoder
+
+
+def model_plan(klass):
+    """Returns the trusted deserialization plan of a model class.
+
+    The plan lists, for every attribute in `swagger_types`, the json key
+    to read, the name of the backing field the property setter would
+    write (name-mangled for attributes such as `_date`, whose backing
+    field is `__date`) and the declared type. It is computed once per
+    class.
+
+    :param klass: model class literal.
+    :return: tuple of (json_key, backing_field, attr_type) tuples.
+    """
+    plan = _model_plans.get(klass)
+    if plan is None:
+        steps = []
+        for attr, attr_type in six.iteritems(klass.swagger_types):
+            field = '_' + attr
+            if field.startswith('__'):
+                field = '_' + klass.__name__.lstrip('_') + field
+            steps.append((klass.attribute_map[attr], field, attr_type))
+        plan = _model_plans[klass] = tuple(steps)
+    return plan
+
+
+def unwraps_envelope(klass):
+    """Tells whether a response wrapped in the OpenSILEX envelope
+    (`{metadata: ..., result: ...}`) is unwrapped for this response type.
+
+    It is, unless the declared type asks for untyped json (`object`) or is
+    itself an envelope model, such as ObjectUriResponse or the BrAPI
+    response models.
+
+    :param klass: class literal, or string of class name.
+    :return: bool.
+    """
+    unwraps = _envelope_types.get(klass)
+    if unwraps is None:
+        model = klass
+        if type(klass) == str:
+            if klass.startswith(('list[', 'dict(')):
+                model = None
+            elif klass in NATIVE_TYPES_MAPPING:
+                model = NATIVE_TYPES_MAPPING[klass]
+            else:
+                model = getattr(swagger_client.models, klass)
+        if model is object:
+            unwraps = False
+        else:
+            json_keys = getattr(model, 'attribute_map', {}).values()
+            unwraps = not ('result' in json_keys and 'metadata' in json_keys)
+        _envelope_types[klass] = unwraps
+    return unwraps
+
+
+def _resolve(klass, trusted, building):
+    key = (klass, trusted)
+    decoder = _decoders.get(key) or building.get(key)
+    if decoder is None:
+        decoder = building[key] = _compile(klass, trusted, building)
+    return decoder
+
+
+def _compile(klass, trusted, building):
+    name = klass
+    if type(klass) == str:
+        if klass.startswith('list['):
+            sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+            return _list_decoder(_resolve(sub_kls, trusted, building))
+
+        if klass.startswith('dict('):
+            sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+            return _dict_decoder(_resolve(sub_kls, trusted, building))
+
+        # convert str to class
+        if klass in NATIVE_TYPES_MAPPING:
+            klass = NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(swagger_client.models, klass)
+
+    if klass in PRIMITIVE_TYPES:
+        return _primitive_decoder(klass)
+    elif klass == object:
+        return _deserialize_object
+    elif klass == datetime.date:
+        return _deserialize_date
+    elif klass == datetime.datetime:
+        return _deserialize_datetime
+    else:
+        return _compile_model(name, klass, trusted, building)
+
+
+def _list_decoder(decode_item):
+    def decode(data, context):
+        if data is None:
+            return None
+        return [decode_item(item, context) for item in data]
+    return decode
+
+
+def _dict_decoder(decode_value):
+    def decode(data, context):
+        if data is None:
+            return None
+        return {k: decode_value(v, context) for k, v in six.iteritems(data)}
+    return decode
+
+
+def _primitive_decoder(klass):
+    def decode(data, context):
+        if data is None:
+            return None
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return six.text_type(data)
+        except TypeError:
+            return data
+    return decode
+
+
+def _deserialize_object(data, context):
+    return data
+
+
+def _deserialize_date(string, context):
+    if string is None:
+        return None
+    if parse is None:
+        return string
+    try:
+        return parse(string).date()
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as date object".format(string)
+        )
+
+
+def _deserialize_datetime(string, context):
+    if string is None:
+        return None
+    if parse is None:
+        return string
+    # strings carrying a full date and time are ISO 8601 in practice;
+    # isoparse reads them an order of magnitude faster than parse.
+    if len(string) >= 16 and string[10:11] == 'T':
+        try:
+            return isoparse(string)
+        except ValueError:
+            pass
+    try:
+        return parse(string)
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason=(
+                "Failed to parse `{0}` as datetime object"
+                .format(string)
+            )
+        )
+
+
+def _compile_model(name, klass, trusted, building):
+    if not klass.swagger_types:
+        return _deserialize_object
+
+    requested = trusted
+    real_child = 'get_real_child_model' in klass.__dict__
+    if real_child or issubclass(klass, dict):
+        # trusted mode only covers plain models
+        trusted = False
+
+    # (json_key, attr, decoder) and (json_key, backing field, decoder),
+    # filled in once the decoder is registered in `building`
+    fields = []
+    trusted_fields = []
+
+    def decode(data, context):
+        if data is None:
+            return None
+        kwargs = {}
+        if isinstance(data, (list, dict)):
+            for json_key, attr, decode_value in fields:
+                if json_key in data:
+                    kwargs[attr] = decode_value(data[json_key], context)
+        instance = klass(_configuration=context, **kwargs)
+        if isinstance(instance, dict) and isinstance(data, dict):
+            for k, v in data.items():
+                if k not in klass.swagger_types:
+                    instance[k] = v
+        if real_child:
+            klass_name = instance.get_real_child_model(data)
+            if klass_name:
+                instance = compile_type(klass_name)(data, context)
+        return instance
+
+    def decode_trusted(data, context):
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            return decode(data, context)
+        instance = klass.__new__(klass)
+        values = instance.__dict__
+        values['_configuration'] = context
+        for json_key, field, decode_value in trusted_fields:
+            value = data.get(json_key)
+            if value is not None:
+                value = decode_value(value, context)
+            values[field] = value
+        values['discriminator'] = None
+        return instance
+
+    # registered under both the type string and the class literal before
+    # compiling the fields, which may refer back to this model
+    decoder = decode_trusted if trusted else decode
+    building[(name, requested)] = building[(klass, requested)] = decoder
+    for attr, attr_type in six.iteritems(klass.swagger_types):
+        fields.append((klass.attribute_map[attr], attr,
+                       _resolve(attr_type, trusted, building)))
+    if trusted:
+        for json_key, field, attr_type in model_plan(klass):
+            trusted_fields.append((json_key, field,
+                                   _resolve(attr_type, trusted, building)))
+    return decoder
@@ -0,0 +1,256 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import io
+import os
+import re
+import time
+
+from swagger_client.pagination import is_retryable
+from swagger_client.rest import ApiException
+from swagger_client.retry import own_retries
+
+
+# bytes=<first>-<last>/<total or *>
+_CONTENT_RANGE = re.compile(r'^bytes\s+(\d+)-(\d+)/(\d+|\*)$')
+
+
+class _RequestHeaders(object):
+    """Api client adding headers to the requests of the generated methods,
+    which take no header argument of their own."""
+
+    def __init__(self, api_client, headers):
+        self._api_client = api_client
+        self._headers = headers
+
+    def __getattr__(self, name):
+        return getattr(self._api_client, name)
+
+    def call_api(self, resource_path, method, path_params=None,
+                 query_params=None, header_params=None, *args, **kwargs):
+        header_params = dict(header_params or {}, **self._headers)
+        return self._api_client.call_api(resource_path, method, path_params,
+                                         query_params, header_params,
+                                         *args, **kwargs)
+
+
+class FileDownloader(object):
+    """Downloads the body of a generated method to a file, by chunks.
+
+    Methods returning files, as `DataApi.get_data_file`,
+    `DocumentsApi.get_document_file`, `DataApi.export_data` or
+    `STAPLEAPIApi.export_ontology_file`, are called with
+    `_preload_content=False`, and the raw bytes of the response are written
+    to `<path>.part` by chunks of `chunk_size` bytes as they arrive, so
+    memory does not grow with the size of the file. The file is moved to
+    `path` once the number of bytes written matches the Content-Length.
+
+    When the connection breaks, or the body is shorter than announced, the
+    download is resumed with an HTTP `Range` request from the bytes already
+    written, `retries` times at most; a server ignoring the range sends the
+    whole file again, which is then rewritten. The ETag of the file, or its
+    Last-Modified date, is kept in `<path>.part.validator` and sent in
+    `If-Range`, so that a file changed on the server is sent whole rather
+    than appended to bytes of its previous version. With `resume`, a
+    `.part` file left by an interrupted run is resumed as well, when it has
+    a validator; otherwise it is downloaded again. When the api client
+    has a RetryPolicy, failed requests are left to it, and only the bodies
+    cut short are resumed here.
+
+    >>> downloader = FileDownloader(chunk_size=1 << 20)
+    >>> downloader.download(DataApi(client).get_data_file, 'image.jpg',
+    ...                     file_uri, token)
+
+    :param chunk_size: size of the reads of the response body.
+    :param retries: number of resumed requests after a failure.
+    :param backoff: delay in seconds before the first retry, doubled on
+                    each further retry.
+    :param resume: whether to resume a `.part` file left by a previous run.
+    """
+
+    def __init__(self, chunk_size=1 << 20, retries=3, backoff=0.5,
+                 resume=True):
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.backoff = backoff
+        self.resume = resume
+
+    def download(self, api_method, path, *args, **kwargs):
+        """Downloads the response of `api_method(*args, **kwargs)`.
+
+        :param api_method: bound method of a generated API instance.
+        :param path: path of the file to write.
+        :return: path.
+        """
+        part = path + '.part'
+        if not (self.resume and _read_validator(part)):
+            # the version of the bytes of a previous run is not known
+            _discard(part)
+        # requests failing are retried by the policy, if any, while bodies
+        # cut short can only be resumed from here
+        request_retries = own_retries(api_method.__self__.api_client,
+                                      self.retries)
+        attempt = 0
+        while True:
+            try:
+                response = self._request(api_method, part, args, kwargs)
+            except Exception as e:
+                if attempt >= request_retries or not is_retryable(e):
+                    raise
+            else:
+                try:
+                    if self._write(response, part):
+                        break
+                except Exception as e:
+                    if attempt >= self.retries or not is_retryable(e):
+                        raise
+                else:
+                    if attempt >= self.retries:
+                        raise ApiException(
+                            status=0, reason='Incomplete download of %s: %d '
+                            'bytes received' % (path, os.path.getsize(part)))
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(part, path)
+        _discard_validator(part)
+        return path
+
+    def _request(self, api_method, part, args, kwargs):
+        """Requests the bytes missing from `part`.
+
+        :return: the response, whose body is not read yet.
+        """
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        # offsets count bytes of the file as stored, not compressed
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = 'bytes=%d-' % offset
+            validator = _read_validator(part)
+            if validator:
+                headers['If-Range'] = validator
+        api = type(api_method.__self__)(
+            _RequestHeaders(api_method.__self__.api_client, headers))
+        try:
+            response = getattr(api, api_method.__name__)(
+                *args, _preload_content=False, **kwargs)
+        except ApiException as e:
+            if e.status != 416 or not offset:
+                raise
+            # nothing to resume from, as the file changed: start over
+            _discard(part)
+            return self._request(api_method, part, args, kwargs)
+        return response
+
+    def _write(self, response, part):
+        """Writes the body of a response to `part`, appending it to the
+        bytes already there when it is the range asked for.
+
+        :return: whether the file is complete.
+        """
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        try:
+            expected = response.headers.get('Content-Length')
+            expected = int(expected) if expected is not None else None
+            if response.headers.get('Content-Encoding',
+                                    'identity') != 'identity':
+                # decoded by urllib3, so longer than announced
+                expected = None
+            if response.status == 206:
+                match = _CONTENT_RANGE.match(
+                    response.headers.get('Content-Range', ''))
+                if not match or int(match.group(1)) != offset:
+                    raise ApiException(
+                        status=0, reason='Unexpected Content-Range %r' %
+                        response.headers.get('Content-Range'))
+                mode = 'ab'
+            else:
+                # whole file, the range being ignored or not asked for, or
+                # the file having changed since the bytes already written
+                mode = 'wb'
+                _write_validator(part, response.headers)
+            written = 0
+            with io.open(part, mode) as f:
+                for chunk in self._chunks(response):
+                    f.write(chunk)
+                    written += len(chunk)
+        finally:
+            response.release_conn()
+        return expected is None or written == expected
+
+    def _chunks(self, response):
+        read1 = getattr(response, 'read1', None)
+        if read1 is None:
+            # urllib3 < 2
+            return response.stream(self.chunk_size)
+        # unlike read, read1 returns the bytes received so far, which are
+        # then kept on disk when the connection breaks
+        return iter(lambda: read1(self.chunk_size), b'')
+
+
+def _validator(headers):
+    """Returns the value of `If-Range` matching the version of a response,
+    its strong ETag or else its Last-Modified date, or ''."""
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified') or ''
+
+
+def _read_validator(part):
+    """Returns the validator stored along `part`, '' when the server sent
+    none, or None when there is no such file."""
+    try:
+        with io.open(part + '.validator', 'r', encoding='utf-8') as f:
+            return f.read()
+    except (IOError, OSError):
+        return None
+
+
+def _write_validator(part, headers):
+    # an empty file lets the download resume in the same run, only
+    with io.open(part + '.validator', 'w', encoding='utf-8') as f:
+        f.write(_validator(headers))
+
+
+def _discard_validator(part):
+    if os.path.exists(part + '.validator'):
+        os.remove(part + '.validator')
+
+
+def _discard(part):
+    _discard_validator(part)
+    if os.path.exists(part):
+        os.remove(part)
+
+
+def download_file(api_method, path, *args, **kwargs):
+    """Downloads the response of a generated method to a file, see
+    FileDownloader.
+
+    >>> download_file(DocumentsApi(client).get_document_file, 'report.pdf',
+    ...               document_uri, token)
+
+    :param chunk_size: size of the reads of the response body.
+    :param retries: number of resumed requests after a failure.
+    :param resume: whether to resume a `.part` file left by a previous run.
+    :return: path.
+    """
+    options = dict((key, kwargs.pop(key)) for key in
+                   ('chunk_size', 'retries', 'backoff', 'resume')
+                   if key in kwargs)
+    return FileDownloader(**options).download(api_method, path,
+                                              *args, **kwargs)
@@ -0,0 +1,171 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import pprint
+
+import six
+
+
+class ResponseEnvelope(object):
+    """Typed result of an OpenSILEX response, with its metadata.
+
+    The server wraps results in `{metadata: {pagination, status, datafiles},
+    result: ...}`. ApiClient.deserialize decodes `result` to the declared
+    response type and `metadata` to a MetadataDTO, and returns model results
+    in a ResponseEnvelope, list results in a ResponseList, and other
+    results, strings, numbers, booleans and dicts, bare; see wrap.
+
+    The envelope of a model reads attributes, compares and converts with
+    `to_dict` as its model does; `isinstance` checks against the model
+    class need `result`.
+
+    :param result: deserialized result.
+    :param metadata: MetadataDTO, or None.
+    """
+
+    def __init__(self, result, metadata=None):
+        self.result = result
+        self.metadata = metadata
+
+    @property
+    def pagination(self):
+        """PaginationDTO of the response, or None."""
+        if self.metadata is None:
+            return None
+        return self.metadata.pagination
+
+    @property
+    def total_count(self):
+        """Total number of results of the search, or None if not paged."""
+        pagination = self.pagination
+        if pagination is None:
+            return None
+        return pagination.total_count
+
+    @property
+    def status(self):
+        """List of StatusDTO messages of the response, or None."""
+        if self.metadata is None:
+            return None
+        return self.metadata.status
+
+    @property
+    def datafiles(self):
+        """List of the data file URIs of the response, or None."""
+        if self.metadata is None:
+            return None
+        return self.metadata.datafiles
+
+    def to_dict(self):
+        """Returns the result as a dict, as its to_dict does"""
+        def convert(value):
+            if isinstance(value, list):
+                return [convert(item) for item in value]
+            if isinstance(value, dict):
+                return {k: convert(v) for k, v in six.iteritems(value)}
+            if hasattr(value, 'to_dict'):
+                return value.to_dict()
+            return value
+        return convert(self.result)
+
+    def __getattr__(self, name):
+        # only reached for names the envelope does not define
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.result, name)
+
+    def __iter__(self):
+        return iter(self.result)
+
+    def __len__(self):
+        return len(self.result)
+
+    def __getitem__(self, index):
+        return self.result[index]
+
+    def __contains__(self, item):
+        return item in self.result
+
+    def __bool__(self):
+        return bool(self.result)
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        if isinstance(other, ResponseEnvelope):
+            return (self.result == other.result and
+                    self.metadata == other.metadata)
+        return self.result == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return pprint.pformat(self.to_dict())
+
+
+class ResponseList(list, ResponseEnvelope):
+    """ResponseEnvelope of a list result, and that list: `isinstance(page,
+    list)` holds, `json.dumps` and list methods work on it, while
+    `metadata`, `pagination` and `total_count` tell about the response.
+    `result` is the list itself.
+
+    :param result: deserialized list result.
+    :param metadata: MetadataDTO, or None.
+    """
+
+    def __init__(self, result, metadata=None):
+        list.__init__(self, result)
+        self.metadata = metadata
+
+    @property
+    def result(self):
+        return self
+
+    def __getattr__(self, name):
+        raise AttributeError(name)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return list.__eq__(self, other)
+
+    def __ne__(self, other):
+        return list.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return list.__repr__(self)
+
+
+def wrap(result, metadata=None):
+    """Returns the envelope of a result: a ResponseList for a list, a
+    ResponseEnvelope for a model, or else the result itself, which no
+    envelope could stand in for.
+
+    :param result: deserialized result.
+    :param metadata: MetadataDTO, or None.
+    """
+    if isinstance(result, list):
+        return ResponseList(result, metadata)
+    if hasattr(result, 'swagger_types'):
+        return ResponseEnvelope(result, metadata)
+    return result
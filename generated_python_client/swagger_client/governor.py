@@ -0,0 +1,327 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import re
+import threading
+import time
+
+import urllib3
+
+from swagger_client.rest import ApiException
+
+
+# responses and errors telling the server is overloaded
+OVERLOAD_STATUSES = frozenset([429, 502, 503, 504])
+
+# regexes of the paths of POST endpoints which only read: searches,
+# counts, exports and validations sent by POST for their large bodies
+READ_ONLY_POST_PATHS = (
+    r'/by_uris$', r'/by_names$', r'/by_targets$', r'/search$', r'/count$',
+    r'/intersects$', r'/export(_\w+)?$', r'/import_validation$',
+    r'/ontology/(check_rdf_types|uri_types|uris_labels)$',
+)
+
+
+def is_overload(error):
+    """Tells whether a failed request shows the server is overloaded."""
+    if isinstance(error, ApiException):
+        return error.status in OVERLOAD_STATUSES
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        error = error.reason
+    return isinstance(error, urllib3.exceptions.TimeoutError)
+
+
+class TokenBucket(object):
+    """Token bucket limiting requests to `rate` per second on average,
+    with bursts of `burst` requests at most.
+
+    :param rate: tokens added per second.
+    :param burst: largest number of tokens held, `rate` by default.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("Invalid value for `rate`, must be a value "
+                             "greater than `0`")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.burst
+        self._last = time.time()
+        self._lock = threading.Lock()
+        self.wait_time = 0.0
+
+    def acquire(self):
+        """Takes a token, waiting for one if needed.
+
+        :return: the seconds waited.
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def reserve(self):
+        """Takes a token without waiting for it.
+
+        :return: the seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.time()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # tokens are taken in advance, so waiters are served in turn
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.wait_time += wait
+        return wait
+
+
+class AdaptiveLimit(object):
+    """Limit on concurrent requests adapted AIMD style.
+
+    Each request completing raises the limit by `increase / limit`, that is
+    by `increase` once per `limit` requests; a request failing with an
+    overload error (429, 502, 503, 504, timeout), or slower than
+    `target_latency` when set, multiplies it by `decrease`, once per round
+    trip at most: only requests started after the last decrease lower it
+    again. Latency alone is no overload signal by default, as a group mixes
+    fast lookups with slow searches.
+
+    :param initial: starting limit.
+    :param minimum: smallest limit.
+    :param maximum: largest limit.
+    :param target_latency: latency in seconds beyond which the server is
+                           deemed overloaded, None to only react to
+                           overload errors.
+    :param increase: additive increase, per `limit` requests.
+    :param decrease: multiplicative decrease.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, target_latency=None,
+                 increase=1.0, decrease=0.5):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Invalid limits, must be `1 <= minimum <= "
+                             "initial <= maximum`")
+        if not 0 < decrease < 1:
+            raise ValueError("Invalid value for `decrease`, must be a value "
+                             "between `0` and `1`")
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.overloads = 0
+        self.decreases = 0
+        self.wait_time = 0.0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition(threading.Lock())
+
+    def acquire(self):
+        """Waits for a slot.
+
+        :return: the seconds waited.
+        """
+        start = time.time()
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            return self._take(start)
+
+    def try_acquire(self, since=None):
+        """Takes a slot if one is free, without waiting.
+
+        :param since: time the caller started waiting at, for wait_time.
+        :return: whether a slot was taken.
+        """
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self._take(time.time() if since is None else since)
+            return True
+
+    def _take(self, start):
+        self.in_flight += 1
+        self.requests += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        wait = time.time() - start
+        self.wait_time += wait
+        return wait
+
+    def release(self, start, latency, overloaded=False):
+        """Frees a slot and adapts the limit.
+
+        :param start: time the request was sent at.
+        :param latency: seconds the request took.
+        :param overloaded: whether it failed with an overload error.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self.overloads += 1
+            if overloaded or (self.target_latency is not None and
+                              latency > self.target_latency):
+                if start > self._last_decrease:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self.decreases += 1
+                    self._last_decrease = time.time()
+            else:
+                self.limit = min(self.maximum,
+                                 self.limit + self.increase / self.limit)
+            self._condition.notify_all()
+
+    def as_dict(self):
+        with self._condition:
+            return {
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'max_in_flight': self.max_in_flight,
+                'requests': self.requests,
+                'overloads': self.overloads,
+                'decreases': self.decreases,
+                'wait_time': self.wait_time,
+            }
+
+
+class Governor(object):
+    """Caps the requests of the api clients sharing it, to spare a server
+    which many parallel jobs would overload.
+
+    Requests are sorted into groups: `transfers` (multipart uploads and
+    streamed downloads), `writes` (POST, PUT, PATCH and DELETE) and
+    `reads` (GET, HEAD, OPTIONS, and the searches, counts and validations
+    sent by POST to `read_paths`), each with its own AdaptiveLimit on
+    concurrent requests, so that bulk uploads do not starve reads. When
+    `rate` is set, a TokenBucket also caps the requests per second of all
+    groups. Every attempt of a request retried by the RetryPolicy takes a
+    slot and a token of its own, and a streamed download keeps its slot
+    until its connection is released. The limits are shared by the threads
+    of ApiClient and the coroutines of AsyncApiClient.
+
+    Set it on the Configuration of the api clients to share it with:
+
+    >>> configuration.governor = Governor(rate=20, limits={
+    ...     'reads': AdaptiveLimit(4, maximum=16),
+    ...     'writes': AdaptiveLimit(2, maximum=4),
+    ...     'transfers': AdaptiveLimit(1, maximum=2)})
+    >>> ...
+    >>> print(configuration.governor.as_dict())
+
+    :param rate: requests per second, None for no limit.
+    :param burst: burst of requests of the token bucket.
+    :param limits: dict of group name to AdaptiveLimit, the missing groups
+                   having default limits.
+    :param read_paths: regexes of the paths of POST requests which only
+                       read, READ_ONLY_POST_PATHS by default.
+    """
+
+    DEFAULT_LIMITS = {
+        'reads': dict(initial=8, maximum=32),
+        'writes': dict(initial=2, maximum=8),
+        'transfers': dict(initial=1, maximum=4),
+    }
+
+    def __init__(self, rate=None, burst=None, limits=None,
+                 read_paths=READ_ONLY_POST_PATHS):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.limits = dict(limits or {})
+        for group, options in self.DEFAULT_LIMITS.items():
+            if group not in self.limits:
+                self.limits[group] = AdaptiveLimit(**options)
+        self.read_paths = [re.compile(p) for p in read_paths]
+
+    def group(self, method, url, post_params=None, _preload_content=True):
+        """Returns the group of a request."""
+        if not _preload_content or any(
+                isinstance(value, tuple) for _, value in post_params or ()):
+            return 'transfers'
+        if method in ('GET', 'HEAD', 'OPTIONS'):
+            return 'reads'
+        path = url.split('?', 1)[0]
+        if method == 'POST' and any(p.search(path) for p in self.read_paths):
+            return 'reads'
+        return 'writes'
+
+    def call(self, group, send, streamed=False):
+        """Calls `send()`, which sends one attempt of a request of `group`,
+        once a slot and a token are available.
+
+        Retries are attempts of their own, taking a slot and a token each,
+        so the slot is free while the retry policy waits between them.
+
+        :param streamed: whether the body of the response is read after
+                         `send` returns, the slot being then kept until
+                         the connection is released, see hold.
+        :return: the response returned by `send`.
+        """
+        limit = self.limits[group]
+        limit.acquire()
+        start = time.time()
+        try:
+            if self.bucket is not None:
+                self.bucket.acquire()
+                start = time.time()
+            response = send()
+        except Exception as e:
+            limit.release(start, time.time() - start, is_overload(e))
+            raise
+        if streamed:
+            return self.hold(response, limit, start,
+                             ('release_conn', 'close'))
+        limit.release(start, time.time() - start)
+        return response
+
+    @staticmethod
+    def hold(response, limit, start, methods):
+        """Keeps the slot of a streamed response until one of its `methods`
+        releasing the connection is called, whether by the caller or by the
+        transport once the body is read.
+
+        :param limit: AdaptiveLimit the slot was taken from.
+        :param start: time the request was sent at.
+        :param methods: names of the methods of `response` to wrap.
+        :return: response.
+        """
+        # the latency is that of the headers, a large body is no overload
+        latency = time.time() - start
+        lock = threading.Lock()
+        held = [True]
+
+        def releasing(method):
+            def release(*args, **kwargs):
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    with lock:
+                        first, held[0] = held[0], False
+                    if first:
+                        limit.release(start, latency)
+            return release
+
+        for name in methods:
+            setattr(response, name, releasing(getattr(response, name)))
+        return response
+
+    def as_dict(self):
+        """Returns a snapshot of the limits of the groups."""
+        stats = dict((group, limit.as_dict())
+                     for group, limit in self.limits.items())
+        if self.bucket is not None:
+            stats['rate_wait_time'] = self.bucket.wait_time
+        return stats
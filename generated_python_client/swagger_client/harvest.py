@@ -0,0 +1,221 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from collections import deque
+import datetime
+from multiprocessing.pool import ThreadPool
+
+from dateutil.parser import isoparse
+import six
+
+from swagger_client.pagination import call_with_retries, split_page
+from swagger_client.retry import own_retries
+
+
+# smallest date step of the server, see DataHarvester.split()
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+# filters of search_data_list that count_data accepts too
+COUNT_FILTERS = ('timezone', 'experiments', 'targets', 'variables',
+                 'devices', 'min_confidence', 'max_confidence',
+                 'provenances', 'metadata', 'operators')
+
+
+def _to_datetime(value):
+    if isinstance(value, six.string_types):
+        return isoparse(value)
+    if not isinstance(value, datetime.datetime):
+        # datetime.date
+        return datetime.datetime(value.year, value.month, value.day)
+    return value
+
+
+def format_date(value):
+    """Formats a window bound the way the data search expects it."""
+    return value.isoformat(timespec='milliseconds')
+
+
+class DataHarvester(object):
+    """Harvests the data of a `DataApi.search_data_list` query by time
+    windows fetched concurrently.
+
+    The `start_date`/`end_date` range is cut into `parallelism` windows.
+    Each window is first counted with `count_data`: a window holding more
+    than `threshold` data is split in two halves, recursively, down to
+    `min_window`; other windows are fetched page by page, sorted by date.
+    Windows are worked on by `parallelism` threads sharing the api client's
+    connection pool, and their data is yielded in window order, which makes
+    the whole stream ordered by date.
+
+    Adjacent windows do not overlap: a window ends one millisecond before
+    the next one starts, the server storing dates to the millisecond.
+
+    Requests failing with a connection error, 429 or 5xx are retried with
+    exponential backoff.
+
+    >>> harvester = DataHarvester(DataApi(client), token,
+    ...                           '2019-01-01T00:00:00Z',
+    ...                           '2024-01-01T00:00:00Z',
+    ...                           experiments=[experiment_uri],
+    ...                           parallelism=8)
+    >>> for data in harvester:
+    ...     print(data.date, data.value)
+
+    :param data_api: DataApi instance.
+    :param authorization: authentication token.
+    :param start_date: start of the range, datetime or ISO 8601 string.
+    :param end_date: end of the range, datetime or ISO 8601 string.
+    :param threshold: largest number of data fetched as a single window.
+    :param parallelism: number of windows worked on at once.
+    :param page_size: page size of the data searches.
+    :param min_window: timedelta under which windows are not split.
+    :param retries: number of retries of a failed request, when the api
+                    client has no RetryPolicy.
+    :param backoff: delay in seconds before the first retry, doubled on
+                    each further retry.
+    :param filters: other keyword arguments of `search_data_list`, such as
+                    `experiments`, `variables` or `targets`.
+    """
+
+    def __init__(self, data_api, authorization, start_date, end_date,
+                 threshold=50000, parallelism=4, page_size=10000,
+                 min_window=datetime.timedelta(seconds=1), retries=3,
+                 backoff=0.5, **filters):
+        self.data_api = data_api
+        self.authorization = authorization
+        self.start_date = _to_datetime(start_date)
+        self.end_date = _to_datetime(end_date)
+        if self.end_date < self.start_date:
+            raise ValueError("Invalid value for `end_date`, must not be "
+                             "before `start_date`")
+        if threshold < 1:
+            raise ValueError("Invalid value for `threshold`, must be a "
+                             "value greater than or equal to `1`")
+        if parallelism < 1:
+            raise ValueError("Invalid value for `parallelism`, must be a "
+                             "value greater than or equal to `1`")
+        self.threshold = threshold
+        self.parallelism = parallelism
+        self.page_size = page_size
+        self.min_window = max(min_window, _MILLISECOND)
+        self.retries = retries
+        self.backoff = backoff
+        self.filters = filters
+
+    def _call(self, method, **kwargs):
+        retries = own_retries(self.data_api.api_client, self.retries)
+        return call_with_retries(method, (self.authorization,), kwargs,
+                                 retries=retries, backoff=self.backoff)
+
+    def count(self, start, end):
+        """Counts the data of a window, up to `threshold + 1`.
+
+        :param start: datetime, start of the window.
+        :param end: datetime, end of the window (included).
+        :return: int.
+        """
+        kwargs = dict((key, value) for key, value in self.filters.items()
+                      if key in COUNT_FILTERS)
+        if 'targets' not in kwargs:
+            # the count body can't be null
+            kwargs['targets'] = []
+        return self._call(self.data_api.count_data,
+                          start_date=format_date(start),
+                          end_date=format_date(end),
+                          count_limit=self.threshold + 1, **kwargs)
+
+    def fetch(self, start, end):
+        """Fetches every data of a window, sorted by date.
+
+        :param start: datetime, start of the window.
+        :param end: datetime, end of the window (included).
+        :return: list of DataGetSearchDTO.
+        """
+        kwargs = dict(self.filters, order_by=['date=asc'],
+                      start_date=format_date(start),
+                      end_date=format_date(end), page_size=self.page_size)
+        rows = []
+        page = 0
+        while True:
+            items, pagination = split_page(self._call(
+                self.data_api.search_data_list, page=page, **kwargs))
+            rows.extend(items)
+            if not items:
+                break
+            if pagination is not None and \
+                    pagination.has_next_page is not None:
+                if not pagination.has_next_page:
+                    break
+            elif len(items) < self.page_size:
+                break
+            page += 1
+        return rows
+
+    def split(self, start, end, parts):
+        """Cuts a window into `parts` adjacent windows.
+
+        :return: list of (start, end) tuples, ends included.
+        """
+        step = (end - start) // parts
+        step -= datetime.timedelta(microseconds=step.microseconds % 1000)
+        if step < self.min_window:
+            return [(start, end)]
+        bounds = [start + step * i for i in range(parts)] + [
+            end + _MILLISECOND]
+        return [(bounds[i], bounds[i + 1] - _MILLISECOND)
+                for i in range(parts)]
+
+    def _harvest(self, pool, start, end):
+        # runs on the pool: returns either the two halves being harvested,
+        # or the data of the window
+        halves = self.split(start, end, 2)
+        if len(halves) > 1 and self.count(start, end) > self.threshold:
+            return [pool.apply_async(self._harvest, (pool,) + window)
+                    for window in halves], None
+        return None, self.fetch(start, end)
+
+    def windows(self):
+        """Yields the data of each window, as lists, in date order."""
+        pool = ThreadPool(self.parallelism)
+        try:
+            pending = deque(
+                pool.apply_async(self._harvest, (pool,) + window)
+                for window in self.split(self.start_date, self.end_date,
+                                         self.parallelism))
+            while pending:
+                halves, rows = pending.popleft().get()
+                if halves is not None:
+                    pending.extendleft(reversed(halves))
+                else:
+                    yield rows
+        finally:
+            pool.terminate()
+
+    def __iter__(self):
+        for rows in self.windows():
+            for row in rows:
+                yield row
+
+
+def harvest_data(data_api, authorization, start_date, end_date, **kwargs):
+    """Returns every data of a `search_data_list` query over a date range,
+    in date order, harvested by concurrent time windows.
+
+    See DataHarvester for the accepted arguments.
+
+    :return: iterator over DataGetSearchDTO.
+    """
+    return iter(DataHarvester(data_api, authorization, start_date, end_date,
+                              **kwargs))
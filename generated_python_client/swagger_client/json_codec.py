@@ -0,0 +1,125 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+
+import six
+
+
+class JSONCodec(object):
+    """Encodes request bodies and decodes response bodies.
+
+    `loads` accepts the raw response bytes, so backends that parse bytes
+    natively never need a decoded copy of the body. `dumps` may return
+    str or bytes; both are accepted as a request body by urllib3.
+
+    This base implementation uses the standard library json module.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj):
+        """Serializes a sanitized request body.
+
+        :param obj: JSON-compatible object.
+        :return: str or bytes.
+        """
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """Parses a response body.
+
+        :param data: bytes or str.
+        :return: JSON-compatible object.
+        :raise ValueError: if the body is not valid JSON.
+        """
+        if six.PY3 and isinstance(data, bytes):
+            # json.loads only accepts bytes from python 3.6 onwards
+            data = data.decode('utf8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson backend: parses bytes directly and encodes straight to bytes."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._dumps_option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj, option=self._dumps_option)
+
+    def loads(self, data):
+        # orjson.JSONDecodeError is a subclass of ValueError
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson backend: parses bytes directly and encodes to utf-8 bytes."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False,
+                                 escape_forward_slashes=False).encode('utf8')
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+
+CODECS = {
+    'json': JSONCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+}
+
+# Order in which backends are tried with the 'auto' setting.
+AUTO_ORDER = ('orjson', 'ujson', 'json')
+
+
+def get_codec(codec=None):
+    """Resolves the `Configuration.json_codec` setting to a codec instance.
+
+    :param codec: None for the standard library json module, 'auto' for
+                  the fastest installed backend, the name of a backend
+                  ('json', 'orjson', 'ujson') or a JSONCodec instance, which
+                  is returned unchanged.
+    :return: JSONCodec.
+    :raise ValueError: if the codec name is unknown.
+    :raise ImportError: if the named backend is not installed.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return JSONCodec()
+    if codec == 'auto':
+        for name in AUTO_ORDER:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+    if codec not in CODECS:
+        raise ValueError(
+            "Invalid value for `json_codec` ({0}), must be one of {1}"
+            .format(codec, sorted(CODECS))
+        )
+    return CODECS[codec]()
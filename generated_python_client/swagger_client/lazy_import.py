@@ -0,0 +1,66 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import importlib
+import sys
+
+
+def attach(package, attributes):
+    """Makes the attributes of a package load on first access.
+
+    On python 3.7+ the package gets a module `__getattr__` (PEP 562) that
+    imports the defining module when one of `attributes` is first read and
+    caches the result in the package namespace. Any other missing name is
+    tried as a submodule, so `swagger_client.rest`-style access keeps
+    working without an explicit import. Older pythons import everything
+    right away.
+
+    :param package: name of the package, i.e. its `__name__`.
+    :param attributes: dict of attribute name -> name of the module that
+                       defines it.
+    :return: tuple (__getattr__, __dir__) to bind in the package, or
+             (None, None) when everything was imported eagerly.
+    """
+    if sys.version_info < (3, 7):
+        module = sys.modules[package]
+        for name, module_name in attributes.items():
+            setattr(module, name,
+                    getattr(importlib.import_module(module_name), name))
+        return None, None
+
+    def __getattr__(name):
+        if name.startswith('__'):
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(package, name))
+        module_name = attributes.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name), name)
+        else:
+            submodule = package + '.' + name
+            try:
+                value = importlib.import_module(submodule)
+            except ImportError as e:
+                if getattr(e, 'name', None) != submodule:
+                    raise
+                raise AttributeError(
+                    "module {0!r} has no attribute {1!r}"
+                    .format(package, name))
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
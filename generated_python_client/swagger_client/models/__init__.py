@@ -14,312 +14,323 @@
 
 from __future__ import absolute_import
 
+# Attributes are imported on first access, see lazy_import.attach.
+from swagger_client import lazy_import
+
 # import models into model package
-from swagger_client.models.account_creation_dto import AccountCreationDTO
-from swagger_client.models.account_get_dto import AccountGetDTO
-from swagger_client.models.account_update_dto import AccountUpdateDTO
-from swagger_client.models.activity_creation_dto import ActivityCreationDTO
-from swagger_client.models.activity_get_dto import ActivityGetDTO
-from swagger_client.models.agent_model import AgentModel
-from swagger_client.models.agroportal_links_model import AgroportalLinksModel
-from swagger_client.models.agroportal_ontologies_config_dto import AgroportalOntologiesConfigDTO
-from swagger_client.models.agroportal_term_dto import AgroportalTermDTO
-from swagger_client.models.alt import Alt
-from swagger_client.models.annotation_creation_dto import AnnotationCreationDTO
-from swagger_client.models.annotation_get_dto import AnnotationGetDTO
-from swagger_client.models.annotation_model import AnnotationModel
-from swagger_client.models.annotation_update_dto import AnnotationUpdateDTO
-from swagger_client.models.anon_id import AnonId
-from swagger_client.models.api_contact_info_dto import ApiContactInfoDTO
-from swagger_client.models.api_external_docs_dto import ApiExternalDocsDTO
-from swagger_client.models.api_git_commit_dto import ApiGitCommitDTO
-from swagger_client.models.api_license_info_dto import ApiLicenseInfoDTO
-from swagger_client.models.api_modules_info import ApiModulesInfo
-from swagger_client.models.area_creation_dto import AreaCreationDTO
-from swagger_client.models.area_get_dto import AreaGetDTO
-from swagger_client.models.area_update_dto import AreaUpdateDTO
-from swagger_client.models.authentication_dto import AuthenticationDTO
-from swagger_client.models.bag import Bag
-from swagger_client.models.blank_node_id import BlankNodeId
-from swagger_client.models.br_apiv1_call_dto import BrAPIv1CallDTO
-from swagger_client.models.br_apiv1_call_list_response import BrAPIv1CallListResponse
-from swagger_client.models.br_apiv1_documentation_link_dto import BrAPIv1DocumentationLinkDTO
-from swagger_client.models.br_apiv1_germplasm_dto import BrAPIv1GermplasmDTO
-from swagger_client.models.br_apiv1_germplasm_list_response import BrAPIv1GermplasmListResponse
-from swagger_client.models.br_apiv1_method_dto import BrAPIv1MethodDTO
-from swagger_client.models.br_apiv1_observation_dto import BrAPIv1ObservationDTO
-from swagger_client.models.br_apiv1_observation_list_response import BrAPIv1ObservationListResponse
-from swagger_client.models.br_apiv1_observation_summary_dto import BrAPIv1ObservationSummaryDTO
-from swagger_client.models.br_apiv1_observation_unit_dto import BrAPIv1ObservationUnitDTO
-from swagger_client.models.br_apiv1_observation_unit_list_response import BrAPIv1ObservationUnitListResponse
-from swagger_client.models.br_apiv1_observation_unit_treatment_dto import BrAPIv1ObservationUnitTreatmentDTO
-from swagger_client.models.br_apiv1_observation_unit_xref_dto import BrAPIv1ObservationUnitXrefDTO
-from swagger_client.models.br_apiv1_observation_variable_dto import BrAPIv1ObservationVariableDTO
-from swagger_client.models.br_apiv1_observation_variable_list_response import BrAPIv1ObservationVariableListResponse
-from swagger_client.models.br_apiv1_ontology_reference_dto import BrAPIv1OntologyReferenceDTO
-from swagger_client.models.br_apiv1_scale_dto import BrAPIv1ScaleDTO
-from swagger_client.models.br_apiv1_season_dto import BrAPIv1SeasonDTO
-from swagger_client.models.br_apiv1_single_observation_variable_response import BrAPIv1SingleObservationVariableResponse
-from swagger_client.models.br_apiv1_single_study_response import BrAPIv1SingleStudyResponse
-from swagger_client.models.br_apiv1_study_dto import BrAPIv1StudyDTO
-from swagger_client.models.br_apiv1_study_list_response import BrAPIv1StudyListResponse
-from swagger_client.models.br_apiv1_super_study_dto import BrAPIv1SuperStudyDTO
-from swagger_client.models.br_apiv1_trait_dto import BrAPIv1TraitDTO
-from swagger_client.models.brapi_data_response_part import BrapiDataResponsePart
-from swagger_client.models.brapi_data_response_part_list_br_apiv1_call_dto import BrapiDataResponsePartListBrAPIv1CallDTO
-from swagger_client.models.brapi_data_response_part_list_br_apiv1_germplasm_dto import BrapiDataResponsePartListBrAPIv1GermplasmDTO
-from swagger_client.models.brapi_data_response_part_list_br_apiv1_observation_dto import BrapiDataResponsePartListBrAPIv1ObservationDTO
-from swagger_client.models.brapi_data_response_part_list_br_apiv1_observation_unit_dto import BrapiDataResponsePartListBrAPIv1ObservationUnitDTO
-from swagger_client.models.brapi_data_response_part_list_br_apiv1_observation_variable_dto import BrapiDataResponsePartListBrAPIv1ObservationVariableDTO
-from swagger_client.models.brapi_data_response_part_list_br_apiv1_study_dto import BrapiDataResponsePartListBrAPIv1StudyDTO
-from swagger_client.models.brapi_data_response_part_list_faidarev1_call_dto import BrapiDataResponsePartListFaidarev1CallDTO
-from swagger_client.models.brapi_data_response_part_list_faidarev1_germplasm_dto import BrapiDataResponsePartListFaidarev1GermplasmDTO
-from swagger_client.models.brapi_data_response_part_list_faidarev1_location_dto import BrapiDataResponsePartListFaidarev1LocationDTO
-from swagger_client.models.brapi_data_response_part_list_faidarev1_observation_variable_dto import BrapiDataResponsePartListFaidarev1ObservationVariableDTO
-from swagger_client.models.brapi_data_response_part_list_faidarev1_study_dto import BrapiDataResponsePartListFaidarev1StudyDTO
-from swagger_client.models.brapi_data_response_part_list_faidarev1_trial_dto import BrapiDataResponsePartListFaidarev1TrialDTO
-from swagger_client.models.csv_cell import CSVCell
-from swagger_client.models.csv_datatype_error import CSVDatatypeError
-from swagger_client.models.csv_duplicate_uri_error import CSVDuplicateURIError
-from swagger_client.models.csvuri_not_found_error import CSVURINotFoundError
-from swagger_client.models.csv_validation_dto import CSVValidationDTO
-from swagger_client.models.csv_validation_model import CSVValidationModel
-from swagger_client.models.capabilities import Capabilities
-from swagger_client.models.characteristic_creation_dto import CharacteristicCreationDTO
-from swagger_client.models.characteristic_details_dto import CharacteristicDetailsDTO
-from swagger_client.models.characteristic_get_dto import CharacteristicGetDTO
-from swagger_client.models.characteristic_update_dto import CharacteristicUpdateDTO
-from swagger_client.models.copy_resource_dto import CopyResourceDTO
-from swagger_client.models.count_item_dto import CountItemDTO
-from swagger_client.models.count_item_period_dto import CountItemPeriodDTO
-from swagger_client.models.count_list_item_dto import CountListItemDTO
-from swagger_client.models.count_list_item_period_dto import CountListItemPeriodDTO
-from swagger_client.models.credential_dto import CredentialDTO
-from swagger_client.models.credentials_group_dto import CredentialsGroupDTO
-from swagger_client.models.crs import Crs
-from swagger_client.models.csv_header import CsvHeader
-from swagger_client.models.dashboard_config_dto import DashboardConfigDTO
-from swagger_client.models.data_csv_validation_dto import DataCSVValidationDTO
-from swagger_client.models.data_csv_validation_model import DataCSVValidationModel
-from swagger_client.models.data_computed_get_dto import DataComputedGetDTO
-from swagger_client.models.data_confidence_dto import DataConfidenceDTO
-from swagger_client.models.data_creation_dto import DataCreationDTO
-from swagger_client.models.data_file_get_dto import DataFileGetDTO
-from swagger_client.models.data_file_path_creation_dto import DataFilePathCreationDTO
-from swagger_client.models.data_get_dto import DataGetDTO
-from swagger_client.models.data_get_details_dto import DataGetDetailsDTO
-from swagger_client.models.data_get_search_dto import DataGetSearchDTO
-from swagger_client.models.data_provenance_model import DataProvenanceModel
-from swagger_client.models.data_search_dto import DataSearchDTO
-from swagger_client.models.data_serie_get_dto import DataSerieGetDTO
-from swagger_client.models.data_simple_provenance_get_dto import DataSimpleProvenanceGetDTO
-from swagger_client.models.data_update_dto import DataUpdateDTO
-from swagger_client.models.data_variable_series_get_dto import DataVariableSeriesGetDTO
-from swagger_client.models.device_creation_dto import DeviceCreationDTO
-from swagger_client.models.device_get_dto import DeviceGetDTO
-from swagger_client.models.device_get_details_dto import DeviceGetDetailsDTO
-from swagger_client.models.document_get_dto import DocumentGetDTO
-from swagger_client.models.entity_creation_dto import EntityCreationDTO
-from swagger_client.models.entity_details_dto import EntityDetailsDTO
-from swagger_client.models.entity_get_dto import EntityGetDTO
-from swagger_client.models.entity_update_dto import EntityUpdateDTO
-from swagger_client.models.error_dto import ErrorDTO
-from swagger_client.models.error_response import ErrorResponse
-from swagger_client.models.event_creation_dto import EventCreationDTO
-from swagger_client.models.event_details_dto import EventDetailsDTO
-from swagger_client.models.event_get_dto import EventGetDTO
-from swagger_client.models.event_update_dto import EventUpdateDTO
-from swagger_client.models.experiment_creation_dto import ExperimentCreationDTO
-from swagger_client.models.experiment_get_dto import ExperimentGetDTO
-from swagger_client.models.experiment_get_list_dto import ExperimentGetListDTO
-from swagger_client.models.facility_address_dto import FacilityAddressDTO
-from swagger_client.models.facility_creation_dto import FacilityCreationDTO
-from swagger_client.models.facility_get_dto import FacilityGetDTO
-from swagger_client.models.facility_named_dto import FacilityNamedDTO
-from swagger_client.models.facility_update_dto import FacilityUpdateDTO
-from swagger_client.models.factor_category_get_dto import FactorCategoryGetDTO
-from swagger_client.models.factor_creation_dto import FactorCreationDTO
-from swagger_client.models.factor_details_get_dto import FactorDetailsGetDTO
-from swagger_client.models.factor_get_dto import FactorGetDTO
-from swagger_client.models.factor_level_creation_dto import FactorLevelCreationDTO
-from swagger_client.models.factor_level_get_dto import FactorLevelGetDTO
-from swagger_client.models.factor_level_get_detail_dto import FactorLevelGetDetailDTO
-from swagger_client.models.factor_update_dto import FactorUpdateDTO
-from swagger_client.models.faidarev1_call_dto import Faidarev1CallDTO
-from swagger_client.models.faidarev1_call_list_response import Faidarev1CallListResponse
-from swagger_client.models.faidarev1_contact_dto import Faidarev1ContactDTO
-from swagger_client.models.faidarev1_data_link_dto import Faidarev1DataLinkDTO
-from swagger_client.models.faidarev1_dataset_authorship_dto import Faidarev1DatasetAuthorshipDTO
-from swagger_client.models.faidarev1_germplasm_dto import Faidarev1GermplasmDTO
-from swagger_client.models.faidarev1_germplasm_list_response import Faidarev1GermplasmListResponse
-from swagger_client.models.faidarev1_last_update_dto import Faidarev1LastUpdateDTO
-from swagger_client.models.faidarev1_location_dto import Faidarev1LocationDTO
-from swagger_client.models.faidarev1_location_list_response import Faidarev1LocationListResponse
-from swagger_client.models.faidarev1_method_dto import Faidarev1MethodDTO
-from swagger_client.models.faidarev1_observation_variable_dto import Faidarev1ObservationVariableDTO
-from swagger_client.models.faidarev1_observation_variable_list_response import Faidarev1ObservationVariableListResponse
-from swagger_client.models.faidarev1_scale_dto import Faidarev1ScaleDTO
-from swagger_client.models.faidarev1_study_dto import Faidarev1StudyDTO
-from swagger_client.models.faidarev1_study_list_response import Faidarev1StudyListResponse
-from swagger_client.models.faidarev1_study_summary_dto import Faidarev1StudySummaryDTO
-from swagger_client.models.faidarev1_trait_dto import Faidarev1TraitDTO
-from swagger_client.models.faidarev1_trial_additional_info_dto import Faidarev1TrialAdditionalInfoDTO
-from swagger_client.models.faidarev1_trial_dto import Faidarev1TrialDTO
-from swagger_client.models.faidarev1_trial_list_response import Faidarev1TrialListResponse
-from swagger_client.models.favorite_creation_dto import FavoriteCreationDTO
-from swagger_client.models.favorite_get_dto import FavoriteGetDTO
-from swagger_client.models.favorite_get_graph_name_dto import FavoriteGetGraphNameDTO
-from swagger_client.models.feature import Feature
-from swagger_client.models.feature_collection import FeatureCollection
-from swagger_client.models.font_config_dto import FontConfigDTO
-from swagger_client.models.front_config_dto import FrontConfigDTO
-from swagger_client.models.geo_json_object import GeoJsonObject
-from swagger_client.models.geometry_collection import GeometryCollection
-from swagger_client.models.geometry_dto import GeometryDTO
-from swagger_client.models.germplasm_creation_dto import GermplasmCreationDTO
-from swagger_client.models.germplasm_get_all_dto import GermplasmGetAllDTO
-from swagger_client.models.germplasm_get_single_dto import GermplasmGetSingleDTO
-from swagger_client.models.germplasm_group_creation_dto import GermplasmGroupCreationDTO
-from swagger_client.models.germplasm_group_get_dto import GermplasmGroupGetDTO
-from swagger_client.models.germplasm_group_get_with_details_dto import GermplasmGroupGetWithDetailsDTO
-from swagger_client.models.germplasm_group_update_dto import GermplasmGroupUpdateDTO
-from swagger_client.models.germplasm_search_filter import GermplasmSearchFilter
-from swagger_client.models.germplasm_update_dto import GermplasmUpdateDTO
-from swagger_client.models.graph import Graph
-from swagger_client.models.graph_config_dto import GraphConfigDTO
-from swagger_client.models.graph_event_manager import GraphEventManager
-from swagger_client.models.group_creation_dto import GroupCreationDTO
-from swagger_client.models.group_dto import GroupDTO
-from swagger_client.models.group_update_dto import GroupUpdateDTO
-from swagger_client.models.group_user_profile_dto import GroupUserProfileDTO
-from swagger_client.models.interest_entity_creation_dto import InterestEntityCreationDTO
-from swagger_client.models.interest_entity_details_dto import InterestEntityDetailsDTO
-from swagger_client.models.interest_entity_get_dto import InterestEntityGetDTO
-from swagger_client.models.interest_entity_update_dto import InterestEntityUpdateDTO
-from swagger_client.models.line_string import LineString
-from swagger_client.models.list_item_dto import ListItemDTO
-from swagger_client.models.literal import Literal
-from swagger_client.models.lng_lat_alt import LngLatAlt
-from swagger_client.models.lock import Lock
-from swagger_client.models.matomo_config_dto import MatomoConfigDTO
-from swagger_client.models.menu_item_dto import MenuItemDTO
-from swagger_client.models.metadata_dto import MetadataDTO
-from swagger_client.models.method_creation_dto import MethodCreationDTO
-from swagger_client.models.method_details_dto import MethodDetailsDTO
-from swagger_client.models.method_get_dto import MethodGetDTO
-from swagger_client.models.method_update_dto import MethodUpdateDTO
-from swagger_client.models.metric_dto import MetricDTO
-from swagger_client.models.metric_period_dto import MetricPeriodDTO
-from swagger_client.models.model import Model
-from swagger_client.models.model_property import ModelProperty
-from swagger_client.models.motivation_get_dto import MotivationGetDTO
-from swagger_client.models.motivation_model import MotivationModel
-from swagger_client.models.move_creation_dto import MoveCreationDTO
-from swagger_client.models.move_details_dto import MoveDetailsDTO
-from swagger_client.models.move_update_dto import MoveUpdateDTO
-from swagger_client.models.multi_line_string import MultiLineString
-from swagger_client.models.multi_point import MultiPoint
-from swagger_client.models.multi_polygon import MultiPolygon
-from swagger_client.models.named_resource_dto import NamedResourceDTO
-from swagger_client.models.named_resource_dto_experiment_model import NamedResourceDTOExperimentModel
-from swagger_client.models.named_resource_dto_facility_model import NamedResourceDTOFacilityModel
-from swagger_client.models.named_resource_dto_factor_level_model import NamedResourceDTOFactorLevelModel
-from swagger_client.models.named_resource_dto_group_model import NamedResourceDTOGroupModel
-from swagger_client.models.named_resource_dto_organization_model import NamedResourceDTOOrganizationModel
-from swagger_client.models.named_resource_dto_project_model import NamedResourceDTOProjectModel
-from swagger_client.models.named_resource_dto_site_model import NamedResourceDTOSiteModel
-from swagger_client.models.named_resource_dto_variable_model import NamedResourceDTOVariableModel
-from swagger_client.models.named_resource_dto_variables_group_model import NamedResourceDTOVariablesGroupModel
-from swagger_client.models.owl_class_property_restriction_dto import OWLClassPropertyRestrictionDTO
-from swagger_client.models.object_named_resource_dto import ObjectNamedResourceDTO
-from swagger_client.models.object_uri_response import ObjectUriResponse
-from swagger_client.models.ontology_agroportal_dto import OntologyAgroportalDTO
-from swagger_client.models.orcid_record_dto import OrcidRecordDTO
-from swagger_client.models.order_by import OrderBy
-from swagger_client.models.organization_creation_dto import OrganizationCreationDTO
-from swagger_client.models.organization_dag_dto import OrganizationDagDTO
-from swagger_client.models.organization_get_dto import OrganizationGetDTO
-from swagger_client.models.organization_update_dto import OrganizationUpdateDTO
-from swagger_client.models.pagination_dto import PaginationDTO
-from swagger_client.models.person_dto import PersonDTO
-from swagger_client.models.point import Point
-from swagger_client.models.polygon import Polygon
-from swagger_client.models.position_creation_dto import PositionCreationDTO
-from swagger_client.models.position_get_dto import PositionGetDTO
-from swagger_client.models.position_get_detail_dto import PositionGetDetailDTO
-from swagger_client.models.prefix_mapping import PrefixMapping
-from swagger_client.models.profile_creation_dto import ProfileCreationDTO
-from swagger_client.models.profile_get_dto import ProfileGetDTO
-from swagger_client.models.profile_update_dto import ProfileUpdateDTO
-from swagger_client.models.project_creation_dto import ProjectCreationDTO
-from swagger_client.models.project_get_dto import ProjectGetDTO
-from swagger_client.models.project_get_detail_dto import ProjectGetDetailDTO
-from swagger_client.models.properties_by_domain_dto import PropertiesByDomainDTO
-from swagger_client.models.prov_entity_model import ProvEntityModel
-from swagger_client.models.provenance_creation_dto import ProvenanceCreationDTO
-from swagger_client.models.provenance_get_dto import ProvenanceGetDTO
-from swagger_client.models.provenance_update_dto import ProvenanceUpdateDTO
-from swagger_client.models.rdf_datatype import RDFDatatype
-from swagger_client.models.rdf_list import RDFList
-from swagger_client.models.rdf_node import RDFNode
-from swagger_client.models.rdf_object_relation_dto import RDFObjectRelationDTO
-from swagger_client.models.rdf_property_dto import RDFPropertyDTO
-from swagger_client.models.rdf_property_get_dto import RDFPropertyGetDTO
-from swagger_client.models.rdf_reader_i import RDFReaderI
-from swagger_client.models.rdf_type_dto import RDFTypeDTO
-from swagger_client.models.rdf_type_translated_dto import RDFTypeTranslatedDTO
-from swagger_client.models.rdf_writer_i import RDFWriterI
-from swagger_client.models.resource import Resource
-from swagger_client.models.resource_tree_dto import ResourceTreeDTO
-from swagger_client.models.route_dto import RouteDTO
-from swagger_client.models.sparql_label import SPARQLLabel
-from swagger_client.models.sparql_model_relation import SPARQLModelRelation
-from swagger_client.models.scientific_object_creation_dto import ScientificObjectCreationDTO
-from swagger_client.models.scientific_object_detail_by_experiments_dto import ScientificObjectDetailByExperimentsDTO
-from swagger_client.models.scientific_object_detail_dto import ScientificObjectDetailDTO
-from swagger_client.models.scientific_object_export_dto import ScientificObjectExportDTO
-from swagger_client.models.scientific_object_node_dto import ScientificObjectNodeDTO
-from swagger_client.models.scientific_object_node_with_children_dto import ScientificObjectNodeWithChildrenDTO
-from swagger_client.models.scientific_object_update_dto import ScientificObjectUpdateDTO
-from swagger_client.models.seq import Seq
-from swagger_client.models.shared_resource_instance_dto import SharedResourceInstanceDTO
-from swagger_client.models.site_address_dto import SiteAddressDTO
-from swagger_client.models.site_creation_dto import SiteCreationDTO
-from swagger_client.models.site_get_dto import SiteGetDTO
-from swagger_client.models.site_get_list_dto import SiteGetListDTO
-from swagger_client.models.site_get_with_geometry_dto import SiteGetWithGeometryDTO
-from swagger_client.models.site_update_dto import SiteUpdateDTO
-from swagger_client.models.species_dto import SpeciesDTO
-from swagger_client.models.statement import Statement
-from swagger_client.models.status_dto import StatusDTO
-from swagger_client.models.target_position_creation_dto import TargetPositionCreationDTO
-from swagger_client.models.target_position_get_dto import TargetPositionGetDTO
-from swagger_client.models.theme_config_dto import ThemeConfigDTO
-from swagger_client.models.token_get_dto import TokenGetDTO
-from swagger_client.models.transaction_handler import TransactionHandler
-from swagger_client.models.uri_global_search_dto import URIGlobalSearchDTO
-from swagger_client.models.uri_types_dto import URITypesDTO
-from swagger_client.models.uris_list_post_dto import URIsListPostDTO
-from swagger_client.models.unit_creation_dto import UnitCreationDTO
-from swagger_client.models.unit_details_dto import UnitDetailsDTO
-from swagger_client.models.unit_get_dto import UnitGetDTO
-from swagger_client.models.unit_update_dto import UnitUpdateDTO
-from swagger_client.models.user_creation_dto import UserCreationDTO
-from swagger_client.models.user_front_config_dto import UserFrontConfigDTO
-from swagger_client.models.user_get_dto import UserGetDTO
-from swagger_client.models.user_update_dto import UserUpdateDTO
-from swagger_client.models.variable_copy_response_dto import VariableCopyResponseDTO
-from swagger_client.models.variable_creation_dto import VariableCreationDTO
-from swagger_client.models.variable_datatype_dto import VariableDatatypeDTO
-from swagger_client.models.variable_details_dto import VariableDetailsDTO
-from swagger_client.models.variable_get_dto import VariableGetDTO
-from swagger_client.models.variable_update_dto import VariableUpdateDTO
-from swagger_client.models.variables_group_creation_dto import VariablesGroupCreationDTO
-from swagger_client.models.variables_group_get_dto import VariablesGroupGetDTO
-from swagger_client.models.variables_group_update_dto import VariablesGroupUpdateDTO
-from swagger_client.models.version_info_dto import VersionInfoDTO
-from swagger_client.models.vue_data_type_dto import VueDataTypeDTO
-from swagger_client.models.vue_object_type_dto import VueObjectTypeDTO
-from swagger_client.models.vue_rdf_type_dto import VueRDFTypeDTO
-from swagger_client.models.vue_rdf_type_parameter_dto import VueRDFTypeParameterDTO
-from swagger_client.models.vue_rdf_type_property_dto import VueRDFTypePropertyDTO
+_lazy_attributes = {
+    'AccountCreationDTO': 'swagger_client.models.account_creation_dto',
+    'AccountGetDTO': 'swagger_client.models.account_get_dto',
+    'AccountUpdateDTO': 'swagger_client.models.account_update_dto',
+    'ActivityCreationDTO': 'swagger_client.models.activity_creation_dto',
+    'ActivityGetDTO': 'swagger_client.models.activity_get_dto',
+    'AgentModel': 'swagger_client.models.agent_model',
+    'AgroportalLinksModel': 'swagger_client.models.agroportal_links_model',
+    'AgroportalOntologiesConfigDTO': 'swagger_client.models.agroportal_ontologies_config_dto',
+    'AgroportalTermDTO': 'swagger_client.models.agroportal_term_dto',
+    'Alt': 'swagger_client.models.alt',
+    'AnnotationCreationDTO': 'swagger_client.models.annotation_creation_dto',
+    'AnnotationGetDTO': 'swagger_client.models.annotation_get_dto',
+    'AnnotationModel': 'swagger_client.models.annotation_model',
+    'AnnotationUpdateDTO': 'swagger_client.models.annotation_update_dto',
+    'AnonId': 'swagger_client.models.anon_id',
+    'ApiContactInfoDTO': 'swagger_client.models.api_contact_info_dto',
+    'ApiExternalDocsDTO': 'swagger_client.models.api_external_docs_dto',
+    'ApiGitCommitDTO': 'swagger_client.models.api_git_commit_dto',
+    'ApiLicenseInfoDTO': 'swagger_client.models.api_license_info_dto',
+    'ApiModulesInfo': 'swagger_client.models.api_modules_info',
+    'AreaCreationDTO': 'swagger_client.models.area_creation_dto',
+    'AreaGetDTO': 'swagger_client.models.area_get_dto',
+    'AreaUpdateDTO': 'swagger_client.models.area_update_dto',
+    'AuthenticationDTO': 'swagger_client.models.authentication_dto',
+    'Bag': 'swagger_client.models.bag',
+    'BlankNodeId': 'swagger_client.models.blank_node_id',
+    'BrAPIv1CallDTO': 'swagger_client.models.br_apiv1_call_dto',
+    'BrAPIv1CallListResponse': 'swagger_client.models.br_apiv1_call_list_response',
+    'BrAPIv1DocumentationLinkDTO': 'swagger_client.models.br_apiv1_documentation_link_dto',
+    'BrAPIv1GermplasmDTO': 'swagger_client.models.br_apiv1_germplasm_dto',
+    'BrAPIv1GermplasmListResponse': 'swagger_client.models.br_apiv1_germplasm_list_response',
+    'BrAPIv1MethodDTO': 'swagger_client.models.br_apiv1_method_dto',
+    'BrAPIv1ObservationDTO': 'swagger_client.models.br_apiv1_observation_dto',
+    'BrAPIv1ObservationListResponse': 'swagger_client.models.br_apiv1_observation_list_response',
+    'BrAPIv1ObservationSummaryDTO': 'swagger_client.models.br_apiv1_observation_summary_dto',
+    'BrAPIv1ObservationUnitDTO': 'swagger_client.models.br_apiv1_observation_unit_dto',
+    'BrAPIv1ObservationUnitListResponse': 'swagger_client.models.br_apiv1_observation_unit_list_response',
+    'BrAPIv1ObservationUnitTreatmentDTO': 'swagger_client.models.br_apiv1_observation_unit_treatment_dto',
+    'BrAPIv1ObservationUnitXrefDTO': 'swagger_client.models.br_apiv1_observation_unit_xref_dto',
+    'BrAPIv1ObservationVariableDTO': 'swagger_client.models.br_apiv1_observation_variable_dto',
+    'BrAPIv1ObservationVariableListResponse': 'swagger_client.models.br_apiv1_observation_variable_list_response',
+    'BrAPIv1OntologyReferenceDTO': 'swagger_client.models.br_apiv1_ontology_reference_dto',
+    'BrAPIv1ScaleDTO': 'swagger_client.models.br_apiv1_scale_dto',
+    'BrAPIv1SeasonDTO': 'swagger_client.models.br_apiv1_season_dto',
+    'BrAPIv1SingleObservationVariableResponse': 'swagger_client.models.br_apiv1_single_observation_variable_response',
+    'BrAPIv1SingleStudyResponse': 'swagger_client.models.br_apiv1_single_study_response',
+    'BrAPIv1StudyDTO': 'swagger_client.models.br_apiv1_study_dto',
+    'BrAPIv1StudyListResponse': 'swagger_client.models.br_apiv1_study_list_response',
+    'BrAPIv1SuperStudyDTO': 'swagger_client.models.br_apiv1_super_study_dto',
+    'BrAPIv1TraitDTO': 'swagger_client.models.br_apiv1_trait_dto',
+    'BrapiDataResponsePart': 'swagger_client.models.brapi_data_response_part',
+    'BrapiDataResponsePartListBrAPIv1CallDTO': 'swagger_client.models.brapi_data_response_part_list_br_apiv1_call_dto',
+    'BrapiDataResponsePartListBrAPIv1GermplasmDTO': 'swagger_client.models.brapi_data_response_part_list_br_apiv1_germplasm_dto',
+    'BrapiDataResponsePartListBrAPIv1ObservationDTO': 'swagger_client.models.brapi_data_response_part_list_br_apiv1_observation_dto',
+    'BrapiDataResponsePartListBrAPIv1ObservationUnitDTO': 'swagger_client.models.brapi_data_response_part_list_br_apiv1_observation_unit_dto',
+    'BrapiDataResponsePartListBrAPIv1ObservationVariableDTO': 'swagger_client.models.brapi_data_response_part_list_br_apiv1_observation_variable_dto',
+    'BrapiDataResponsePartListBrAPIv1StudyDTO': 'swagger_client.models.brapi_data_response_part_list_br_apiv1_study_dto',
+    'BrapiDataResponsePartListFaidarev1CallDTO': 'swagger_client.models.brapi_data_response_part_list_faidarev1_call_dto',
+    'BrapiDataResponsePartListFaidarev1GermplasmDTO': 'swagger_client.models.brapi_data_response_part_list_faidarev1_germplasm_dto',
+    'BrapiDataResponsePartListFaidarev1LocationDTO': 'swagger_client.models.brapi_data_response_part_list_faidarev1_location_dto',
+    'BrapiDataResponsePartListFaidarev1ObservationVariableDTO': 'swagger_client.models.brapi_data_response_part_list_faidarev1_observation_variable_dto',
+    'BrapiDataResponsePartListFaidarev1StudyDTO': 'swagger_client.models.brapi_data_response_part_list_faidarev1_study_dto',
+    'BrapiDataResponsePartListFaidarev1TrialDTO': 'swagger_client.models.brapi_data_response_part_list_faidarev1_trial_dto',
+    'CSVCell': 'swagger_client.models.csv_cell',
+    'CSVDatatypeError': 'swagger_client.models.csv_datatype_error',
+    'CSVDuplicateURIError': 'swagger_client.models.csv_duplicate_uri_error',
+    'CSVURINotFoundError': 'swagger_client.models.csvuri_not_found_error',
+    'CSVValidationDTO': 'swagger_client.models.csv_validation_dto',
+    'CSVValidationModel': 'swagger_client.models.csv_validation_model',
+    'Capabilities': 'swagger_client.models.capabilities',
+    'CharacteristicCreationDTO': 'swagger_client.models.characteristic_creation_dto',
+    'CharacteristicDetailsDTO': 'swagger_client.models.characteristic_details_dto',
+    'CharacteristicGetDTO': 'swagger_client.models.characteristic_get_dto',
+    'CharacteristicUpdateDTO': 'swagger_client.models.characteristic_update_dto',
+    'CopyResourceDTO': 'swagger_client.models.copy_resource_dto',
+    'CountItemDTO': 'swagger_client.models.count_item_dto',
+    'CountItemPeriodDTO': 'swagger_client.models.count_item_period_dto',
+    'CountListItemDTO': 'swagger_client.models.count_list_item_dto',
+    'CountListItemPeriodDTO': 'swagger_client.models.count_list_item_period_dto',
+    'CredentialDTO': 'swagger_client.models.credential_dto',
+    'CredentialsGroupDTO': 'swagger_client.models.credentials_group_dto',
+    'Crs': 'swagger_client.models.crs',
+    'CsvHeader': 'swagger_client.models.csv_header',
+    'DashboardConfigDTO': 'swagger_client.models.dashboard_config_dto',
+    'DataCSVValidationDTO': 'swagger_client.models.data_csv_validation_dto',
+    'DataCSVValidationModel': 'swagger_client.models.data_csv_validation_model',
+    'DataComputedGetDTO': 'swagger_client.models.data_computed_get_dto',
+    'DataConfidenceDTO': 'swagger_client.models.data_confidence_dto',
+    'DataCreationDTO': 'swagger_client.models.data_creation_dto',
+    'DataFileGetDTO': 'swagger_client.models.data_file_get_dto',
+    'DataFilePathCreationDTO': 'swagger_client.models.data_file_path_creation_dto',
+    'DataGetDTO': 'swagger_client.models.data_get_dto',
+    'DataGetDetailsDTO': 'swagger_client.models.data_get_details_dto',
+    'DataGetSearchDTO': 'swagger_client.models.data_get_search_dto',
+    'DataProvenanceModel': 'swagger_client.models.data_provenance_model',
+    'DataSearchDTO': 'swagger_client.models.data_search_dto',
+    'DataSerieGetDTO': 'swagger_client.models.data_serie_get_dto',
+    'DataSimpleProvenanceGetDTO': 'swagger_client.models.data_simple_provenance_get_dto',
+    'DataUpdateDTO': 'swagger_client.models.data_update_dto',
+    'DataVariableSeriesGetDTO': 'swagger_client.models.data_variable_series_get_dto',
+    'DeviceCreationDTO': 'swagger_client.models.device_creation_dto',
+    'DeviceGetDTO': 'swagger_client.models.device_get_dto',
+    'DeviceGetDetailsDTO': 'swagger_client.models.device_get_details_dto',
+    'DocumentGetDTO': 'swagger_client.models.document_get_dto',
+    'EntityCreationDTO': 'swagger_client.models.entity_creation_dto',
+    'EntityDetailsDTO': 'swagger_client.models.entity_details_dto',
+    'EntityGetDTO': 'swagger_client.models.entity_get_dto',
+    'EntityUpdateDTO': 'swagger_client.models.entity_update_dto',
+    'ErrorDTO': 'swagger_client.models.error_dto',
+    'ErrorResponse': 'swagger_client.models.error_response',
+    'EventCreationDTO': 'swagger_client.models.event_creation_dto',
+    'EventDetailsDTO': 'swagger_client.models.event_details_dto',
+    'EventGetDTO': 'swagger_client.models.event_get_dto',
+    'EventUpdateDTO': 'swagger_client.models.event_update_dto',
+    'ExperimentCreationDTO': 'swagger_client.models.experiment_creation_dto',
+    'ExperimentGetDTO': 'swagger_client.models.experiment_get_dto',
+    'ExperimentGetListDTO': 'swagger_client.models.experiment_get_list_dto',
+    'FacilityAddressDTO': 'swagger_client.models.facility_address_dto',
+    'FacilityCreationDTO': 'swagger_client.models.facility_creation_dto',
+    'FacilityGetDTO': 'swagger_client.models.facility_get_dto',
+    'FacilityNamedDTO': 'swagger_client.models.facility_named_dto',
+    'FacilityUpdateDTO': 'swagger_client.models.facility_update_dto',
+    'FactorCategoryGetDTO': 'swagger_client.models.factor_category_get_dto',
+    'FactorCreationDTO': 'swagger_client.models.factor_creation_dto',
+    'FactorDetailsGetDTO': 'swagger_client.models.factor_details_get_dto',
+    'FactorGetDTO': 'swagger_client.models.factor_get_dto',
+    'FactorLevelCreationDTO': 'swagger_client.models.factor_level_creation_dto',
+    'FactorLevelGetDTO': 'swagger_client.models.factor_level_get_dto',
+    'FactorLevelGetDetailDTO': 'swagger_client.models.factor_level_get_detail_dto',
+    'FactorUpdateDTO': 'swagger_client.models.factor_update_dto',
+    'Faidarev1CallDTO': 'swagger_client.models.faidarev1_call_dto',
+    'Faidarev1CallListResponse': 'swagger_client.models.faidarev1_call_list_response',
+    'Faidarev1ContactDTO': 'swagger_client.models.faidarev1_contact_dto',
+    'Faidarev1DataLinkDTO': 'swagger_client.models.faidarev1_data_link_dto',
+    'Faidarev1DatasetAuthorshipDTO': 'swagger_client.models.faidarev1_dataset_authorship_dto',
+    'Faidarev1GermplasmDTO': 'swagger_client.models.faidarev1_germplasm_dto',
+    'Faidarev1GermplasmListResponse': 'swagger_client.models.faidarev1_germplasm_list_response',
+    'Faidarev1LastUpdateDTO': 'swagger_client.models.faidarev1_last_update_dto',
+    'Faidarev1LocationDTO': 'swagger_client.models.faidarev1_location_dto',
+    'Faidarev1LocationListResponse': 'swagger_client.models.faidarev1_location_list_response',
+    'Faidarev1MethodDTO': 'swagger_client.models.faidarev1_method_dto',
+    'Faidarev1ObservationVariableDTO': 'swagger_client.models.faidarev1_observation_variable_dto',
+    'Faidarev1ObservationVariableListResponse': 'swagger_client.models.faidarev1_observation_variable_list_response',
+    'Faidarev1ScaleDTO': 'swagger_client.models.faidarev1_scale_dto',
+    'Faidarev1StudyDTO': 'swagger_client.models.faidarev1_study_dto',
+    'Faidarev1StudyListResponse': 'swagger_client.models.faidarev1_study_list_response',
+    'Faidarev1StudySummaryDTO': 'swagger_client.models.faidarev1_study_summary_dto',
+    'Faidarev1TraitDTO': 'swagger_client.models.faidarev1_trait_dto',
+    'Faidarev1TrialAdditionalInfoDTO': 'swagger_client.models.faidarev1_trial_additional_info_dto',
+    'Faidarev1TrialDTO': 'swagger_client.models.faidarev1_trial_dto',
+    'Faidarev1TrialListResponse': 'swagger_client.models.faidarev1_trial_list_response',
+    'FavoriteCreationDTO': 'swagger_client.models.favorite_creation_dto',
+    'FavoriteGetDTO': 'swagger_client.models.favorite_get_dto',
+    'FavoriteGetGraphNameDTO': 'swagger_client.models.favorite_get_graph_name_dto',
+    'Feature': 'swagger_client.models.feature',
+    'FeatureCollection': 'swagger_client.models.feature_collection',
+    'FontConfigDTO': 'swagger_client.models.font_config_dto',
+    'FrontConfigDTO': 'swagger_client.models.front_config_dto',
+    'GeoJsonObject': 'swagger_client.models.geo_json_object',
+    'GeometryCollection': 'swagger_client.models.geometry_collection',
+    'GeometryDTO': 'swagger_client.models.geometry_dto',
+    'GermplasmCreationDTO': 'swagger_client.models.germplasm_creation_dto',
+    'GermplasmGetAllDTO': 'swagger_client.models.germplasm_get_all_dto',
+    'GermplasmGetSingleDTO': 'swagger_client.models.germplasm_get_single_dto',
+    'GermplasmGroupCreationDTO': 'swagger_client.models.germplasm_group_creation_dto',
+    'GermplasmGroupGetDTO': 'swagger_client.models.germplasm_group_get_dto',
+    'GermplasmGroupGetWithDetailsDTO': 'swagger_client.models.germplasm_group_get_with_details_dto',
+    'GermplasmGroupUpdateDTO': 'swagger_client.models.germplasm_group_update_dto',
+    'GermplasmSearchFilter': 'swagger_client.models.germplasm_search_filter',
+    'GermplasmUpdateDTO': 'swagger_client.models.germplasm_update_dto',
+    'Graph': 'swagger_client.models.graph',
+    'GraphConfigDTO': 'swagger_client.models.graph_config_dto',
+    'GraphEventManager': 'swagger_client.models.graph_event_manager',
+    'GroupCreationDTO': 'swagger_client.models.group_creation_dto',
+    'GroupDTO': 'swagger_client.models.group_dto',
+    'GroupUpdateDTO': 'swagger_client.models.group_update_dto',
+    'GroupUserProfileDTO': 'swagger_client.models.group_user_profile_dto',
+    'InterestEntityCreationDTO': 'swagger_client.models.interest_entity_creation_dto',
+    'InterestEntityDetailsDTO': 'swagger_client.models.interest_entity_details_dto',
+    'InterestEntityGetDTO': 'swagger_client.models.interest_entity_get_dto',
+    'InterestEntityUpdateDTO': 'swagger_client.models.interest_entity_update_dto',
+    'LineString': 'swagger_client.models.line_string',
+    'ListItemDTO': 'swagger_client.models.list_item_dto',
+    'Literal': 'swagger_client.models.literal',
+    'LngLatAlt': 'swagger_client.models.lng_lat_alt',
+    'Lock': 'swagger_client.models.lock',
+    'MatomoConfigDTO': 'swagger_client.models.matomo_config_dto',
+    'MenuItemDTO': 'swagger_client.models.menu_item_dto',
+    'MetadataDTO': 'swagger_client.models.metadata_dto',
+    'MethodCreationDTO': 'swagger_client.models.method_creation_dto',
+    'MethodDetailsDTO': 'swagger_client.models.method_details_dto',
+    'MethodGetDTO': 'swagger_client.models.method_get_dto',
+    'MethodUpdateDTO': 'swagger_client.models.method_update_dto',
+    'MetricDTO': 'swagger_client.models.metric_dto',
+    'MetricPeriodDTO': 'swagger_client.models.metric_period_dto',
+    'Model': 'swagger_client.models.model',
+    'ModelProperty': 'swagger_client.models.model_property',
+    'MotivationGetDTO': 'swagger_client.models.motivation_get_dto',
+    'MotivationModel': 'swagger_client.models.motivation_model',
+    'MoveCreationDTO': 'swagger_client.models.move_creation_dto',
+    'MoveDetailsDTO': 'swagger_client.models.move_details_dto',
+    'MoveUpdateDTO': 'swagger_client.models.move_update_dto',
+    'MultiLineString': 'swagger_client.models.multi_line_string',
+    'MultiPoint': 'swagger_client.models.multi_point',
+    'MultiPolygon': 'swagger_client.models.multi_polygon',
+    'NamedResourceDTO': 'swagger_client.models.named_resource_dto',
+    'NamedResourceDTOExperimentModel': 'swagger_client.models.named_resource_dto_experiment_model',
+    'NamedResourceDTOFacilityModel': 'swagger_client.models.named_resource_dto_facility_model',
+    'NamedResourceDTOFactorLevelModel': 'swagger_client.models.named_resource_dto_factor_level_model',
+    'NamedResourceDTOGroupModel': 'swagger_client.models.named_resource_dto_group_model',
+    'NamedResourceDTOOrganizationModel': 'swagger_client.models.named_resource_dto_organization_model',
+    'NamedResourceDTOProjectModel': 'swagger_client.models.named_resource_dto_project_model',
+    'NamedResourceDTOSiteModel': 'swagger_client.models.named_resource_dto_site_model',
+    'NamedResourceDTOVariableModel': 'swagger_client.models.named_resource_dto_variable_model',
+    'NamedResourceDTOVariablesGroupModel': 'swagger_client.models.named_resource_dto_variables_group_model',
+    'OWLClassPropertyRestrictionDTO': 'swagger_client.models.owl_class_property_restriction_dto',
+    'ObjectNamedResourceDTO': 'swagger_client.models.object_named_resource_dto',
+    'ObjectUriResponse': 'swagger_client.models.object_uri_response',
+    'OntologyAgroportalDTO': 'swagger_client.models.ontology_agroportal_dto',
+    'OrcidRecordDTO': 'swagger_client.models.orcid_record_dto',
+    'OrderBy': 'swagger_client.models.order_by',
+    'OrganizationCreationDTO': 'swagger_client.models.organization_creation_dto',
+    'OrganizationDagDTO': 'swagger_client.models.organization_dag_dto',
+    'OrganizationGetDTO': 'swagger_client.models.organization_get_dto',
+    'OrganizationUpdateDTO': 'swagger_client.models.organization_update_dto',
+    'PaginationDTO': 'swagger_client.models.pagination_dto',
+    'PersonDTO': 'swagger_client.models.person_dto',
+    'Point': 'swagger_client.models.point',
+    'Polygon': 'swagger_client.models.polygon',
+    'PositionCreationDTO': 'swagger_client.models.position_creation_dto',
+    'PositionGetDTO': 'swagger_client.models.position_get_dto',
+    'PositionGetDetailDTO': 'swagger_client.models.position_get_detail_dto',
+    'PrefixMapping': 'swagger_client.models.prefix_mapping',
+    'ProfileCreationDTO': 'swagger_client.models.profile_creation_dto',
+    'ProfileGetDTO': 'swagger_client.models.profile_get_dto',
+    'ProfileUpdateDTO': 'swagger_client.models.profile_update_dto',
+    'ProjectCreationDTO': 'swagger_client.models.project_creation_dto',
+    'ProjectGetDTO': 'swagger_client.models.project_get_dto',
+    'ProjectGetDetailDTO': 'swagger_client.models.project_get_detail_dto',
+    'PropertiesByDomainDTO': 'swagger_client.models.properties_by_domain_dto',
+    'ProvEntityModel': 'swagger_client.models.prov_entity_model',
+    'ProvenanceCreationDTO': 'swagger_client.models.provenance_creation_dto',
+    'ProvenanceGetDTO': 'swagger_client.models.provenance_get_dto',
+    'ProvenanceUpdateDTO': 'swagger_client.models.provenance_update_dto',
+    'RDFDatatype': 'swagger_client.models.rdf_datatype',
+    'RDFList': 'swagger_client.models.rdf_list',
+    'RDFNode': 'swagger_client.models.rdf_node',
+    'RDFObjectRelationDTO': 'swagger_client.models.rdf_object_relation_dto',
+    'RDFPropertyDTO': 'swagger_client.models.rdf_property_dto',
+    'RDFPropertyGetDTO': 'swagger_client.models.rdf_property_get_dto',
+    'RDFReaderI': 'swagger_client.models.rdf_reader_i',
+    'RDFTypeDTO': 'swagger_client.models.rdf_type_dto',
+    'RDFTypeTranslatedDTO': 'swagger_client.models.rdf_type_translated_dto',
+    'RDFWriterI': 'swagger_client.models.rdf_writer_i',
+    'Resource': 'swagger_client.models.resource',
+    'ResourceTreeDTO': 'swagger_client.models.resource_tree_dto',
+    'RouteDTO': 'swagger_client.models.route_dto',
+    'SPARQLLabel': 'swagger_client.models.sparql_label',
+    'SPARQLModelRelation': 'swagger_client.models.sparql_model_relation',
+    'ScientificObjectCreationDTO': 'swagger_client.models.scientific_object_creation_dto',
+    'ScientificObjectDetailByExperimentsDTO': 'swagger_client.models.scientific_object_detail_by_experiments_dto',
+    'ScientificObjectDetailDTO': 'swagger_client.models.scientific_object_detail_dto',
+    'ScientificObjectExportDTO': 'swagger_client.models.scientific_object_export_dto',
+    'ScientificObjectNodeDTO': 'swagger_client.models.scientific_object_node_dto',
+    'ScientificObjectNodeWithChildrenDTO': 'swagger_client.models.scientific_object_node_with_children_dto',
+    'ScientificObjectUpdateDTO': 'swagger_client.models.scientific_object_update_dto',
+    'Seq': 'swagger_client.models.seq',
+    'SharedResourceInstanceDTO': 'swagger_client.models.shared_resource_instance_dto',
+    'SiteAddressDTO': 'swagger_client.models.site_address_dto',
+    'SiteCreationDTO': 'swagger_client.models.site_creation_dto',
+    'SiteGetDTO': 'swagger_client.models.site_get_dto',
+    'SiteGetListDTO': 'swagger_client.models.site_get_list_dto',
+    'SiteGetWithGeometryDTO': 'swagger_client.models.site_get_with_geometry_dto',
+    'SiteUpdateDTO': 'swagger_client.models.site_update_dto',
+    'SpeciesDTO': 'swagger_client.models.species_dto',
+    'Statement': 'swagger_client.models.statement',
+    'StatusDTO': 'swagger_client.models.status_dto',
+    'TargetPositionCreationDTO': 'swagger_client.models.target_position_creation_dto',
+    'TargetPositionGetDTO': 'swagger_client.models.target_position_get_dto',
+    'ThemeConfigDTO': 'swagger_client.models.theme_config_dto',
+    'TokenGetDTO': 'swagger_client.models.token_get_dto',
+    'TransactionHandler': 'swagger_client.models.transaction_handler',
+    'URIGlobalSearchDTO': 'swagger_client.models.uri_global_search_dto',
+    'URITypesDTO': 'swagger_client.models.uri_types_dto',
+    'URIsListPostDTO': 'swagger_client.models.uris_list_post_dto',
+    'UnitCreationDTO': 'swagger_client.models.unit_creation_dto',
+    'UnitDetailsDTO': 'swagger_client.models.unit_details_dto',
+    'UnitGetDTO': 'swagger_client.models.unit_get_dto',
+    'UnitUpdateDTO': 'swagger_client.models.unit_update_dto',
+    'UserCreationDTO': 'swagger_client.models.user_creation_dto',
+    'UserFrontConfigDTO': 'swagger_client.models.user_front_config_dto',
+    'UserGetDTO': 'swagger_client.models.user_get_dto',
+    'UserUpdateDTO': 'swagger_client.models.user_update_dto',
+    'VariableCopyResponseDTO': 'swagger_client.models.variable_copy_response_dto',
+    'VariableCreationDTO': 'swagger_client.models.variable_creation_dto',
+    'VariableDatatypeDTO': 'swagger_client.models.variable_datatype_dto',
+    'VariableDetailsDTO': 'swagger_client.models.variable_details_dto',
+    'VariableGetDTO': 'swagger_client.models.variable_get_dto',
+    'VariableUpdateDTO': 'swagger_client.models.variable_update_dto',
+    'VariablesGroupCreationDTO': 'swagger_client.models.variables_group_creation_dto',
+    'VariablesGroupGetDTO': 'swagger_client.models.variables_group_get_dto',
+    'VariablesGroupUpdateDTO': 'swagger_client.models.variables_group_update_dto',
+    'VersionInfoDTO': 'swagger_client.models.version_info_dto',
+    'VueDataTypeDTO': 'swagger_client.models.vue_data_type_dto',
+    'VueObjectTypeDTO': 'swagger_client.models.vue_object_type_dto',
+    'VueRDFTypeDTO': 'swagger_client.models.vue_rdf_type_dto',
+    'VueRDFTypeParameterDTO': 'swagger_client.models.vue_rdf_type_parameter_dto',
+    'VueRDFTypePropertyDTO': 'swagger_client.models.vue_rdf_type_property_dto',
+}
+
+__all__ = sorted(_lazy_attributes)
+
+__getattr__, __dir__ = lazy_import.attach(__name__, _lazy_attributes)
+if __getattr__ is None:
+    del __getattr__, __dir__
@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import binascii
+import io
+import os
+
+import six
+
+
+# size of the reads of file contents
+CHUNK_SIZE = 1 << 16
+
+
+class FileContent(object):
+    """Content of a file part read from disk, or from a file object, only
+    when the body is sent.
+
+    :param source: path of the file, or binary file object.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def __len__(self):
+        return self.size()
+
+    def size(self):
+        """Returns the number of bytes left to send, or None if unknown."""
+        if isinstance(self.source, six.string_types):
+            return os.path.getsize(self.source)
+        try:
+            position = self.source.tell()
+            self.source.seek(0, io.SEEK_END)
+            end = self.source.tell()
+            self.source.seek(position)
+            return end - position
+        except (AttributeError, IOError, OSError, ValueError):
+            return None
+
+    def open(self):
+        """Returns a binary file object positioned at the content."""
+        if isinstance(self.source, six.string_types):
+            return io.open(self.source, 'rb')
+        return self.source
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """Yields the content by chunks of `chunk_size` bytes."""
+        f = self.open()
+        start = None
+        try:
+            if f is self.source:
+                # a file object is sent again from the same position on retry
+                try:
+                    start = f.tell()
+                except (AttributeError, IOError, OSError):
+                    pass
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                yield chunk
+        finally:
+            if f is not self.source:
+                f.close()
+            elif start is not None:
+                f.seek(start)
+
+
+class MultipartEncoder(object):
+    """`multipart/form-data` body streamed from its fields.
+
+    Plain fields are encoded at once; file fields, given as
+    (filename, content, mimetype) where content is bytes, str or a
+    FileContent, are read by chunks of `chunk_size` bytes while the body
+    is sent, so memory stays flat whatever the size of the files. When the
+    size of every file is known, `len()` gives the Content-Length of the
+    body; otherwise it is None and the body is sent with chunked transfer
+    encoding. Iterating the encoder again yields the body again.
+
+    :param fields: list of (name, value) tuples.
+    :param boundary: multipart boundary, random by default.
+    :param chunk_size: size of the reads of file contents.
+    """
+
+    def __init__(self, fields, boundary=None, chunk_size=CHUNK_SIZE):
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode()
+        self.chunk_size = chunk_size
+        # bytes, or FileContent, in body order
+        self._parts = []
+        for name, value in fields:
+            if isinstance(value, tuple):
+                filename, content, mimetype = value
+                self._parts.append(self._header(
+                    name, filename, mimetype or 'application/octet-stream'))
+                if isinstance(content, six.text_type):
+                    content = content.encode('utf-8')
+                self._parts.append(content)
+            else:
+                if not isinstance(value, (six.text_type, bytes)):
+                    value = str(value)
+                if isinstance(value, six.text_type):
+                    value = value.encode('utf-8')
+                self._parts.append(self._header(name) + value)
+            self._parts.append(b'\r\n')
+        self._parts.append(('--%s--\r\n' % self.boundary).encode('ascii'))
+
+    @property
+    def content_type(self):
+        return 'multipart/form-data; boundary=%s' % self.boundary
+
+    def length(self):
+        """Returns the size of the body in bytes, or None if unknown."""
+        total = 0
+        for part in self._parts:
+            size = part.size() if isinstance(part, FileContent) else len(part)
+            if size is None:
+                return None
+            total += size
+        return total
+
+    def headers(self):
+        """Returns the Content-Type and, when known, Content-Length headers
+        of the body."""
+        headers = {'Content-Type': self.content_type}
+        length = self.length()
+        if length is not None:
+            headers['Content-Length'] = str(length)
+        return headers
+
+    def __iter__(self):
+        for part in self._parts:
+            if isinstance(part, FileContent):
+                for chunk in part.chunks(self.chunk_size):
+                    yield chunk
+            elif len(part) > self.chunk_size:
+                # bytes built in memory, still sent by chunks
+                view = memoryview(part)
+                for i in range(0, len(part), self.chunk_size):
+                    yield view[i:i + self.chunk_size].tobytes()
+            else:
+                yield part
+
+    def to_bytes(self):
+        """Returns the whole body, for tests and small bodies."""
+        return b''.join(self)
+
+    def _header(self, name, filename=None, mimetype=None):
+        disposition = 'form-data; name="%s"' % _quote(name)
+        if filename is not None:
+            disposition += '; filename="%s"' % _quote(filename)
+        lines = ['--%s' % self.boundary,
+                 'Content-Disposition: %s' % disposition]
+        if mimetype is not None:
+            lines.append('Content-Type: %s' % mimetype)
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+
+def _quote(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"')
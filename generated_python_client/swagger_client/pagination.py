@@ -0,0 +1,345 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from collections import deque
+import itertools
+from multiprocessing.pool import ThreadPool
+import time
+
+import six
+from six.moves import queue
+import urllib3
+
+from swagger_client.rest import ApiException
+from swagger_client.retry import own_retries
+
+
+def is_retryable(error):
+    """Tells whether a failed page request is worth retrying.
+
+    Connection errors, rate limiting (429) and server errors (5xx) are;
+    other client errors are not.
+    """
+    if isinstance(error, ApiException):
+        return not error.status or error.status == 429 or error.status >= 500
+    return isinstance(error, urllib3.exceptions.HTTPError)
+
+
+def call_with_retries(func, args=(), kwargs=None, retries=3, backoff=0.5):
+    """Calls `func(*args, **kwargs)`, retrying it on retryable errors.
+
+    :param retries: number of retries.
+    :param backoff: delay in seconds before the first retry, doubled on
+                    each further retry.
+    :return: the result of `func`.
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **(kwargs or {}))
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+            time.sleep(backoff * 2 ** attempt)
+            attempt += 1
+
+
+def split_page(response):
+    """Splits a search response into its items and pagination.
+
+    :param response: deserialized response of a `search_*` method, either
+                     a ResponseEnvelope or the bare result list.
+    :return: tuple (list of items, PaginationDTO or None).
+    """
+    if hasattr(response, 'result') and hasattr(response, 'metadata'):
+        metadata = response.metadata
+        pagination = getattr(metadata, 'pagination', None)
+        return list(response.result or []), pagination
+    return list(response or []), None
+
+
+class Paginator(object):
+    """Lazily iterates over every result of a paged `search_*` method.
+
+    While the items of page N are consumed, the next pages are already
+    being fetched on the api client's thread pool (`async_req=True`). At
+    most `prefetch` pages are requested ahead, so no more than
+    `prefetch + 1` pages are held in memory at once.
+
+    Iteration stops on the last page announced by the response envelope
+    (`PaginationDTO.has_next_page` / `total_pages`), or, when the response
+    carries no pagination, on the first page shorter than `page_size`.
+
+    >>> paginator = Paginator(VariablesApi(client).search_variables, token,
+    ...                       name='Leaf', page_size=500)
+    >>> for variable in paginator:
+    ...     print(variable.uri)
+
+    :param api_method: bound `search_*` method of a generated API instance.
+    :param args: positional arguments of the method.
+    :param page_size: number of results per page.
+    :param page: first page to fetch (pages are numbered from 0).
+    :param prefetch: number of pages fetched ahead of the one consumed.
+    :param kwargs: other keyword arguments of the method.
+    """
+
+    def __init__(self, api_method, *args, **kwargs):
+        self.api_method = api_method
+        self.page_size = kwargs.pop('page_size', 100)
+        self.first_page = kwargs.pop('page', 0)
+        self.prefetch = kwargs.pop('prefetch', 1)
+        if self.page_size < 1:
+            raise ValueError("Invalid value for `page_size`, must be a value "
+                             "greater than or equal to `1`")
+        if self.prefetch < 0:
+            raise ValueError("Invalid value for `prefetch`, must be a value "
+                             "greater than or equal to `0`")
+        self.args = args
+        self.kwargs = kwargs
+
+    def fetch(self, page, async_req=False):
+        """Requests a single page.
+
+        :param page: page number.
+        :param async_req: return the pending request instead of its result.
+        :return: the deserialized response, or the request thread.
+        """
+        return self.api_method(*self.args, page=page,
+                               page_size=self.page_size,
+                               async_req=async_req, **self.kwargs)
+
+    def last_page(self, page, size, pagination):
+        """Returns the number of the last page, or None if not known yet.
+
+        :param page: number of the page just received.
+        :param size: number of items of that page.
+        :param pagination: its PaginationDTO, if any.
+        """
+        if pagination is not None:
+            if pagination.has_next_page is False:
+                return page
+            if pagination.total_pages is not None:
+                return pagination.total_pages - 1
+            return None
+        if size < self.page_size:
+            return page
+        return None
+
+    def pages(self):
+        """Yields the items of each page, as lists, in page order."""
+        # (page, pending request) of the pages fetched ahead
+        pending = deque()
+        page = next_page = self.first_page
+        last_page = None
+        while last_page is None or page <= last_page:
+            if not pending:
+                pending.append((next_page,
+                                self.fetch(next_page, async_req=True)))
+                next_page += 1
+            page, request = pending.popleft()
+            items, pagination = split_page(request.get())
+            if not items:
+                return
+            last_page = self.last_page(page, len(items), pagination)
+
+            # keep `prefetch` pages in flight while this one is consumed
+            while (len(pending) < self.prefetch and
+                   (last_page is None or next_page <= last_page)):
+                pending.append((next_page,
+                                self.fetch(next_page, async_req=True)))
+                next_page += 1
+
+            yield items
+            page += 1
+
+    def __iter__(self):
+        for items in self.pages():
+            for item in items:
+                yield item
+
+
+class FanOut(Paginator):
+    """Fetches the pages of a `search_*` method concurrently.
+
+    The first page is fetched alone; once it reveals the number of pages
+    (`PaginationDTO.total_pages`, or `total_count`), the others are fetched
+    by `parallelism` threads sharing the api client's connection pool. At
+    most `2 * parallelism` pages are requested ahead of the consumer.
+
+    A failed page is retried on its own, up to `retries` times with
+    exponential backoff, when the error is retryable (see is_retryable);
+    or by the RetryPolicy of the api client when it has one.
+
+    When the response carries no pagination, the pages are walked in
+    sequence as Paginator does.
+
+    :param api_method: bound `search_*` method of a generated API instance.
+    :param args: positional arguments of the method.
+    :param page_size: number of results per page.
+    :param parallelism: number of pages fetched at once.
+    :param ordered: yield the pages in page order; when False pages are
+                    yielded as soon as they arrive.
+    :param retries: number of retries of a failed page, when the api
+                    client has no RetryPolicy.
+    :param backoff: delay in seconds before the first retry, doubled on
+                    each further retry.
+    :param kwargs: other keyword arguments of the method.
+    """
+
+    def __init__(self, api_method, *args, **kwargs):
+        self.parallelism = kwargs.pop('parallelism', 4)
+        self.ordered = kwargs.pop('ordered', True)
+        self.retries = kwargs.pop('retries', 3)
+        self.backoff = kwargs.pop('backoff', 0.5)
+        if self.parallelism < 1:
+            raise ValueError("Invalid value for `parallelism`, must be a "
+                             "value greater than or equal to `1`")
+        kwargs.setdefault('prefetch', 0)
+        super(FanOut, self).__init__(api_method, *args, **kwargs)
+
+    def fetch_page(self, page):
+        """Fetches a page, retrying it on retryable errors.
+
+        :param page: page number.
+        :return: tuple (list of items, PaginationDTO or None).
+        """
+        retries = own_retries(self.api_method.__self__.api_client,
+                              self.retries)
+        return split_page(call_with_retries(self.fetch, (page,),
+                                            retries=retries,
+                                            backoff=self.backoff))
+
+    def _fetch_page(self, page):
+        # runs on the pool; errors are handed back to the consumer thread
+        try:
+            return page, self.fetch_page(page)[0], None
+        except Exception as e:
+            return page, None, e
+
+    def page_count(self, pagination):
+        """Returns the number of pages announced by the first page.
+
+        :param pagination: PaginationDTO of the first page, if any.
+        :return: int, or None if unknown.
+        """
+        if pagination is None:
+            return None
+        if pagination.total_pages is not None:
+            return pagination.total_pages
+        if pagination.total_count is not None:
+            return -(-pagination.total_count // self.page_size)
+        return None
+
+    def pages(self):
+        """Yields the items of each page, as lists."""
+        items, pagination = self.fetch_page(self.first_page)
+        if not items:
+            return
+        yield items
+
+        page_count = self.page_count(pagination)
+        if page_count is None:
+            # no page count to plan from: walk the pages in sequence
+            if self.last_page(self.first_page, len(items),
+                              pagination) is not None:
+                return
+            rest = Paginator(self.api_method, *self.args,
+                             page=self.first_page + 1,
+                             page_size=self.page_size,
+                             prefetch=self.parallelism, **self.kwargs)
+            for items in rest.pages():
+                yield items
+            return
+
+        remaining = six.moves.range(self.first_page + 1, page_count)
+        if self.ordered:
+            fetched = self._ordered(remaining)
+        else:
+            fetched = self._unordered(remaining)
+        for items in fetched:
+            if items:
+                yield items
+
+    def _ordered(self, pages):
+        pool = ThreadPool(self.parallelism)
+        pending = deque()
+
+        def submit(page):
+            pending.append(pool.apply_async(self._fetch_page, (page,)))
+
+        try:
+            pages = iter(pages)
+            for page in itertools.islice(pages, 2 * self.parallelism):
+                submit(page)
+            while pending:
+                page, items, error = pending.popleft().get()
+                if error is not None:
+                    raise error
+                page = next(pages, None)
+                if page is not None:
+                    submit(page)
+                yield items
+        finally:
+            pool.terminate()
+
+    def _unordered(self, pages):
+        pool = ThreadPool(self.parallelism)
+        done = queue.Queue()
+
+        def submit(page):
+            pool.apply_async(self._fetch_page, (page,), callback=done.put)
+
+        try:
+            pages = iter(pages)
+            in_flight = 0
+            for page in itertools.islice(pages, 2 * self.parallelism):
+                submit(page)
+                in_flight += 1
+            while in_flight:
+                page, items, error = done.get()
+                in_flight -= 1
+                if error is not None:
+                    raise error
+                page = next(pages, None)
+                if page is not None:
+                    submit(page)
+                    in_flight += 1
+                yield items
+        finally:
+            pool.terminate()
+
+
+def search_all(api_method, *args, **kwargs):
+    """Returns every result of a `search_*` method, fetching pages
+    concurrently once the first page gives their number.
+
+    >>> api = ScientificObjectsApi(client)
+    >>> for so in search_all(api.search_scientific_objects, token,
+    ...                      experiment=uri, page_size=1000, parallelism=8):
+    ...     print(so.uri)
+
+    See FanOut for the accepted arguments.
+
+    :return: iterator over the results.
+    """
+    return iter(FanOut(api_method, *args, **kwargs))
+
+
+def paginate(api_method, *args, **kwargs):
+    """Returns a Paginator over every result of a `search_*` method.
+
+    See Paginator for the accepted arguments.
+    """
+    return Paginator(api_method, *args, **kwargs)
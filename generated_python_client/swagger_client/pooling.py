@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import socket
+import threading
+import time
+
+import urllib3
+from urllib3.connection import HTTPConnection
+
+
+class PoolStats(object):
+    """Live statistics of the connection pools of a RESTClientObject.
+
+    `requests` counts the connections taken from the pools, one per request
+    sent, `connections_created` the TCP (and TLS) connections opened, so
+    that `connections_reused` is the number of requests sent over a kept
+    alive connection. `discarded` counts connections closed because the
+    pool was full when they were released, which happens with bursts of
+    more than `maxsize` concurrent requests when the pool does not block.
+    `wait_time` and `max_wait_time` are the seconds spent waiting for a
+    free connection of a blocking pool; `in_use` and `max_in_use` the
+    connections taken and not released yet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections_created = 0
+            self.discarded = 0
+            self.wait_time = 0.0
+            self.max_wait_time = 0.0
+            self.in_use = 0
+            self.max_in_use = 0
+
+    @property
+    def connections_reused(self):
+        return max(self.requests - self.connections_created, 0)
+
+    def as_dict(self):
+        """Returns a snapshot of the statistics."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'connections_created': self.connections_created,
+                'connections_reused': self.connections_reused,
+                'discarded': self.discarded,
+                'wait_time': self.wait_time,
+                'max_wait_time': self.max_wait_time,
+                'in_use': self.in_use,
+                'max_in_use': self.max_in_use,
+            }
+
+    def __repr__(self):
+        return 'PoolStats(%s)' % ', '.join(
+            '%s=%r' % item for item in sorted(self.as_dict().items()))
+
+    def _checkout(self, wait):
+        with self._lock:
+            self.requests += 1
+            self.wait_time += wait
+            self.max_wait_time = max(self.max_wait_time, wait)
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def _checkin(self, discarded):
+        with self._lock:
+            self.in_use -= 1
+            if discarded:
+                self.discarded += 1
+
+    def _connected(self):
+        with self._lock:
+            self.connections_created += 1
+
+
+def _instrumented_pool(pool_class, stats):
+    base = pool_class.ConnectionCls
+    connection_class = type('Instrumented' + base.__name__, (base,),
+                            {'connect': _counting_connect(base, stats)})
+
+    class InstrumentedPool(pool_class):
+        ConnectionCls = connection_class
+
+        def _get_conn(self, timeout=None):
+            start = time.time()
+            conn = super(InstrumentedPool, self)._get_conn(timeout)
+            stats._checkout(time.time() - start)
+            return conn
+
+        def _put_conn(self, conn):
+            pool = self.pool
+            full = pool is not None and pool.full()
+            try:
+                super(InstrumentedPool, self)._put_conn(conn)
+            finally:
+                stats._checkin(full and conn is not None)
+
+    InstrumentedPool.__name__ = 'Instrumented' + pool_class.__name__
+    return InstrumentedPool
+
+
+def _counting_connect(base, stats):
+    def connect(self):
+        stats._connected()
+        return base.connect(self)
+    return connect
+
+
+def instrument(pool_manager, stats):
+    """Makes the pools of a urllib3 PoolManager or ProxyManager report to
+    `stats`. Pools created before are left as they are."""
+    pool_manager.pool_classes_by_scheme = dict(
+        (scheme, _instrumented_pool(pool_class, stats))
+        for scheme, pool_class in pool_manager.pool_classes_by_scheme.items())
+    return pool_manager
+
+
+def keepalive_socket_options(idle):
+    """Returns the socket options enabling TCP keep-alive probes after
+    `idle` seconds of inactivity, where the platform supports it."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (('TCP_KEEPIDLE', idle), ('TCP_KEEPINTVL', idle),
+                        ('TCP_KEEPCNT', 3)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name),
+                            max(int(value), 1)))
+    return options
+
+
+def keepalive_socket_factory(idle):
+    """Returns a socket factory, as taken by aiohttp.TCPConnector, creating
+    sockets with the options of keepalive_socket_options."""
+    options = keepalive_socket_options(idle)
+
+    def create(addr_info):
+        family, type_, proto = addr_info[:3]
+        sock = socket.socket(family, type_, proto)
+        for option in options:
+            sock.setsockopt(*option)
+        return sock
+    return create
+
+
+def default_timeout(configuration):
+    """Returns the urllib3 Timeout of the requests sent with no
+    `_request_timeout`, from `connect_timeout` and `read_timeout`."""
+    if (configuration.connect_timeout is None and
+            configuration.read_timeout is None):
+        return urllib3.Timeout.DEFAULT_TIMEOUT
+    return urllib3.Timeout(connect=configuration.connect_timeout,
+                           read=configuration.read_timeout)
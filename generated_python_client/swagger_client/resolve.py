@@ -0,0 +1,232 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import re
+
+from swagger_client.rest import ApiException
+
+
+# http:, https: or urn:, or any scheme followed by //, then no blank
+_URI = re.compile(r'^(https?:|urn:|[A-Za-z][A-Za-z0-9+.-]*://)\S+$',
+                  re.IGNORECASE)
+# prefix, then no blank: a prefixed URI, as dev:so1, or a name, as Plot:12
+_PREFIXED = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:\S+$')
+
+
+def is_uri(reference):
+    """Tells whether a reference is written as a URI rather than a name.
+
+    Prefixed URIs, as `dev:so1`, cannot be told from names such as
+    `Plot:12`, and are not taken as URIs; see ResourceResolver.
+    """
+    return bool(_URI.match(reference))
+
+
+def name_pattern(name):
+    """Returns the search regex matching exactly `name`."""
+    return '^%s$' % re.escape(name)
+
+
+class ResourceResolver(object):
+    """Resolves references to resources, given as names or URIs, to the
+    resources, with an in-memory cache.
+
+    `resolve` looks every reference not cached yet up at once: URIs by
+    chunks of `batch_size` with `get_by_uris`, names one request each with
+    `search_by_name`, all requests being sent asynchronously over the api
+    client's thread pool. Resolving the references of a whole file thus
+    costs O(distinct references) requests, and looking a reference up
+    afterwards none.
+
+    A name resolves to the only resource of that exact name; names matching
+    no resource or several resources, and unknown URIs, resolve to None.
+    A name which may be a prefixed URI, as `dev:so1`, and matches no
+    resource by name is then looked up as a URI.
+    When `details` is set, the resources found by name are looked up again
+    by URI, in batches, for searches returning less than `get_by_uris`.
+
+    >>> variables = ResourceResolver(
+    ...     lambda uris, **kw: api.get_variables_by_uris(uris, token, **kw),
+    ...     lambda name, **kw: api.search_variables(
+    ...         token, name=name_pattern(name), **kw))
+    >>> variables.resolve(['Plant height', 'http://.../variables/v2'])
+    >>> variables.uri('Plant height')
+
+    :param get_by_uris: callable(uris, **kwargs) returning the resources of
+                        a list of URIs, passing `async_req` on.
+    :param search_by_name: callable(name, **kwargs) returning the resources
+                           matching a name, passing `async_req` on.
+    :param batch_size: number of URIs looked up per request.
+    :param details: whether to look the resources found by name up by URI.
+    """
+
+    def __init__(self, get_by_uris, search_by_name, batch_size=100,
+                 details=False):
+        self.get_by_uris = get_by_uris
+        self.search_by_name = search_by_name
+        self.batch_size = batch_size
+        self.details = details
+        # reference -> resource, or None if unknown
+        self._cache = {}
+        self.ambiguous = set()
+        self.requests = 0
+
+    def __contains__(self, reference):
+        return reference in self._cache
+
+    def resolve(self, references):
+        """Looks the references not cached yet up.
+
+        :param references: iterable of names and URIs.
+        :return: the set of references that resolved to no resource.
+        """
+        missing = set(references) - set(self._cache)
+        uris = sorted(r for r in missing if is_uri(r))
+        names = sorted(r for r in missing if not is_uri(r))
+        self._fetch(self._uri_calls(uris) + [
+            ([name], False, self._call(self.search_by_name, name))
+            for name in names])
+
+        prefixed = [name for name in names if self._cache[name] is None and
+                    name not in self.ambiguous and _PREFIXED.match(name)]
+        self._fetch(self._uri_calls(prefixed))
+
+        if self.details and names:
+            found = dict((name, self._cache[name].uri) for name in names
+                         if self._cache[name] is not None and
+                         name not in prefixed)
+            self._fetch(self._uri_calls(
+                sorted(set(found.values()) - set(self._cache))))
+            for name, uri in found.items():
+                if self._cache.get(uri) is not None:
+                    self._cache[name] = self._cache[uri]
+        return set(r for r in missing if self._cache.get(r) is None)
+
+    def _uri_calls(self, uris):
+        chunks = [uris[i:i + self.batch_size]
+                  for i in range(0, len(uris), self.batch_size)]
+        return [(chunk, True, self._call(self.get_by_uris, chunk))
+                for chunk in chunks]
+
+    def _fetch(self, threads):
+        """Stores the resources of (references, by_uri, thread) calls."""
+        for references, by_uri, thread in threads:
+            try:
+                resources = thread.get() or []
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                if len(references) > 1:
+                    # some URI of the chunk is unknown: look them up alone
+                    self.resolve_each(references)
+                    continue
+                resources = []
+            if by_uri:
+                self._store_uris(references, resources)
+            else:
+                self._store_name(references[0], resources)
+
+    def resolve_each(self, uris):
+        for uri in uris:
+            try:
+                resources = self._call(self.get_by_uris, [uri]).get() or []
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                resources = []
+            self._store_uris([uri], resources)
+
+    def get(self, reference):
+        """Returns the resource of a reference, or None if unknown."""
+        if reference not in self._cache:
+            self.resolve([reference])
+        return self._cache[reference]
+
+    def uri(self, reference):
+        """Returns the URI of a reference, or None if unknown."""
+        resource = self.get(reference)
+        return resource.uri if resource is not None else None
+
+    def _call(self, func, argument):
+        self.requests += 1
+        return func(argument, async_req=True)
+
+    def _store_uris(self, uris, resources):
+        found = dict((resource.uri, resource) for resource in resources)
+        for uri in uris:
+            self._cache[uri] = found.get(uri)
+
+    def _store_name(self, name, resources):
+        matches = [r for r in resources if r.name == name]
+        if len(matches) > 1:
+            self.ambiguous.add(name)
+        self._cache[name] = matches[0] if len(matches) == 1 else None
+
+
+def variable_resolver(variables_api, authorization, **kwargs):
+    """Returns a ResourceResolver of variables, as VariableDetailsDTO which
+    tell their datatype."""
+    kwargs.setdefault('details', True)
+    return ResourceResolver(
+        lambda uris, **kw: variables_api.get_variables_by_uris(
+            uris, authorization, **kw),
+        lambda name, **kw: variables_api.search_variables(
+            authorization, name=name_pattern(name), page_size=10, **kw),
+        **kwargs)
+
+
+def scientific_object_resolver(scientific_objects_api, authorization,
+                               experiment=None, **kwargs):
+    """Returns a ResourceResolver of scientific objects, of an experiment
+    if given."""
+    scope = {'experiment': experiment} if experiment else {}
+    return ResourceResolver(
+        lambda uris, **kw: scientific_objects_api
+        .get_scientific_objects_list_by_uris(authorization, body=uris,
+                                             **dict(scope, **kw)),
+        lambda name, **kw: scientific_objects_api.search_scientific_objects(
+            authorization, name=name_pattern(name), page_size=10,
+            **dict(scope, **kw)),
+        **kwargs)
+
+
+def facility_resolver(organizations_api, authorization, **kwargs):
+    """Returns a ResourceResolver of facilities."""
+    return ResourceResolver(
+        lambda uris, **kw: organizations_api.get_facilities_by_uri(
+            uris, authorization, **kw),
+        lambda name, **kw: organizations_api.search_facilities(
+            authorization, pattern=name_pattern(name), page_size=10, **kw),
+        **kwargs)
+
+
+def experiment_resolver(experiments_api, authorization, **kwargs):
+    """Returns a ResourceResolver of experiments."""
+    return ResourceResolver(
+        lambda uris, **kw: experiments_api.get_experiments_by_uris(
+            uris, authorization, **kw),
+        lambda name, **kw: experiments_api.search_experiments(
+            authorization, name=name_pattern(name), page_size=10, **kw),
+        **kwargs)
+
+
+def device_resolver(devices_api, authorization, **kwargs):
+    """Returns a ResourceResolver of devices."""
+    return ResourceResolver(
+        lambda uris, **kw: devices_api.get_device_by_uris(
+            uris, authorization, **kw),
+        lambda name, **kw: devices_api.search_devices(
+            authorization, name=name_pattern(name), page_size=10, **kw),
+        **kwargs)
@@ -14,7 +14,6 @@
 from __future__ import absolute_import
 
 import io
-import json
 import logging
 import re
 import ssl
@@ -24,6 +23,10 @@ import certifi
 import six
 from six.moves.urllib.parse import urlencode
 
+from swagger_client import json_codec
+from swagger_client.multipart import MultipartEncoder
+from swagger_client import pooling
+
 try:
     import urllib3
 except ImportError:
@@ -35,11 +38,27 @@ logger = logging.getLogger(__name__)
 
 class RESTResponse(io.IOBase):
 
-    def __init__(self, resp):
+    def __init__(self, resp, raw_data=None):
         self.urllib3_response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = resp.data
+        # undecoded response body, handed as is to the JSON codec
+        self.raw_data = resp.data if raw_data is None else raw_data
+        self._data = None
+
+    @property
+    def data(self):
+        """The response body, decoded to str in python 3 on first access."""
+        if self._data is None:
+            if six.PY3 and isinstance(self.raw_data, bytes):
+                self._data = self.raw_data.decode('utf8')
+            else:
+                self._data = self.raw_data
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
@@ -52,7 +71,7 @@ class RESTResponse(io.IOBase):
 
 class RESTClientObject(object):
 
-    def __init__(self, configuration, pools_size=4, maxsize=None):
+    def __init__(self, configuration, pools_size=None, maxsize=None):
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -75,18 +94,36 @@ class RESTClientObject(object):
         addition_pool_args = {}
         if configuration.assert_hostname is not None:
             addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
+        if configuration.connection_pool_block:
+            addition_pool_args['block'] = True
+        self.configuration = configuration
+        self.retry_policy = configuration.retry_policy
+        if self.retry_policy is not None:
+            addition_pool_args['retries'] = \
+                self.retry_policy.transport_retries()
+        if configuration.tcp_keepalive is not None:
+            addition_pool_args['socket_options'] = \
+                pooling.keepalive_socket_options(configuration.tcp_keepalive)
+
+        self.codec = json_codec.get_codec(configuration.json_codec)
 
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
                 maxsize = configuration.connection_pool_maxsize
             else:
                 maxsize = 4
+        if pools_size is None:
+            pools_size = configuration.connection_pool_num_pools
+
+        self.pool_timeout = configuration.connection_pool_timeout
+        self.default_timeout = pooling.default_timeout(configuration)
 
         # https pool manager
         if configuration.proxy:
             self.pool_manager = urllib3.ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
+                timeout=self.default_timeout,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
@@ -98,6 +135,7 @@ class RESTClientObject(object):
             self.pool_manager = urllib3.PoolManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
+                timeout=self.default_timeout,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
@@ -105,9 +143,39 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
 
+        # live statistics of the pools, see pooling.PoolStats
+        self.pool_stats = pooling.PoolStats()
+        pooling.instrument(self.pool_manager, self.pool_stats)
+
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
                 _request_timeout=None):
+        """Perform requests, retried by the retry policy if any, each
+        attempt once the governor of the configuration, if any, lets it go.
+
+        See `send` for the parameters.
+        """
+        def send():
+            return self.send(method, url, query_params, headers, body,
+                             post_params, _preload_content, _request_timeout)
+
+        # read on each request, as it may be set after the client is built
+        governor = self.configuration.governor
+        if governor is not None:
+            group = governor.group(method, url, post_params, _preload_content)
+            send_once = send
+
+            def send():
+                return governor.call(group, send_once,
+                                     streamed=not _preload_content)
+
+        if self.retry_policy is None:
+            return send()
+        return self.retry_policy.call(method, url, send)
+
+    def send(self, method, url, query_params=None, headers=None,
+             body=None, post_params=None, _preload_content=True,
+             _request_timeout=None):
         """Perform requests.
 
         :param method: http request method
@@ -138,7 +206,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        timeout = None
+        timeout = self.default_timeout
         if _request_timeout:
             if isinstance(_request_timeout, (int, ) if six.PY3 else (int, long)):  # noqa: E501,F821
                 timeout = urllib3.Timeout(total=_request_timeout)
@@ -158,12 +226,13 @@ class RESTClientObject(object):
                 if re.search('json', headers['Content-Type'], re.IGNORECASE):
                     request_body = '{}'
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.codec.dumps(body)
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        pool_timeout=self.pool_timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
                     r = self.pool_manager.request(
@@ -172,18 +241,22 @@ class RESTClientObject(object):
                         encode_multipart=False,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        pool_timeout=self.pool_timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
-                    r = self.pool_manager.request(
+                    # the body is streamed, files being read by chunks; the
+                    # encoder sets the Content-Type with its boundary, and
+                    # the Content-Length unless a file size is unknown, in
+                    # which case the body is sent chunked.
+                    encoder = MultipartEncoder(post_params)
+                    headers.update(encoder.headers())
+                    r = self.pool_manager.urlopen(
                         method, url,
-                        fields=post_params,
-                        encode_multipart=True,
+                        body=encoder,
+                        chunked='Content-Length' not in headers,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        pool_timeout=self.pool_timeout,
                         headers=headers)
                 # Pass a `string` parameter directly in the body to support
                 # other content types than Json when `body` argument is
@@ -195,6 +268,7 @@ class RESTClientObject(object):
                         body=request_body,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        pool_timeout=self.pool_timeout,
                         headers=headers)
                 else:
                     # Cannot generate the request from given parameters
@@ -208,6 +282,7 @@ class RESTClientObject(object):
                                               fields=query_params,
                                               preload_content=_preload_content,
                                               timeout=timeout,
+                                              pool_timeout=self.pool_timeout,
                                               headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
@@ -216,13 +291,10 @@ class RESTClientObject(object):
         if _preload_content:
             r = RESTResponse(r)
 
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if six.PY3:
-                r.data = r.data.decode('utf8')
-
-            # log response body
-            logger.debug("response body: %s", r.data)
+            # log response body; decoding it only when it will be logged
+            # keeps large bodies as a single bytes buffer.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", r.data)
 
         if not 200 <= r.status <= 299:
             raise ApiException(http_resp=r)
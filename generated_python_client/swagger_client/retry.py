@@ -0,0 +1,277 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from collections import Counter
+import email.utils
+import random
+import re
+import threading
+import time
+
+import six
+from six.moves.urllib.parse import urlparse
+import urllib3
+
+from swagger_client.governor import READ_ONLY_POST_PATHS
+from swagger_client.rest import ApiException
+
+
+class RetryStats(object):
+    """Counters of a RetryPolicy.
+
+    `requests` counts the calls of `RESTClientObject.request`, `attempts`
+    the requests actually sent, so that `amplification`, their ratio, is
+    the extra load put on the server by retries. `reasons` counts the
+    retries by status code or error class name, `gave_up` the requests
+    which failed with a retryable error once out of retries, `sleep_time`
+    the seconds spent waiting between attempts, of which `retry_after`
+    requested by the server.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.attempts = 0
+            self.retries = 0
+            self.gave_up = 0
+            self.reasons = Counter()
+            self.sleep_time = 0.0
+            self.retry_after = 0.0
+
+    @property
+    def amplification(self):
+        return float(self.attempts) / self.requests if self.requests else 1.0
+
+    def as_dict(self):
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'attempts': self.attempts,
+                'retries': self.retries,
+                'gave_up': self.gave_up,
+                'reasons': dict(self.reasons),
+                'sleep_time': self.sleep_time,
+                'retry_after': self.retry_after,
+                'amplification': self.amplification,
+            }
+
+    def __repr__(self):
+        return 'RetryStats(%s)' % ', '.join(
+            '%s=%r' % item for item in sorted(self.as_dict().items()))
+
+    def _count(self, **increments):
+        with self._lock:
+            for name, value in six.iteritems(increments):
+                setattr(self, name, getattr(self, name) + value)
+
+    def _retry(self, reason, delay, retry_after):
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] += 1
+            self.sleep_time += delay
+            if retry_after is not None:
+                self.retry_after += delay
+
+
+class RetryPolicy(object):
+    """Retries the requests of a RESTClientObject failing transiently.
+
+    Responses with a status of `statuses` (by default 429, 502, 503 and
+    504), connection errors, connection resets and read timeouts are
+    retried `retries` times at most, after an exponential backoff of
+    `backoff * 2 ** retry` seconds capped at `max_backoff`, of which a
+    random fraction `jitter` is drawn so that clients failing together do
+    not retry together. A `Retry-After` header, in seconds or as a date,
+    is waited for instead when longer, up to `max_retry_after` seconds.
+
+    Only idempotent requests, those of `methods` (GET, HEAD, OPTIONS, PUT
+    and DELETE by default), are retried once sent: other requests, as the
+    POST of `DataApi.add_list_data` which would create the data twice, are
+    retried only when the connection could not be opened, unless their path
+    matches one of the `safe_paths` regexes, by default those of the
+    searches, counts and validations sent by POST, see `mark_safe`.
+
+    The policy is the only retry layer: the helpers retrying failed
+    requests themselves, as FanOut, DataHarvester or ChunkedCsvImporter,
+    leave them to it (see own_retries), so attempts do not multiply and
+    `stats` counts them all; BulkDataWriter does not retry again the
+    errors the policy retried.
+
+    >>> policy = RetryPolicy(retries=5, backoff=0.5)
+    >>> policy.mark_safe(r'^/security/authenticate$')
+    >>> configuration.retry_policy = policy
+    >>> ...
+    >>> print(policy.stats.as_dict())
+
+    :param retries: number of retries of a request.
+    :param backoff: delay in seconds before the first retry.
+    :param max_backoff: longest delay in seconds between two attempts.
+    :param jitter: fraction of the delay drawn at random, from 0 (none) to
+                   1 (from 0 to the delay).
+    :param statuses: retried response statuses.
+    :param methods: retried HTTP methods.
+    :param safe_paths: regexes of the paths of other requests which are
+                       safe to send again, READ_ONLY_POST_PATHS by default.
+    :param respect_retry_after: whether to wait as asked by `Retry-After`.
+    :param max_retry_after: longest `Retry-After` delay waited for, in
+                            seconds; longer ones fail at once.
+    """
+
+    def __init__(self, retries=3, backoff=0.5, max_backoff=30.0, jitter=0.5,
+                 statuses=(429, 502, 503, 504),
+                 methods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+                 safe_paths=READ_ONLY_POST_PATHS, respect_retry_after=True,
+                 max_retry_after=120.0):
+        if retries < 0:
+            raise ValueError("Invalid value for `retries`, must be a value "
+                             "greater than or equal to `0`")
+        if not 0 <= jitter <= 1:
+            raise ValueError("Invalid value for `jitter`, must be a value "
+                             "between `0` and `1`")
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.safe_paths = [re.compile(p) for p in safe_paths]
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.stats = RetryStats()
+
+    def mark_safe(self, path_pattern):
+        """Allows retrying the non idempotent requests of the paths matching
+        a regex, as searches sent by POST."""
+        self.safe_paths.append(re.compile(path_pattern))
+
+    def is_idempotent(self, method, url):
+        if method.upper() in self.methods:
+            return True
+        path = urlparse(url).path
+        return any(p.search(path) for p in self.safe_paths)
+
+    def reason(self, method, url, error):
+        """Returns why a failed request may be retried, or None.
+
+        :return: the status code, or the name of the error class.
+        """
+        if isinstance(error, urllib3.exceptions.MaxRetryError):
+            error = error.reason or error
+        if isinstance(error, ApiException):
+            if error.status in self.statuses and \
+                    self.is_idempotent(method, url):
+                return str(error.status)
+            return None
+        if isinstance(error, urllib3.exceptions.ConnectTimeoutError):
+            # the request was not sent, NewConnectionError included
+            return type(error).__name__
+        if isinstance(error, (urllib3.exceptions.ReadTimeoutError,
+                              urllib3.exceptions.ProtocolError)):
+            if self.is_idempotent(method, url):
+                return type(error).__name__
+        return None
+
+    def delay(self, attempt, error=None):
+        """Returns the seconds to wait before retry `attempt` (from 0), and
+        the Retry-After delay of the error, or None."""
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        delay *= 1 - self.jitter * random.random()
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay, retry_after
+
+    def retry_after(self, error):
+        """Returns the Retry-After delay of a failed response, in seconds,
+        or None."""
+        headers = getattr(error, 'headers', None)
+        if not self.respect_retry_after or not headers:
+            return None
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            date = email.utils.parsedate_tz(value)
+            return max(email.utils.mktime_tz(date) - time.time(), 0.0)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def transport_retries(self):
+        """Returns the urllib3 Retry of the connection pools: connection
+        and read errors, and Retry-After responses, are left to the policy;
+        redirects are still followed."""
+        return urllib3.Retry(total=10, connect=False, read=False, redirect=5,
+                             respect_retry_after_header=False)
+
+    def call(self, method, url, send):
+        """Calls `send()`, which sends the request, retrying it on
+        transient failures.
+
+        :return: the response returned by `send`.
+        """
+        self.stats._count(requests=1)
+        attempt = 0
+        while True:
+            self.stats._count(attempts=1)
+            try:
+                return send()
+            except (ApiException, urllib3.exceptions.HTTPError) as e:
+                delay = self.next_delay(method, url, e, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def next_delay(self, method, url, error, attempt, reason=None):
+        """Returns the seconds to wait before retrying a failed attempt, or
+        None if it is not retried; counts the retry in `stats`.
+
+        :param attempt: number of the failed attempt, from 0.
+        :param reason: why it may be retried, see `reason` by default.
+        """
+        if reason is None:
+            reason = self.reason(method, url, error)
+        if reason is None:
+            return None
+        if attempt >= self.retries:
+            self.stats._count(gave_up=1)
+            return None
+        delay, retry_after = self.delay(attempt, error)
+        if retry_after is not None and retry_after > self.max_retry_after:
+            self.stats._count(gave_up=1)
+            return None
+        self.stats._retry(reason, delay, retry_after)
+        return delay
+
+
+def own_retries(api_client, retries):
+    """Returns how many times a helper should retry the failed requests it
+    sends through `api_client`: `retries`, or none when the configuration
+    has a RetryPolicy, which retries them already.
+
+    :param api_client: ApiClient of the requests.
+    :param retries: retries of the helper.
+    """
+    if getattr(api_client.configuration, 'retry_policy', None) is not None:
+        return 0
+    return retries
@@ -0,0 +1,155 @@
+# coding: utf-8
+
+"""The generic deserializer ApiClient used before swagger_client.deserializer.
+
+It parses the type string of every value and resolves model classes by name
+each time. Kept as the reference the compiled decoders are checked against
+(test_deserializer) and measured against (benchmarks/bench_deserialize.py).
+"""
+
+from __future__ import absolute_import
+
+import datetime
+import re
+
+import six
+
+import swagger_client.models
+from swagger_client import deserializer, rest
+from swagger_client.configuration import ValidationContext
+
+
+def deserialize(data, klass, context=None, trusted=False):
+    """Deserializes dict, list, str into an object.
+
+    :param data: dict, list or str.
+    :param klass: class literal, or string of class name.
+    :param context: ValidationContext passed to the models built.
+    :param trusted: fill plain models without running their property
+                    setters, see Configuration.trusted_deserialization.
+
+    :return: object.
+    """
+    if data is None:
+        return None
+
+    if type(klass) == str:
+        if klass.startswith('list['):
+            sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+            return [deserialize(sub_data, sub_kls, context, trusted)
+                    for sub_data in data]
+
+        if klass.startswith('dict('):
+            sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+            return {k: deserialize(v, sub_kls, context, trusted)
+                    for k, v in six.iteritems(data)}
+
+        # convert str to class
+        if klass in deserializer.NATIVE_TYPES_MAPPING:
+            klass = deserializer.NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(swagger_client.models, klass)
+
+    if klass in deserializer.PRIMITIVE_TYPES:
+        return _deserialize_primitive(data, klass)
+    elif klass == object:
+        return data
+    elif klass == datetime.date:
+        return _deserialize_date(data)
+    elif klass == datetime.datetime:
+        return _deserialize_datetime(data)
+    else:
+        return _deserialize_model(data, klass, context, trusted)
+
+
+def _deserialize_primitive(data, klass):
+    try:
+        return klass(data)
+    except UnicodeEncodeError:
+        return six.text_type(data)
+    except TypeError:
+        return data
+
+
+def _deserialize_date(string):
+    try:
+        from dateutil.parser import parse
+        return parse(string).date()
+    except ImportError:
+        return string
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as date object".format(string)
+        )
+
+
+def _deserialize_datetime(string):
+    try:
+        from dateutil.parser import parse
+        return parse(string)
+    except ImportError:
+        return string
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason=(
+                "Failed to parse `{0}` as datetime object"
+                .format(string)
+            )
+        )
+
+
+def _deserialize_model_trusted(data, klass, context):
+    instance = klass.__new__(klass)
+    fields = instance.__dict__
+    fields['_configuration'] = context
+    for json_key, field, attr_type in deserializer.model_plan(klass):
+        value = data.get(json_key)
+        if value is not None:
+            value = deserialize(value, attr_type, context, True)
+        fields[field] = value
+    fields['discriminator'] = None
+    return instance
+
+
+def _hasattr(object, name):
+    return name in object.__class__.__dict__
+
+
+def _deserialize_model(data, klass, context, trusted):
+    if context is None:
+        context = ValidationContext()
+
+    if (not klass.swagger_types and
+            not _hasattr(klass, 'get_real_child_model')):
+        return data
+
+    if (trusted and isinstance(data, dict) and
+            not issubclass(klass, dict) and
+            not hasattr(klass, 'get_real_child_model')):
+        return _deserialize_model_trusted(data, klass, context)
+
+    kwargs = {}
+    if klass.swagger_types is not None:
+        for attr, attr_type in six.iteritems(klass.swagger_types):
+            if (data is not None and
+                    klass.attribute_map[attr] in data and
+                    isinstance(data, (list, dict))):
+                value = data[klass.attribute_map[attr]]
+                kwargs[attr] = deserialize(value, attr_type, context,
+                                           trusted)
+
+    instance = klass(_configuration=context, **kwargs)
+
+    if (isinstance(instance, dict) and
+            klass.swagger_types is not None and
+            isinstance(data, dict)):
+        for key, value in data.items():
+            if key not in klass.swagger_types:
+                instance[key] = value
+    if _hasattr(instance, 'get_real_child_model'):
+        klass_name = instance.get_real_child_model(data)
+        if klass_name:
+            instance = deserialize(data, klass_name, context, trusted)
+    return instance
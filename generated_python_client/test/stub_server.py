@@ -0,0 +1,117 @@
+# coding: utf-8
+
+"""Minimal threaded HTTP server used by the client tests.
+
+A test hands a `handler(request)` callable returning `(status, body)` or
+`(status, body, headers)`; `body` may be bytes, str, or any JSON value.
+"""
+
+from __future__ import absolute_import
+
+import email.parser
+import json
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, urlparse
+
+
+class StubRequest(object):
+
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body.decode('utf8'))
+
+    def param(self, name, default=None):
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def files(self):
+        """Returns the parts of a multipart body, as name -> (filename,
+        content bytes)."""
+        message = email.parser.BytesParser().parsebytes(
+            b'Content-Type: ' + self.headers['Content-Type'].encode('ascii') +
+            b'\r\n\r\n' + self.body)
+        return dict((part.get_param('name', header='content-disposition'),
+                     (part.get_filename(), part.get_payload(decode=True)))
+                    for part in message.get_payload())
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class StubServer(object):
+    """Serves `handler` on 127.0.0.1 while used as a context manager."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                url = urlparse(self.path)
+                if self.headers.get('Transfer-Encoding') == 'chunked':
+                    body = self._read_chunked()
+                else:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    body = self.rfile.read(length) if length else b''
+                request = StubRequest(self.command, url.path,
+                                      parse_qs(url.query), self.headers, body)
+                with stub._lock:
+                    stub.requests.append(request)
+                reply = stub.handler(request)
+                status, payload = reply[0], reply[1]
+                headers = reply[2] if len(reply) > 2 else {}
+                if not isinstance(payload, (bytes, str)):
+                    payload = json.dumps(payload)
+                    headers.setdefault('Content-Type', 'application/json')
+                if isinstance(payload, str):
+                    payload = payload.encode('utf8')
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if 'Content-Length' not in headers:
+                    self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _read_chunked(self):
+                chunks = []
+                while True:
+                    size = int(self.rfile.readline().split(b';')[0], 16)
+                    if not size:
+                        # trailers, up to the blank line
+                        while self.rfile.readline().strip():
+                            pass
+                        return b''.join(chunks)
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+        self.server = _ThreadingServer(('127.0.0.1', 0), Handler)
+        self.url = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
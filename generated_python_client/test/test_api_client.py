@@ -0,0 +1,223 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import copy
+import json
+import pickle
+import unittest
+
+import urllib3
+
+import swagger_client
+from swagger_client import deserializer
+from swagger_client.configuration import ValidationContext
+from swagger_client.envelope import ResponseEnvelope
+from swagger_client.rest import RESTResponse
+
+
+DATA_PAGE = [{
+    'uri': 'http://opensilex.org/id/data/%d' % i,
+    'date': '2024-01-01T10:00:00Z',
+    'target': 'http://opensilex.org/id/so/1',
+    'variable': 'http://opensilex.org/id/variable/1',
+    'value': i * 0.5,
+    'confidence': 0.5,
+    'provenance': {
+        'uri': 'http://opensilex.org/id/provenance/1',
+        'prov_used': [{'uri': 'http://opensilex.org/id/device/1',
+                       'rdf_type': 'vocabulary:SensingDevice'}],
+    },
+    'metadata': {'source': 'test'},
+    'issued': '2024-02-01T00:00:00Z',
+} for i in range(3)]
+
+
+def make_response(data):
+    body = json.dumps(data).encode('utf8')
+    return RESTResponse(urllib3.HTTPResponse(body=body, status=200))
+
+
+class TestApiClientDeserialize(unittest.TestCase):
+    """ApiClient.deserialize unit tests"""
+
+    def setUp(self):
+        self.client = swagger_client.ApiClient()
+
+    def test_models_share_one_validation_context(self):
+        result = self.client.deserialize(make_response(DATA_PAGE),
+                                         'list[DataGetSearchDTO]')
+        contexts = set()
+        for item in result:
+            contexts.add(id(item._configuration))
+            contexts.add(id(item.provenance._configuration))
+            contexts.add(id(item.provenance.prov_used[0]._configuration))
+        self.assertEqual(len(contexts), 1)
+        self.assertIsInstance(result[0]._configuration, ValidationContext)
+
+    def test_each_call_gets_its_own_context(self):
+        first = self.client.deserialize(make_response(DATA_PAGE[:1]),
+                                        'list[DataGetSearchDTO]')
+        second = self.client.deserialize(make_response(DATA_PAGE[:1]),
+                                         'list[DataGetSearchDTO]')
+        self.assertIsNot(first[0]._configuration, second[0]._configuration)
+
+    def test_context_follows_client_side_validation(self):
+        configuration = swagger_client.Configuration()
+        configuration.client_side_validation = False
+        client = swagger_client.ApiClient(configuration)
+        data = dict(DATA_PAGE[0], confidence=2)
+        result = client.deserialize(make_response(data), 'DataGetSearchDTO')
+        self.assertEqual(result.confidence, 2)
+        self.assertRaises(ValueError,
+                          self.client.deserialize, make_response(data),
+                          'DataGetSearchDTO')
+
+    def test_validation_context_is_immutable(self):
+        context = ValidationContext()
+        with self.assertRaises(AttributeError):
+            context.client_side_validation = False
+        self.assertTrue(copy.deepcopy(context).client_side_validation)
+
+
+class TestApiClientTrustedDeserialize(unittest.TestCase):
+    """Trusted deserialization mode unit tests"""
+
+    def setUp(self):
+        configuration = swagger_client.Configuration()
+        configuration.trusted_deserialization = True
+        self.trusted = swagger_client.ApiClient(configuration)
+        self.client = swagger_client.ApiClient()
+
+    def test_plan_matches_setter_fields_of_every_model(self):
+        context = ValidationContext(False)
+        for name in dir(swagger_client.models):
+            klass = getattr(swagger_client.models, name)
+            if not isinstance(klass, type) or not klass.swagger_types:
+                continue
+            fields = set(klass(_configuration=context).__dict__)
+            for _, field, _ in deserializer.model_plan(klass):
+                self.assertIn(field, fields, name)
+
+    def test_same_objects_as_validating_path(self):
+        trusted = self.trusted.deserialize(make_response(DATA_PAGE),
+                                           'list[DataGetSearchDTO]')
+        validated = self.client.deserialize(make_response(DATA_PAGE),
+                                            'list[DataGetSearchDTO]')
+        self.assertEqual(trusted, validated)
+        self.assertEqual(trusted[0]._date, '2024-01-01T10:00:00Z')
+        self.assertEqual(trusted[0].publisher, None)
+        self.assertEqual(trusted[0].provenance.prov_used[0].rdf_type,
+                         'vocabulary:SensingDevice')
+
+    def test_setters_are_bypassed_for_responses_only(self):
+        data = dict(DATA_PAGE[0], confidence=2)
+        del data['uri']
+        result = self.trusted.deserialize(make_response(data),
+                                          'DataGetSearchDTO')
+        self.assertEqual(result.confidence, 2)
+        self.assertIsNone(result.uri)
+        # client side validation still applies to models built by hand
+        self.assertRaises(ValueError, setattr, result, 'confidence', 3)
+
+
+class TestApiClientEnvelope(unittest.TestCase):
+    """Response envelope unit tests"""
+
+    def setUp(self):
+        self.client = swagger_client.ApiClient()
+        self.metadata = {
+            'pagination': {'pageSize': 2, 'currentPage': 0, 'totalCount': 5,
+                           'totalPages': 3, 'hasNextPage': True},
+            'status': [],
+            'datafiles': [],
+        }
+
+    def test_list_result(self):
+        response = make_response({'metadata': self.metadata,
+                                  'result': DATA_PAGE[:2]})
+        result = self.client.deserialize(response, 'list[DataGetSearchDTO]')
+        self.assertIsInstance(result, ResponseEnvelope)
+        self.assertEqual(result.total_count, 5)
+        self.assertTrue(result.pagination.has_next_page)
+        self.assertEqual(result.status, [])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[1].uri, DATA_PAGE[1]['uri'])
+        self.assertEqual([d.uri for d in result],
+                         [d['uri'] for d in DATA_PAGE[:2]])
+        self.assertEqual(result, result.result)
+        self.assertIs(result.result[0]._configuration,
+                      result.metadata._configuration)
+
+    def test_list_result_is_a_list(self):
+        response = make_response({'metadata': self.metadata,
+                                  'result': ['http://so/1', 'http://so/2']})
+        result = self.client.deserialize(response, 'list[str]')
+        self.assertIsInstance(result, list)
+        self.assertIsInstance(result, ResponseEnvelope)
+        self.assertEqual(json.dumps(result), '["http://so/1", "http://so/2"]')
+        self.assertEqual(result, ['http://so/1', 'http://so/2'])
+        self.assertEqual(result.to_dict(), list(result))
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertEqual((restored, restored.total_count), (result, 5))
+
+        response = make_response({'metadata': self.metadata, 'result': []})
+        result = self.client.deserialize(response, 'list[str]')
+        self.assertFalse(result)
+        self.assertEqual(result.total_count, 5)
+        self.assertRaises(AttributeError, getattr, result, 'uri')
+
+    def test_object_result(self):
+        response = make_response({'metadata': {},
+                                  'result': {'token': 'abc'}})
+        result = self.client.deserialize(response, 'TokenGetDTO')
+        self.assertEqual(result.result.token, 'abc')
+        self.assertEqual(result.token, 'abc')
+        self.assertIsNone(result.total_count)
+        self.assertEqual(result.to_dict(), result.result.to_dict())
+
+    def test_scalar_and_dict_results_are_bare(self):
+        def decode(result, response_type):
+            return self.client.deserialize(make_response(
+                {'metadata': self.metadata, 'result': result}), response_type)
+
+        uri = decode('http://so/1', 'str')
+        self.assertIsInstance(uri, str)
+        self.assertEqual(uri + '/a', 'http://so/1/a')
+        count = decode(5, 'int')
+        self.assertEqual(count, 5)
+        self.assertTrue(3 < count < 6)
+        self.assertEqual(count + 1, 6)
+        self.assertIs(decode(True, 'bool'), True)
+        counts = decode({'a': 1}, 'dict(str, int)')
+        self.assertEqual(counts, {'a': 1})
+        self.assertEqual(json.dumps([uri, count, counts]),
+                         '["http://so/1", 5, {"a": 1}]')
+
+    def test_bare_and_envelope_types_are_kept(self):
+        result = self.client.deserialize(make_response(DATA_PAGE[:1]),
+                                         'list[DataGetSearchDTO]')
+        self.assertIsInstance(result, list)
+
+        data = {'metadata': self.metadata, 'result': 'http://so/1'}
+        result = self.client.deserialize(make_response(data),
+                                         'ObjectUriResponse')
+        self.assertEqual(result.result, 'http://so/1')
+        self.assertEqual(result.metadata.pagination.total_count, 5)
+        self.assertEqual(self.client.deserialize(make_response(data),
+                                                 'object'), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import asyncio
+import json
+import unittest
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+import swagger_client
+from swagger_client.cache import ResponseCache
+from swagger_client.governor import AdaptiveLimit, Governor
+from swagger_client.retry import RetryPolicy
+from swagger_client.rest import ApiException
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+    """AsyncApiClient unit tests against a local aiohttp server"""
+
+    async def asyncSetUp(self):
+        from swagger_client.async_api import AsyncDataApi
+        from swagger_client.async_api_client import AsyncApiClient
+
+        self.requests = []
+        self.failures = 0
+        app = web.Application()
+        app.router.add_get('/core/data', self._search_data)
+        app.router.add_post('/core/data', self._add_data)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+
+        configuration = swagger_client.Configuration()
+        configuration.host = 'http://127.0.0.1:%d' % port
+        self.client = AsyncApiClient(configuration)
+        self.api = AsyncDataApi(self.client)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def _search_data(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(0.01)
+        if self.failures:
+            self.failures -= 1
+            return web.json_response({'message': 'busy'}, status=503,
+                                     headers={'Retry-After': '0'})
+        page = int(request.query.get('page', 0))
+        return web.json_response([{
+            'uri': 'http://data/%d' % page,
+            'date': '2024-01-01T10:00:00Z',
+            'variable': 'http://variable/1',
+            'value': 10.5,
+            'provenance': {'uri': 'http://provenance/1'},
+        }])
+
+    async def _add_data(self, request):
+        self.requests.append(request)
+        body = await request.json()
+        if not body:
+            return web.json_response({'message': 'empty'}, status=400)
+        return web.json_response('ok', status=201)
+
+    async def test_generated_method_returns_awaitable(self):
+        result = await self.api.search_data_list('Bearer token', page=3,
+                                                 variables=['a', 'b'])
+        self.assertEqual(len(result), 1)
+        self.assertIsInstance(result[0], swagger_client.DataGetSearchDTO)
+        self.assertEqual(result[0].uri, 'http://data/3')
+        self.assertEqual(result[0].provenance.uri, 'http://provenance/1')
+        request = self.requests[0]
+        self.assertEqual(request.headers['Authorization'], 'Bearer token')
+        self.assertEqual(request.query.getall('variables'), ['a', 'b'])
+
+    async def test_many_requests_in_flight(self):
+        results = await asyncio.gather(*[
+            self.api.search_data_list('token', page=page)
+            for page in range(50)])
+        self.assertEqual([r[0].uri for r in results],
+                         ['http://data/%d' % page for page in range(50)])
+
+    async def test_async_req_returns_task(self):
+        task = self.api.search_data_list('token', page=1, async_req=True)
+        self.assertIsInstance(task, asyncio.Task)
+        result = await task
+        self.assertEqual(result[0].uri, 'http://data/1')
+
+    async def test_json_body_is_serialized(self):
+        body = [swagger_client.DataCreationDTO(
+            target='http://target/1', variable='http://variable/1',
+            _date='2024-01-01', value=1.5,
+            provenance=swagger_client.DataProvenanceModel(uri='http://p/1'))]
+        result = await self.api.add_list_data('token', body=body)
+        self.assertEqual(result, 'ok')
+
+    async def test_error_status_raises_api_exception(self):
+        with self.assertRaises(ApiException) as ctx:
+            await self.api.add_list_data('token', body=[])
+        self.assertEqual(ctx.exception.status, 400)
+        self.assertEqual(json.loads(ctx.exception.body),
+                         {'message': 'empty'})
+
+    async def test_governor_caps_coroutines(self):
+        governor = Governor(limits={'reads': AdaptiveLimit(2, maximum=2)})
+        self.client.configuration.governor = governor
+        await asyncio.gather(*[self.api.search_data_list('token', page=page)
+                               for page in range(6)])
+        stats = governor.as_dict()['reads']
+        self.assertEqual(stats['requests'], 6)
+        self.assertEqual(stats['max_in_flight'], 2)
+        self.assertEqual(stats['in_flight'], 0)
+
+    async def test_governor_takes_a_slot_per_attempt(self):
+        from swagger_client.async_api import AsyncDataApi
+        from swagger_client.async_api_client import AsyncApiClient
+
+        reads = AdaptiveLimit(2, maximum=2)
+        transfers = AdaptiveLimit(1, maximum=1)
+        configuration = swagger_client.Configuration()
+        configuration.host = self.client.configuration.host
+        configuration.retry_policy = RetryPolicy(retries=2, backoff=0.001)
+        configuration.governor = Governor(
+            limits={'reads': reads, 'transfers': transfers})
+        async with AsyncApiClient(configuration) as client:
+            self.failures = 2
+            await AsyncDataApi(client).search_data_list('token')
+            self.assertEqual(reads.requests, 3)
+
+            response = await client.rest_client.request(
+                'GET', configuration.host + '/core/data',
+                _preload_content=False)
+            self.assertEqual(transfers.in_flight, 1)
+            await response.read()
+            response.release()
+            self.assertEqual(transfers.in_flight, 0)
+
+    async def test_response_cache_is_shared_with_sync_client(self):
+        cache = ResponseCache(ttls=[(r'^/core/data$', 60)])
+        self.client.configuration.response_cache = cache
+        sync_api = swagger_client.DataApi(
+            swagger_client.ApiClient(self.client.configuration))
+        body = [swagger_client.DataCreationDTO(
+            target='http://target/1', variable='http://variable/1',
+            _date='2024-01-01', value=1.5,
+            provenance=swagger_client.DataProvenanceModel(uri='http://p/1'))]
+
+        await self.api.search_data_list('token', page=1)
+        result = await self.api.search_data_list('token', page=1)
+        self.assertEqual(result[0].uri, 'http://data/1')
+        self.assertEqual(len(self.requests), 1)
+        # an async write invalidates the entries the sync client reads
+        await self.api.add_list_data('token', body=body)
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: sync_api.search_data_list('token', page=1))
+        self.assertEqual(len(self.requests), 3)
+        stats = cache.as_dict()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+        self.assertEqual(stats['invalidations'], 1)
+
+    async def test_retry_policy(self):
+        from swagger_client.async_api import AsyncDataApi
+        from swagger_client.async_api_client import AsyncApiClient
+
+        policy = RetryPolicy(retries=2, backoff=0.001)
+        configuration = swagger_client.Configuration()
+        configuration.host = self.client.configuration.host
+        configuration.retry_policy = policy
+        async with AsyncApiClient(configuration) as client:
+            api = AsyncDataApi(client)
+            self.failures = 2
+            result = await api.search_data_list('token', page=2)
+            self.assertEqual(result[0].uri, 'http://data/2')
+            self.failures = 3
+            with self.assertRaises(ApiException) as ctx:
+                await api.search_data_list('token')
+            self.assertEqual(ctx.exception.status, 503)
+        stats = policy.stats.as_dict()
+        self.assertEqual((stats['requests'], stats['attempts']), (2, 6))
+        self.assertEqual(stats['reasons'], {'503': 4})
+        self.assertEqual(stats['gave_up'], 1)
+
+    async def test_pool_settings_of_the_configuration(self):
+        from swagger_client.async_api import AsyncDataApi
+        from swagger_client.async_api_client import AsyncApiClient
+
+        configuration = swagger_client.Configuration()
+        configuration.host = self.client.configuration.host
+        configuration.connection_pool_maxsize = 3
+        configuration.connection_pool_num_pools = 2
+        configuration.connect_timeout = 5
+        configuration.read_timeout = 0.001
+        configuration.tcp_keepalive = 30
+        async with AsyncApiClient(configuration) as client:
+            session = client.rest_client.session
+            self.assertEqual((session.connector.limit,
+                              session.connector.limit_per_host), (6, 3))
+            self.assertEqual((session.timeout.sock_connect,
+                              session.timeout.sock_read), (5, 0.001))
+            # the handler sleeps longer than the read timeout
+            with self.assertRaises(asyncio.TimeoutError):
+                await AsyncDataApi(client).search_data_list('token')
+            # an explicit timeout still wins, over a keep-alive socket
+            result = await AsyncDataApi(client).search_data_list(
+                'token', _request_timeout=5)
+            self.assertEqual(result[0].uri, 'http://data/0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,290 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.bulk import (AdaptiveBatchSize, Batch, BulkDataWriter,
+                                 Watermark, is_duplicate, is_transient)
+from swagger_client.governor import is_overload
+from swagger_client.rest import ApiException
+from swagger_client.configuration import ValidationContext
+from swagger_client.retry import RetryPolicy
+
+from .stub_server import StubServer
+
+
+def make_points(count):
+    context = ValidationContext()
+    provenance = swagger_client.DataProvenanceModel(
+        uri='http://provenance/1', _configuration=context)
+    return [swagger_client.DataCreationDTO(
+        _date='2024-01-01T00:00:00Z', target='http://so/1',
+        variable='http://variable/1', value=i, provenance=provenance,
+        _configuration=context) for i in range(count)]
+
+
+class DataStore(object):
+    """add_list_data handler keeping the values received."""
+
+    def __init__(self, max_batch=None, fail=None):
+        self.values = []
+        self.sizes = []
+        self.max_batch = max_batch
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        batch = request.json()
+        with self.lock:
+            self.sizes.append(len(batch))
+            if self.max_batch and len(batch) > self.max_batch:
+                return 413, 'Payload Too Large'
+            if self.fail:
+                reply = self.fail(batch)
+                if reply:
+                    return reply
+            self.values.extend(point['value'] for point in batch)
+        return 201, {'metadata': {}, 'result': ['http://data/x'] * len(batch)}
+
+
+class TestBulkDataWriter(unittest.TestCase):
+    """BulkDataWriter unit tests"""
+
+    def writer(self, server, **kwargs):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        data_api = swagger_client.DataApi(
+            swagger_client.ApiClient(configuration))
+        kwargs.setdefault('backoff', 0)
+        return BulkDataWriter(data_api, 'token', **kwargs)
+
+    def test_every_point_is_written_once(self):
+        store = DataStore()
+        uploaded = []
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=3, batch_size=40,
+                             on_success=uploaded.append) as writer:
+                writer.write_all(make_points(1000))
+        self.assertEqual(sorted(store.values), list(range(1000)))
+        self.assertEqual(writer.points_written, 1000)
+        self.assertEqual(writer.points_failed, 0)
+        self.assertEqual(writer.batches_written, len(uploaded))
+        self.assertGreater(writer.rate(), 0)
+        self.assertEqual(server.requests[0].headers['Authorization'], 'token')
+
+    def test_batches_grow_while_fast(self):
+        store = DataStore()
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=1, batch_size=10) as writer:
+                writer.write_all(make_points(500))
+        self.assertGreater(max(store.sizes), 10)
+        self.assertGreater(writer.batch_size.size, 10)
+
+    def test_payload_too_large_splits_batches(self):
+        store = DataStore(max_batch=30)
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=2,
+                             batch_size=AdaptiveBatchSize(100, 5, 1000)) \
+                    as writer:
+                writer.write_all(make_points(400))
+        self.assertEqual(sorted(store.values), list(range(400)))
+        self.assertLessEqual(writer.batch_size.maximum, 99)
+        self.assertLessEqual(max(store.sizes[-5:]), 30)
+        self.assertEqual(writer.points_failed, 0)
+
+    def test_server_error_is_retried(self):
+        failures = []
+
+        def fail_once(batch):
+            if not failures:
+                failures.append(batch)
+                return 503, 'Service Unavailable'
+
+        store = DataStore(fail=fail_once)
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=1, batch_size=
+                             AdaptiveBatchSize(10, 10, 10)) as writer:
+                writer.write_all(make_points(50))
+        self.assertEqual(sorted(store.values), list(range(50)))
+        self.assertEqual(len(failures), 1)
+
+    def test_only_uploads_not_sent_are_retried(self):
+        replies = [(500, 'Internal Server Error'), (503, 'busy')]
+
+        def fail(batch):
+            if replies:
+                return replies.pop()
+
+        errors = []
+        store = DataStore(fail=fail)
+        with StubServer(store) as server:
+            # a RetryPolicy retries no POST, so the writer still does
+            writer = self.writer(server, concurrency=1,
+                                 batch_size=AdaptiveBatchSize(10, 10, 10),
+                                 on_error=lambda batch, error: errors.append(
+                                     error.status))
+            writer.data_api.api_client.configuration.retry_policy = \
+                RetryPolicy(retries=3)
+            with writer:
+                writer.write_all(make_points(20))
+        # the 503 batch was sent again, the 500 one may have been written
+        self.assertEqual(errors, [500])
+        self.assertEqual(sorted(store.values), list(range(10, 20)))
+        self.assertEqual(store.sizes, [10, 10, 10])
+
+    def test_written_upload_which_timed_out_is_not_written_twice(self):
+        def written_but_slow(batch):
+            # the first upload is written, but answered too late
+            if len(store.sizes) == 1:
+                store.values.extend(point['value'] for point in batch)
+                time.sleep(0.5)
+                return 201, {'metadata': {}, 'result': []}
+            if any(point['value'] in store.values for point in batch):
+                return 400, '{"result": {"title": "DUPLICATE_DATA_KEY"}}'
+
+        errors = []
+        store = DataStore(fail=written_but_slow)
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=1, request_timeout=(1, 0.2),
+                             batch_size=AdaptiveBatchSize(10, 10, 10),
+                             bisect_on=is_duplicate,
+                             on_error=lambda batch, error: errors.append(
+                                 error)) as writer:
+                writer.write_all(make_points(10))
+        self.assertEqual(errors, [])
+        self.assertEqual(writer.points_written, 10)
+        self.assertEqual(sorted(store.values), list(range(10)))
+        # sent again, maybe more than once while the first is answered
+        self.assertGreater(len(store.sizes), 1)
+
+    def test_client_error_goes_to_on_error(self):
+        def reject_seven(batch):
+            if any(point['value'] == 7 for point in batch):
+                return 400, 'Bad Request'
+
+        errors = []
+        store = DataStore(fail=reject_seven)
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=2, batch_size=
+                             AdaptiveBatchSize(10, 10, 10),
+                             on_error=lambda batch, error: errors.append(
+                                 (batch, error))) as writer:
+                writer.write_all(make_points(50))
+        self.assertEqual(len(errors), 1)
+        self.assertEqual([p.value for p in errors[0][0]], list(range(10)))
+        self.assertEqual(errors[0][1].status, 400)
+        self.assertEqual(writer.points_failed, 10)
+        self.assertEqual(sorted(store.values), list(range(10, 50)))
+        self.assertRaises(ValueError, writer.write, None)
+
+    def test_duplicates_are_isolated_by_bisection(self):
+        existing = {13, 70, 71}
+
+        def reject_existing(batch):
+            if any(point['value'] in existing for point in batch):
+                return 400, '{"result": {"title": "DUPLICATE_DATA_KEY"}}'
+
+        errors = []
+        store = DataStore(fail=reject_existing)
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=2, bisect_on=is_duplicate,
+                             batch_size=AdaptiveBatchSize(64, 64, 64),
+                             on_error=lambda batch, error: errors.append(
+                                 batch)) as writer:
+                writer.write_all(make_points(128))
+        self.assertEqual(sorted(p.value for b in errors for p in b),
+                         sorted(existing))
+        self.assertEqual([len(b) for b in errors], [1, 1, 1])
+        self.assertEqual(sorted(store.values),
+                         sorted(set(range(128)) - existing))
+        # 2 batches, then 2 * log2(64) bisection requests per isolated point
+        self.assertLessEqual(len(server.requests), 2 + 3 * 2 * 6)
+
+    def test_cancel_drops_pending_batches(self):
+        def unavailable(batch):
+            return 503, 'Service Unavailable'
+
+        errors = []
+        store = DataStore(fail=unavailable)
+        with StubServer(store) as server:
+            writer = self.writer(server, concurrency=1, retries=100,
+                                 batch_size=AdaptiveBatchSize(10, 10, 10))
+            writer.on_error = lambda batch, error: errors.append(batch)
+            with writer:
+                writer.write_all(make_points(30))
+                while len(store.sizes) < 3:
+                    time.sleep(0.01)
+                writer.cancel()
+                writer.write_all(make_points(5))
+        self.assertEqual(writer.points_written, 0)
+        self.assertEqual(errors, [])
+        self.assertEqual(writer.points_cancelled, 35)
+
+    def test_batches_carry_their_position(self):
+        store = DataStore(max_batch=30)
+        watermark = Watermark()
+        with StubServer(store) as server:
+            with self.writer(server, concurrency=3,
+                             batch_size=AdaptiveBatchSize(100, 5, 1000),
+                             on_success=watermark.add) as writer:
+                writer.write_all(make_points(400))
+        self.assertEqual(writer.points_queued, 400)
+        self.assertEqual(watermark.value, 400)
+
+    def test_watermark(self):
+        watermark = Watermark()
+        batch = Batch(range(10), start=0)
+        parts = batch.split(4)
+        self.assertEqual([(p.start, len(p)) for p in parts],
+                         [(0, 4), (4, 4), (8, 2)])
+        self.assertIsNone(watermark.add(parts[1]))
+        self.assertIsNone(watermark.add(parts[2]))
+        self.assertEqual(watermark.add(parts[0]), 10)
+        self.assertEqual(watermark.add(Batch([1, 2], start=10)), 12)
+
+    def test_transient_errors(self):
+        for status, transient, overload in ((413, True, False),
+                                            (429, True, True),
+                                            (500, True, False),
+                                            (503, True, True),
+                                            (400, False, False)):
+            error = ApiException(status=status)
+            self.assertEqual(is_transient(error), transient, status)
+            self.assertEqual(is_overload(error), overload, status)
+
+    def test_adaptive_batch_size(self):
+        size = AdaptiveBatchSize(100, 10, 200, target_latency=1.0)
+        size.record(100, 0.1)
+        self.assertEqual(size.size, 151)
+        size.record(10, 0.1)
+        self.assertEqual(size.size, 151)
+        size.record(151, 0.1)
+        self.assertEqual(size.size, 200)
+        size.record(200, 4.0)
+        self.assertEqual(size.size, 50)
+        size.shrink()
+        size.shrink()
+        size.shrink()
+        self.assertEqual(size.size, 10)
+        size.shrink(limit=120)
+        self.assertEqual(size.maximum, 120)
+        self.assertRaises(ValueError, AdaptiveBatchSize, 5, 10, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.cache import (CacheEntry, MemoryCache, ResponseCache,
+                                  SqliteCache, resource_type)
+
+from .stub_server import StubServer
+
+
+def handler(request):
+    if request.path == '/core/variables/datatypes':
+        return 200, {'metadata': {}, 'result': [
+            {'uri': 'http://www.w3.org/2001/XMLSchema#decimal',
+             'name': 'decimal'}]}
+    if request.path == '/core/data/count':
+        return 200, {'metadata': {}, 'result': 3}
+    if request.path == '/ontology/uris_labels':
+        return 200, {'metadata': {}, 'result': [
+            {'uri': uri, 'name': uri[-1]} for uri in request.json()]}
+    if request.method == 'POST':
+        return 201, {'metadata': {}, 'result': ['http://variable/new']}
+    return 200, {'metadata': {}, 'result': []}
+
+
+class TestResponseCache(unittest.TestCase):
+    """ResponseCache unit tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def client(self, server, cache):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        configuration.response_cache = cache
+        return swagger_client.ApiClient(configuration)
+
+    def test_read_mostly_endpoints_are_cached(self):
+        cache = ResponseCache()
+        with StubServer(handler) as server:
+            api = swagger_client.VariablesApi(self.client(server, cache))
+            first = api.get_datatypes()
+            second = api.get_datatypes()
+            api.search_variables('token')
+            api.search_variables('token')
+        self.assertEqual([r.path for r in server.requests],
+                         ['/core/variables/datatypes',
+                          '/core/variables', '/core/variables'])
+        self.assertEqual(second[0].name, 'decimal')
+        self.assertIsNot(first.result, second.result)
+        stats = cache.as_dict()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['by_resource'],
+                         {'variables': {'hits': 1, 'misses': 1}})
+        self.assertEqual(stats['entries'], 1)
+
+    def test_writes_invalidate_their_resource_type(self):
+        cache = ResponseCache()
+        with StubServer(handler) as server:
+            client = self.client(server, cache)
+            api = swagger_client.VariablesApi(client)
+            api.get_datatypes()
+            swagger_client.OntologyApi(client).get_uri_labels_list(
+                ['http://a/1'], 'token')
+            variable = swagger_client.VariableCreationDTO(
+                name='v', entity='e', characteristic='c', method='m',
+                unit='u', datatype='d')
+            api.create_variable('token', body=variable)
+            api.get_datatypes()
+            self.assertEqual(len(server.requests), 4)
+        stats = cache.as_dict()
+        self.assertEqual(stats['invalidations'], 1)
+        # the ontology entry is still there
+        self.assertEqual(stats['entries'], 2)
+
+    def test_read_in_flight_during_a_write_is_not_cached(self):
+        cache = ResponseCache()
+        started, written = threading.Event(), threading.Event()
+
+        def slow_read(request):
+            if request.method == 'GET' and not started.is_set():
+                # answered with the datatypes read before the write
+                started.set()
+                written.wait(5)
+            return handler(request)
+
+        with StubServer(slow_read) as server:
+            api = swagger_client.VariablesApi(self.client(server, cache))
+            reader = threading.Thread(target=api.get_datatypes)
+            reader.start()
+            started.wait(5)
+            variable = swagger_client.VariableCreationDTO(
+                name='v', entity='e', characteristic='c', method='m',
+                unit='u', datatype='d')
+            api.create_variable('token', body=variable)
+            written.set()
+            reader.join()
+            self.assertEqual(cache.as_dict()['entries'], 0)
+            api.get_datatypes()
+            api.get_datatypes()
+            self.assertEqual(len(server.requests), 3)
+        self.assertEqual(cache.as_dict()['entries'], 1)
+
+    def test_read_only_posts_do_not_invalidate(self):
+        cache = ResponseCache()
+        with StubServer(handler) as server:
+            client = self.client(server, cache)
+            swagger_client.VariablesApi(client).get_datatypes()
+            swagger_client.DataApi(client).count_data('token')
+        self.assertEqual(cache.as_dict()['invalidations'], 0)
+        self.assertEqual(cache.as_dict()['entries'], 1)
+
+    def test_streamed_writes_invalidate(self):
+        cache = ResponseCache()
+        with StubServer(handler) as server:
+            api = swagger_client.VariablesApi(self.client(server, cache))
+            api.get_datatypes()
+            variable = swagger_client.VariableCreationDTO(
+                name='v', entity='e', characteristic='c', method='m',
+                unit='u', datatype='d')
+            response = api.create_variable('token', body=variable,
+                                           _preload_content=False)
+            response.read()
+            response.release_conn()
+        self.assertEqual(cache.as_dict()['invalidations'], 1)
+
+    def test_cached_response_headers(self):
+        entry = CacheEntry('r', time.time() + 60, 200, 'OK',
+                           {'Content-Type': 'application/json'}, b'{}')
+        response = entry.response()
+        self.assertEqual(response.getheader('content-type'),
+                         'application/json')
+        self.assertIsNone(response.getheader('ETag'))
+        self.assertEqual(response.getheaders(),
+                         {'Content-Type': 'application/json'})
+
+    def test_entries_expire(self):
+        cache = ResponseCache(ttls=[(r'^/core/variables/datatypes$', 0.1)])
+        with StubServer(handler) as server:
+            api = swagger_client.VariablesApi(self.client(server, cache))
+            api.get_datatypes()
+            api.get_datatypes()
+            time.sleep(0.15)
+            api.get_datatypes()
+        self.assertEqual(len(server.requests), 2)
+
+    def test_sqlite_backend_is_shared_by_runs(self):
+        path = os.path.join(self.directory, 'cache.db')
+        with StubServer(handler) as server:
+            for _ in range(2):
+                backend = SqliteCache(path)
+                client = self.client(server, ResponseCache(backend))
+                api = swagger_client.OntologyApi(client)
+                labels = api.get_uri_labels_list(['http://a/1', 'http://a/2'],
+                                                 'token')
+                api.get_uri_labels_list(['http://a/3'], 'token')
+                backend.close()
+            # the second run was served from the file, by body
+            self.assertEqual(len(server.requests), 2)
+        self.assertEqual([l.name for l in labels], ['1', '2'])
+
+    def test_lru_eviction_by_bytes(self):
+        for backend in (MemoryCache(max_bytes=1300),
+                        SqliteCache(os.path.join(self.directory, 'lru.db'),
+                                    max_bytes=1300)):
+            for key in 'abc':
+                backend.set(key, CacheEntry('r', time.time() + 60, 200, 'OK',
+                                            {}, b'x' * 300))
+            backend.get('a')
+            backend.set('d', CacheEntry('r', time.time() + 60, 200, 'OK', {},
+                                        b'x' * 300))
+            self.assertIsNone(backend.get('b'))
+            self.assertIsNotNone(backend.get('a'))
+            self.assertLessEqual(backend.bytes, 1300)
+            self.assertEqual(backend.evictions, 1)
+
+    def test_resource_type(self):
+        self.assertEqual(resource_type('/core/variables/{uri}'), 'variables')
+        self.assertEqual(resource_type('/ontology/subclasses_of'), 'ontology')
+        self.assertEqual(resource_type('/vuejs/config'), 'vuejs')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import math
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import swagger_client
+
+from .stub_server import StubServer
+
+
+ROWS = [
+    {'uri': 'http://data/1', 'date': '2024-01-01T10:00:00.000+0100',
+     'target': 'http://so/1', 'variable': 'http://variable/1', 'value': 1.5,
+     'confidence': 0.5, 'provenance': {'uri': 'http://provenance/1'}},
+    {'uri': 'http://data/2', 'date': '2024-01-01T09:00:00Z',
+     'target': 'http://so/2', 'variable': 'http://variable/1', 'value': 2,
+     'provenance': {'uri': 'http://provenance/1'}},
+    {'uri': 'http://data/3', 'date': '2024-01-02',
+     'variable': 'http://variable/2', 'value': 'high',
+     'provenance': {'uri': 'http://provenance/2'}},
+]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestColumnar(unittest.TestCase):
+    """columnar unit tests"""
+
+    def setUp(self):
+        from swagger_client import columnar
+        self.columnar = columnar
+
+    def test_decode_rows(self):
+        columns = self.columnar.decode_data_columns(ROWS)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.value.dtype, np.float64)
+        self.assertEqual(columns.value[:2].tolist(), [1.5, 2.0])
+        self.assertTrue(math.isnan(columns.value[2]))
+        self.assertEqual(columns.date.dtype, np.dtype('datetime64[ms]'))
+        self.assertEqual(columns.date[0], columns.date[1])
+        self.assertEqual(str(columns.date[2]), '2024-01-02T00:00:00.000')
+        self.assertEqual(columns.target.codes.tolist(), [0, 1, -1])
+        self.assertEqual(columns.target.categories,
+                         ['http://so/1', 'http://so/2'])
+        self.assertIsNone(columns.target[2])
+        self.assertEqual(columns.variable[2], 'http://variable/2')
+        self.assertEqual(columns.provenance.codes.tolist(), [0, 0, 1])
+        self.assertEqual(columns.confidence[0], 0.5)
+        self.assertTrue(math.isnan(columns.confidence[1]))
+
+    def test_decode_envelope(self):
+        metadata = {'pagination': {'totalCount': 3}}
+        columns = self.columnar.decode_data_columns(
+            {'metadata': metadata, 'result': ROWS})
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(columns.metadata, metadata)
+        self.assertEqual(len(self.columnar.decode_data_columns([])), 0)
+
+    def test_to_pandas(self):
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas is not installed")
+        frame = self.columnar.decode_data_columns(ROWS).to_pandas()
+        self.assertEqual(list(frame.columns),
+                         list(self.columnar.DataColumns.names))
+        self.assertEqual(frame['target'].isna().tolist(),
+                         [False, False, True])
+        self.assertEqual(frame['variable'].cat.categories.tolist(),
+                         ['http://variable/1', 'http://variable/2'])
+
+    def test_to_arrow(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        table = self.columnar.decode_data_columns(ROWS).to_arrow()
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column('target').to_pylist(),
+                         ['http://so/1', 'http://so/2', None])
+
+    def test_fetch_data_columns(self):
+        with StubServer(lambda request: (200, ROWS)) as server:
+            configuration = swagger_client.Configuration()
+            configuration.host = server.url
+            api = swagger_client.DataApi(swagger_client.ApiClient(
+                configuration))
+            columns = self.columnar.fetch_data_columns(
+                api.search_data_list, 'token', variables=['http://v/1'])
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(server.requests[0].path, '/core/data')
+        self.assertEqual(server.requests[0].query['variables'],
+                         ['http://v/1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import swagger_client
+from swagger_client.csv_import import (ChunkedCsvImporter, read_chunk,
+                                       split_csv)
+
+from .stub_server import StubServer
+
+HEADER = (b'target,date,Height\n'
+          b'Target,Date,Height\n'
+          b'string,date,decimal\n')
+
+
+def make_file(directory, rows, bad=()):
+    path = os.path.join(directory, 'data.csv')
+    with open(path, 'wb') as f:
+        f.write(HEADER)
+        for i in range(rows):
+            value = b'bad' if i in bad else str(i).encode('ascii')
+            f.write(b'so%d,2024-01-01,%s\n' % (i, value))
+    return path
+
+
+class CsvServer(object):
+    """import_validation and import handlers checking chunk headers."""
+
+    def __init__(self):
+        self.imported = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return self.handle(request)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def handle(self, request):
+        filename, content = request.files()['file']
+        assert content.startswith(HEADER), content[:80]
+        rows = content[len(HEADER):].splitlines()
+        errors = {}
+        for index, row in enumerate(rows):
+            if row.endswith(b',bad'):
+                errors[str(index)] = [{'rowIndex': index, 'colIndex': 2,
+                                       'value': 'bad'}]
+        report = {'dataErrors': {'invalidValueErrors': errors,
+                                 'validCSV': not errors,
+                                 'headers': ['target', 'date', 'Height']},
+                  'validation_token': filename}
+        if request.path == '/core/data/import':
+            with self.lock:
+                self.imported.extend(rows)
+            report['nb_lines_imported'] = len(rows)
+        return 200, {'metadata': {}, 'result': report}
+
+
+class TestChunkedCsvImporter(unittest.TestCase):
+    """ChunkedCsvImporter unit tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def importer(self, server, **kwargs):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        data_api = swagger_client.DataApi(
+            swagger_client.ApiClient(configuration))
+        kwargs.setdefault('backoff', 0)
+        return ChunkedCsvImporter(data_api, 'token', 'http://provenance/1',
+                                  **kwargs)
+
+    def test_chunks_are_imported_with_the_header(self):
+        path = make_file(self.directory, 250)
+        handler = CsvServer()
+        with StubServer(handler) as server:
+            result = self.importer(server, chunk_rows=40, concurrency=3,
+                                   experiment='http://experiment/1') \
+                .import_file(path)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.chunks, 7)
+        self.assertEqual(result.rows_imported, 250)
+        self.assertEqual(sorted(handler.imported),
+                         sorted(b'so%d,2024-01-01,%d' % (i, i)
+                                for i in range(250)))
+        self.assertLessEqual(handler.max_in_flight, 3)
+        paths = [r.path for r in server.requests]
+        self.assertEqual(paths, ['/core/data/import_validation'] * 7 +
+                         ['/core/data/import'] * 7)
+        request = server.requests[0]
+        self.assertEqual(request.param('provenance'), 'http://provenance/1')
+        self.assertEqual(request.param('experiment'), 'http://experiment/1')
+        self.assertEqual(request.headers['Authorization'], 'token')
+        self.assertEqual(len(result.tokens), 7)
+        self.assertIsNone(result.report.validation_token)
+
+    def test_errors_are_merged_with_file_row_indexes(self):
+        path = make_file(self.directory, 100, bad=(5, 47, 98))
+        handler = CsvServer()
+        with StubServer(handler) as server:
+            result = self.importer(server, chunk_rows=30).import_file(path)
+        self.assertFalse(result.valid)
+        self.assertEqual(handler.imported, [])
+        errors = result.report.data_errors.invalid_value_errors
+        self.assertEqual(sorted(errors, key=int), ['5', '47', '98'])
+        self.assertEqual(errors['47'][0].row_index, 47)
+        self.assertFalse(result.report.data_errors.valid_csv)
+        self.assertEqual(result.report.data_errors.headers,
+                         ['target', 'date', 'Height'])
+
+    def test_failed_chunks_are_reported(self):
+        def unavailable(request):
+            return 503, 'Service Unavailable'
+
+        path = make_file(self.directory, 10)
+        with StubServer(unavailable) as server:
+            result = self.importer(server, chunk_rows=4, retries=1) \
+                .validate_file(path)
+        self.assertFalse(result.valid)
+        self.assertEqual([chunk.rows for chunk, _ in result.failed],
+                         [4, 4, 2])
+        self.assertEqual(result.failed[0][1].status, 503)
+        self.assertEqual(len(server.requests), 6)
+        # failed chunks keep their row range, not their content
+        self.assertEqual([chunk.content for chunk, _ in result.failed],
+                         [None] * 3)
+
+        handler = CsvServer()
+        with StubServer(handler) as server:
+            retried = self.importer(server).retry_failed(path, result)
+        self.assertTrue(retried.valid)
+        self.assertEqual((retried.chunks, retried.rows_imported), (3, 10))
+        self.assertEqual(sorted(handler.imported),
+                         sorted(b'so%d,2024-01-01,%d' % (i, i)
+                                for i in range(10)))
+        self.assertEqual([r.path for r in server.requests],
+                         ['/core/data/import'] * 3)
+
+    def test_split_keeps_quoted_newlines_and_bounds_size(self):
+        path = os.path.join(self.directory, 'data.csv')
+        with open(path, 'wb') as f:
+            f.write(HEADER)
+            f.write(b'so1,2024-01-01,1\n')
+            f.write(b'"so\n2",2024-01-01,2\n')
+            f.write(b'\n')
+            f.write(b'so3,2024-01-01,3')
+        chunks = list(split_csv(path, chunk_rows=2))
+        self.assertEqual([(c.index, c.first_row, c.rows) for c in chunks],
+                         [(0, 0, 2), (1, 2, 1)])
+        self.assertEqual(chunks[0].content, HEADER +
+                         b'so1,2024-01-01,1\n"so\n2",2024-01-01,2\n')
+        self.assertEqual(chunks[1].content, HEADER + b'so3,2024-01-01,3')
+        self.assertEqual([read_chunk(path, c) for c in chunks],
+                         [c.content for c in chunks])
+        chunks = list(split_csv(path, chunk_bytes=len(HEADER) + 1))
+        self.assertEqual([c.rows for c in chunks], [1, 1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
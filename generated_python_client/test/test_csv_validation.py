@@ -0,0 +1,117 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from swagger_client.csv_validation import DataCsvValidator
+except ImportError:
+    DataCsvValidator = None
+
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+DATATYPES = {'Height': XSD + 'decimal', 'Count': XSD + 'integer',
+             'Flag': XSD + 'boolean', 'Sowing': XSD + 'date'}
+
+CONTENT = """\
+experiment;target;device;date *;Height;raw_data;Count;Flag;Sowing
+Experiment;Target;Device;Date;Height;Raw;Count;Flag;Sowing
+d;d;d;d;d;d;d;d;d
+E;so1;;2024-01-01T10:00:00Z;1.5;1 2 3;4;true;2024-01-01
+E;so1;;2024-01-01;NA;;5;false;
+
+E;so1;;2024-02-30;1,5;[1,2];x;maybe;2024-01-32
+E;;;2024-01-01T10:00:00+25:00;abc;a b;NA;1;
+E;so1;;01/02/2024;1e3;;2.0;;;extra
+E;;dev1;2024-01-01T10:00:00.123+0100;-0.5;;-3;0;
+E;so1
+"""
+
+
+@unittest.skipIf(DataCsvValidator is None, 'requires numpy and pandas')
+class TestDataCsvValidator(unittest.TestCase):
+    """DataCsvValidator unit tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.csv')
+        with open(self.path, 'w') as f:
+            f.write(CONTENT)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_errors_are_reported_by_row_and_column(self):
+        report = DataCsvValidator(DATATYPES, chunk_size=3).validate(self.path)
+        self.assertEqual(report.rows, 7)
+        errors = set((e.row, e.column, e.message) for e in report.errors)
+        self.assertEqual(errors, set([
+            (7, 'date', 'invalid date, no such day'),
+            (7, 'Height', "invalid decimal separator, expected '.'"),
+            (7, 'Count', 'not an integer'),
+            (7, 'Flag', 'not a boolean'),
+            (7, 'Sowing', 'invalid date, expected ISO 8601'),
+            (8, 'date', 'invalid date, expected ISO 8601'),
+            (8, None, 'missing target or device'),
+            (8, 'Height', 'not a decimal'),
+            (8, 'raw_data of Height', 'invalid raw_data, expected numbers'),
+            (8, 'Count', 'NA, null and NaN are only allowed for decimals'),
+            (9, None, 'more cells than header columns'),
+            (9, 'date', 'invalid date, expected ISO 8601'),
+            (9, 'Count', 'not an integer'),
+            (11, 'date', 'missing date'),
+        ]))
+        self.assertEqual(report.error_count, len(report.errors))
+        self.assertFalse(report.valid)
+
+        report_path = os.path.join(self.directory, 'errors.csv')
+        report.write_csv(report_path)
+        with open(report_path) as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['row', 'column', 'value', 'message'])
+        self.assertEqual(len(rows), 1 + len(report.errors))
+        self.assertEqual(rows[1][0], '7')
+
+    def test_offsets_can_be_required(self):
+        report = DataCsvValidator(require_offset=True).validate(self.path)
+        rows = [e.row for e in report.errors
+                if e.message == 'invalid date, expected ISO 8601']
+        self.assertEqual(sorted(rows), [8, 9])
+        with open(self.path, 'w') as f:
+            f.write(CONTENT.replace('10:00:00Z', '10:00:00'))
+        report = DataCsvValidator(require_offset=True).validate(self.path)
+        rows = [e.row for e in report.errors
+                if e.message == 'invalid date, expected ISO 8601']
+        self.assertEqual(sorted(rows), [4, 8, 9])
+
+    def test_max_errors_bounds_the_report(self):
+        report = DataCsvValidator(DATATYPES, max_errors=2).validate(
+            self.path)
+        self.assertEqual(len(report.errors), 2)
+        self.assertEqual(report.error_count, 14)
+        self.assertIn('14 errors', report.summary())
+
+    def test_header_errors(self):
+        with open(self.path, 'w') as f:
+            f.write('experiment,target,Height\n')
+        report = DataCsvValidator().validate(self.path)
+        self.assertEqual(report.errors[0].message, 'The file has no date column')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,293 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import threading
+import unittest
+
+from dateutil.parser import parse
+
+import swagger_client
+from swagger_client import deserializer
+from swagger_client.configuration import ValidationContext
+from swagger_client.rest import ApiException
+
+from . import reference_deserializer
+
+
+class _ReferenceModel(object):
+    """Minimal model in the shape of the generated ones."""
+
+    swagger_types = {}
+    attribute_map = {}
+
+    def __init__(self, _configuration=None, **kwargs):
+        for attr in self.swagger_types:
+            setattr(self, '_' + attr, kwargs.get(attr))
+        self.discriminator = None
+
+    def __getattr__(self, name):
+        if name in self.swagger_types:
+            return self.__dict__['_' + name]
+        raise AttributeError(name)
+
+    def to_dict(self):
+        return dict((attr, as_dict(getattr(self, attr)))
+                    for attr in self.swagger_types)
+
+
+class ReferenceEventDTO(_ReferenceModel):
+    """Event resolved to its subtype by `rdf_type`."""
+
+    swagger_types = {'uri': 'str', 'rdf_type': 'str', 'start': 'datetime',
+                     'targets': 'list[str]'}
+    attribute_map = dict((attr, attr) for attr in swagger_types)
+
+    def get_real_child_model(self, data):
+        return {'oeev:Move': 'ReferenceMoveDTO'}.get(data.get('rdf_type'))
+
+
+class ReferenceMoveDTO(ReferenceEventDTO):
+
+    swagger_types = dict(ReferenceEventDTO.swagger_types,
+                         stops='dict(str, list[date])',
+                         data='list[DataGetSearchDTO]')
+    attribute_map = dict((attr, attr) for attr in swagger_types)
+
+
+def as_dict(value):
+    if isinstance(value, list):
+        return [as_dict(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, as_dict(item)) for key, item in value.items())
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return value
+
+
+class TestDeserializer(unittest.TestCase):
+    """Compiled deserializer unit tests"""
+
+    def setUp(self):
+        self.client = swagger_client.ApiClient()
+        self.context = ValidationContext()
+
+    def compiled(self, data, klass, trusted=False):
+        return deserializer.compile_type(klass, trusted)(data, self.context)
+
+    def assertDecodes(self, data, klass, expected):
+        for trusted in (False, True):
+            result = self.compiled(data, klass, trusted)
+            self.assertEqual(result, expected)
+            self.assertEqual(type(result), type(expected))
+
+    def assertTrustedSame(self, data, klass):
+        expected = self.compiled(data, klass)
+        self.assertDecodes(data, klass, expected)
+        return expected
+
+    def test_decoders_are_memoized(self):
+        self.assertIs(deserializer.compile_type('list[DataGetSearchDTO]'),
+                      deserializer.compile_type('list[DataGetSearchDTO]'))
+        self.assertIsNot(
+            deserializer.compile_type('DataGetSearchDTO'),
+            deserializer.compile_type('DataGetSearchDTO', trusted=True))
+
+    def test_primitives_and_containers(self):
+        self.assertDecodes(['a', None, 'b'], 'list[str]', ['a', None, 'b'])
+        self.assertDecodes({'a': ['x'], 'b': None}, 'dict(str, list[str])',
+                           {'a': ['x'], 'b': None})
+        self.assertDecodes({'a': {'b': 1}}, 'dict(str, object)',
+                           {'a': {'b': 1}})
+        self.assertDecodes('12', 'int', 12)
+        self.assertDecodes(1.5, 'float', 1.5)
+        self.assertDecodes(True, 'bool', True)
+        self.assertDecodes(None, 'list[DataGetSearchDTO]', None)
+
+    def test_dates(self):
+        self.assertDecodes('2024-01-01', 'date', datetime.date(2024, 1, 1))
+        utc = parse('2024-01-01T10:00:00Z').tzinfo
+        for value, expected in [
+                ('2024-01-01T10:00:00Z',
+                 datetime.datetime(2024, 1, 1, 10, tzinfo=utc)),
+                ('2024-01-01T10:00:00+0100',
+                 parse('2024-01-01T10:00:00+01:00')),
+                ('2024-01-01T10:00:00.123456-05:30',
+                 parse('2024-01-01T10:00:00.123456-05:30')),
+                ('2024-01-01T10:00', datetime.datetime(2024, 1, 1, 10)),
+                ('2024-01-01', datetime.datetime(2024, 1, 1)),
+                ('1 Jan 2024 10:00', datetime.datetime(2024, 1, 1, 10))]:
+            self.assertDecodes(value, 'datetime', expected)
+        self.assertIsInstance(self.compiled('2024-01-01T10:00:00Z',
+                                            'datetime'),
+                              datetime.datetime)
+        self.assertRaises(ApiException, self.compiled, 'not a date',
+                          'datetime')
+
+    def test_nested_models(self):
+        data = [{
+            'uri': 'http://opensilex.org/id/data/1',
+            'date': '2024-01-01T10:00:00Z',
+            'variable': 'http://opensilex.org/id/variable/1',
+            'value': 3,
+            'provenance': {'uri': 'http://opensilex.org/id/provenance/1',
+                           'prov_used': [{'uri': 'http://device/1'}]},
+            'metadata': {'k': 'v'},
+            'raw_data': [1, 2],
+            'issued': '2024-01-02T00:00:00Z',
+        }]
+        result = self.assertTrustedSame(data, 'list[DataGetSearchDTO]')
+        self.assertEqual(result[0].provenance.prov_used[0].uri,
+                         'http://device/1')
+        self.assertEqual(result[0].value, 3)
+
+    def test_self_referencing_model(self):
+        tree = {'uri': 'root', 'name': 'root', 'children': [
+            {'uri': 'child', 'name': 'child', 'children': [
+                {'uri': 'leaf', 'name': 'leaf', 'children': []}]}]}
+        result = self.assertTrustedSame([tree], 'list[ResourceTreeDTO]')
+        self.assertEqual(result[0].children[0].children[0].uri, 'leaf')
+
+    def test_validation_errors_are_preserved(self):
+        data = {'uri': None, 'date': '2024-01-01',
+                'variable': 'http://v', 'confidence': 2}
+        self.assertRaises(ValueError, self.compiled, data,
+                          'DataGetSearchDTO')
+        result = self.compiled(data, 'DataGetSearchDTO', trusted=True)
+        self.assertEqual(result.confidence, 2)
+
+
+    def test_concurrent_compilation(self):
+        # a second thread decoding a model while a first one compiles it
+        # must wait for the complete decoder, not see a half-built one
+        data = {'uri': 'http://opensilex.org/id/data/1',
+                'date': '2024-01-01T10:00:00Z',
+                'variable': 'http://v', 'value': 1,
+                'provenance': {'uri': 'http://opensilex.org/id/prov/1'}}
+        results = []
+
+        def decode():
+            try:
+                results.append(self.compiled(data, 'DataGetSearchDTO'))
+            except Exception as e:
+                results.append(e)
+
+        compile_ = deserializer._compile
+        other = threading.Thread(target=decode)
+
+        def compile_slowly(klass, trusted, building):
+            if klass == 'DataProvenanceModel' and not other.is_alive():
+                # the outer DataGetSearchDTO is being built
+                other.start()
+                other.join(0.2)
+            return compile_(klass, trusted, building)
+
+        saved = dict(deserializer._decoders)
+        deserializer._decoders.clear()
+        deserializer._compile = compile_slowly
+        try:
+            decode()
+            other.join()
+        finally:
+            deserializer._compile = compile_
+            deserializer._decoders.update(saved)
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIsInstance(result, swagger_client.DataGetSearchDTO)
+            self.assertEqual(result.uri, 'http://opensilex.org/id/data/1')
+            self.assertEqual(result.provenance.uri,
+                             'http://opensilex.org/id/prov/1')
+
+
+class TestReferenceDeserializer(unittest.TestCase):
+    """Compiled decoders against the generic deserializer they replace"""
+
+    DATA = {
+        'uri': 'http://opensilex.org/id/data/1',
+        'date': '2024-01-01T10:00:00+0100',
+        'target': 'http://opensilex.org/id/so/1',
+        'variable': 'http://opensilex.org/id/variable/1',
+        'value': 3.5,
+        'confidence': 0.9,
+        'provenance': {
+            'uri': 'http://opensilex.org/id/provenance/1',
+            'prov_used': [{'uri': 'http://device/1',
+                           'rdf_type': 'vocabulary:SensingDevice'}],
+            'settings': {'depth': [1, 2], 'unit': {'name': 'cm'}},
+        },
+        'metadata': {'source': 'test', 'tags': ['a', 'b']},
+        'raw_data': [1, [2, 3], {'x': None}],
+        'issued': '2024-01-02T00:00:00Z',
+    }
+    EVENTS = [
+        {'uri': 'http://opensilex.org/id/event/1',
+         'rdf_type': 'oeev:Event', 'start': '2024-03-01T08:00:00Z',
+         'targets': ['http://opensilex.org/id/so/1']},
+        {'uri': 'http://opensilex.org/id/event/2',
+         'rdf_type': 'oeev:Move', 'start': '2024-03-02T08:00:00.5+0200',
+         'targets': [], 'stops': {'field': ['2024-03-02', '2024-03-03'],
+                                  'greenhouse': []},
+         'data': [DATA, dict(DATA, value='wet',
+                             provenance={'uri': 'p', 'prov_used': []})]},
+        None,
+    ]
+
+    def setUp(self):
+        for klass in (ReferenceEventDTO, ReferenceMoveDTO):
+            setattr(swagger_client.models, klass.__name__, klass)
+        self.addCleanup(self.unregister)
+
+    def unregister(self):
+        for klass in (ReferenceEventDTO, ReferenceMoveDTO):
+            delattr(swagger_client.models, klass.__name__)
+        # the decoders of these types, by class or by type string
+        for key in list(deserializer._decoders):
+            if 'Reference' in str(key[0]):
+                del deserializer._decoders[key]
+
+    def assertSameAsReference(self, data, klass):
+        for trusted in (False, True):
+            expected = reference_deserializer.deserialize(
+                data, klass, ValidationContext(), trusted)
+            result = deserializer.compile_type(klass, trusted)(
+                data, ValidationContext())
+            self.assertEqual(as_dict(result), as_dict(expected))
+            self.assertEqual(type(result), type(expected))
+        return result
+
+    def test_discriminated_models(self):
+        result = self.assertSameAsReference(self.EVENTS,
+                                            'list[ReferenceEventDTO]')
+        self.assertEqual([type(event) for event in result],
+                         [ReferenceEventDTO, ReferenceMoveDTO, type(None)])
+        self.assertEqual(result[1].stops['field'][1],
+                         datetime.date(2024, 3, 3))
+
+    def test_nested_models_and_containers(self):
+        self.assertSameAsReference([self.DATA] * 3, 'list[DataGetSearchDTO]')
+        self.assertSameAsReference({'a': [self.DATA], 'b': []},
+                                   'dict(str, list[DataGetSearchDTO])')
+        tree = {'uri': 'root', 'name': 'root', 'children': [
+            {'uri': 'child', 'name': 'child', 'children': [
+                {'uri': 'leaf', 'name': 'leaf', 'children': []}]}]}
+        self.assertSameAsReference([tree], 'list[ResourceTreeDTO]')
+        self.assertSameAsReference({'d': ['2024-01-01', None]},
+                                   'dict(str, list[date])')
+        self.assertSameAsReference(['2024-01-01T10:00', '1 Jan 2024 10:00'],
+                                   'list[datetime]')
+
+
+if __name__ == '__main__':
+    unittest.main()
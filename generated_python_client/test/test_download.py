@@ -0,0 +1,183 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import swagger_client
+from swagger_client.download import FileDownloader, download_file
+from swagger_client.rest import ApiException
+from swagger_client.retry import RetryPolicy
+
+from .stub_server import StubServer
+
+# bytes which are not UTF-8, as in images
+CONTENT = bytes(bytearray(range(256))) * 1000
+
+
+def file_handler(cut=None, content=CONTENT, etag='"v1"'):
+    """Serves `content` with Range and If-Range support; the first response
+    is cut after `cut` bytes, the connection being closed early."""
+    responses = []
+
+    def handler(request):
+        responses.append(request)
+        start = 0
+        if_range = request.headers['If-Range']
+        if request.headers['Range'] and if_range in (None, etag):
+            start = int(request.headers['Range'][6:-1])
+        body = content[start:]
+        headers = {'Content-Type': 'application/octet-stream'}
+        if etag is not None:
+            headers['ETag'] = etag
+        status = 200
+        if start:
+            status = 206
+            headers['Content-Range'] = 'bytes %d-%d/%d' % (
+                start, len(content) - 1, len(content))
+        if cut is not None and len(responses) == 1:
+            headers['Content-Length'] = str(len(body))
+            headers['Connection'] = 'close'
+            body = body[:cut]
+        return status, body, headers
+    return handler
+
+
+class TestFileDownloader(unittest.TestCase):
+    """FileDownloader unit tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'image.jpg')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def api(self, server, retry_policy=None):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        configuration.retry_policy = retry_policy
+        return swagger_client.DataApi(swagger_client.ApiClient(configuration))
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_binary_file_is_written_by_chunks(self):
+        with StubServer(file_handler()) as server:
+            path = download_file(self.api(server).get_data_file, self.path,
+                                 'http://file/1', 'token', chunk_size=4096)
+        self.assertEqual(path, self.path)
+        self.assertEqual(self.read(), CONTENT)
+        self.assertFalse(os.path.exists(self.path + '.part'))
+        request = server.requests[0]
+        self.assertEqual(request.path, '/core/datafiles/http%3A%2F%2Ffile%2F1')
+        self.assertEqual(request.headers['Authorization'], 'token')
+        self.assertEqual(request.headers['Accept-Encoding'], 'identity')
+        self.assertIsNone(request.headers['Range'])
+
+    def test_broken_download_is_resumed_with_range(self):
+        with StubServer(file_handler(cut=100000)) as server:
+            FileDownloader(backoff=0).download(
+                self.api(server).get_data_file, self.path, 'http://file/1',
+                'token')
+        self.assertEqual(self.read(), CONTENT)
+        self.assertEqual([r.headers['Range'] for r in server.requests],
+                         [None, 'bytes=100000-'])
+        self.assertEqual(server.requests[1].headers['If-Range'], '"v1"')
+        self.assertFalse(os.path.exists(self.path + '.part.validator'))
+
+    def test_resumed_without_validator_in_the_same_run_only(self):
+        with StubServer(file_handler(cut=100000, etag=None)) as server:
+            FileDownloader(backoff=0).download(
+                self.api(server).get_data_file, self.path, 'http://file/1',
+                'token')
+            self.assertEqual(self.read(), CONTENT)
+            self.assertEqual(server.requests[1].headers['Range'],
+                             'bytes=100000-')
+            self.assertIsNone(server.requests[1].headers['If-Range'])
+
+            with open(self.path + '.part', 'wb') as f:
+                f.write(CONTENT[:5000])
+            download_file(self.api(server).get_data_file, self.path,
+                          'http://file/1', 'token')
+            self.assertEqual(self.read(), CONTENT)
+            self.assertIsNone(server.requests[2].headers['Range'])
+
+    def write_part(self, content, validator):
+        with open(self.path + '.part', 'wb') as f:
+            f.write(content)
+        with open(self.path + '.part.validator', 'w') as f:
+            f.write(validator)
+
+    def test_part_file_is_resumed_unless_disabled(self):
+        self.write_part(CONTENT[:5000], '"v1"')
+        with StubServer(file_handler()) as server:
+            download_file(self.api(server).get_data_file, self.path,
+                          'http://file/1', 'token')
+            self.assertEqual(self.read(), CONTENT)
+            self.assertEqual(server.requests[0].headers['Range'],
+                             'bytes=5000-')
+            self.assertEqual(server.requests[0].headers['If-Range'], '"v1"')
+
+            self.write_part(b'stale', '"v1"')
+            download_file(self.api(server).get_data_file, self.path,
+                          'http://file/1', 'token', resume=False)
+            self.assertEqual(self.read(), CONTENT)
+            self.assertIsNone(server.requests[1].headers['Range'])
+
+    def test_part_of_a_changed_file_is_rewritten(self):
+        self.write_part(b'x' * 5000, '"v1"')
+        changed = CONTENT[::-1]
+        with StubServer(file_handler(content=changed, etag='"v2"')) \
+                as server:
+            download_file(self.api(server).get_data_file, self.path,
+                          'http://file/1', 'token')
+        # the server answered 200 with the whole file, not the range
+        self.assertEqual(self.read(), changed)
+        self.assertEqual(server.requests[0].headers['If-Range'], '"v1"')
+        self.assertEqual(len(server.requests), 1)
+
+    def test_client_errors_are_not_retried(self):
+        with StubServer(lambda request: (404, 'Not Found')) as server:
+            with self.assertRaises(ApiException) as context:
+                download_file(self.api(server).get_data_file, self.path,
+                              'http://file/1', 'token')
+        self.assertEqual(context.exception.status, 404)
+        self.assertEqual(len(server.requests), 1)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_failed_requests_are_left_to_the_retry_policy(self):
+        policy = RetryPolicy(retries=1, backoff=0.001)
+        with StubServer(lambda request: (503, 'busy')) as server:
+            with self.assertRaises(ApiException):
+                FileDownloader(retries=3, backoff=0).download(
+                    self.api(server, policy).get_data_file, self.path,
+                    'http://file/1', 'token')
+            self.assertEqual(len(server.requests), 2)
+
+            # bodies cut short are still resumed by the downloader
+            server.handler = file_handler(cut=100000)
+            FileDownloader(backoff=0).download(
+                self.api(server, policy).get_data_file, self.path,
+                'http://file/1', 'token')
+        self.assertEqual(self.read(), CONTENT)
+        self.assertEqual(policy.stats.gave_up, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
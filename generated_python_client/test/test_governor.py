@@ -0,0 +1,226 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from multiprocessing.pool import ThreadPool
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.governor import AdaptiveLimit, Governor
+from swagger_client.retry import RetryPolicy
+from swagger_client.rest import ApiException
+
+from .stub_server import StubServer
+
+OK = {'metadata': {}, 'result': []}
+
+
+class ConcurrencyHandler(object):
+    """Slow handler recording the largest number of concurrent requests."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.current = self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.delay)
+        with self.lock:
+            self.current -= 1
+        return 200, OK
+
+
+class TestGovernor(unittest.TestCase):
+    """Governor unit tests"""
+
+    def client(self, server, governor):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        configuration.governor = governor
+        return swagger_client.ApiClient(configuration)
+
+    def run_concurrently(self, func, count):
+        pool = ThreadPool(count)
+        try:
+            return pool.map(lambda _: func(), range(count))
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_concurrent_requests_are_capped_per_group(self):
+        handler = ConcurrencyHandler()
+        governor = Governor(limits={
+            'reads': AdaptiveLimit(2, maximum=2),
+            'writes': AdaptiveLimit(1, maximum=1)})
+        with StubServer(handler) as server:
+            client = self.client(server, governor)
+            api = swagger_client.VariablesApi(client)
+            self.run_concurrently(lambda: api.search_variables('token'), 6)
+            self.assertEqual(handler.peak, 2)
+
+            data = swagger_client.DataApi(client)
+            handler.peak = 0
+            self.run_concurrently(lambda: data.add_list_data('token',
+                                                             body=[]), 3)
+            self.assertEqual(handler.peak, 1)
+        stats = governor.as_dict()
+        self.assertEqual(stats['reads']['requests'], 6)
+        self.assertEqual(stats['reads']['max_in_flight'], 2)
+        self.assertEqual(stats['writes']['requests'], 3)
+        self.assertGreater(stats['reads']['wait_time'], 0)
+
+    def test_rate_is_limited_by_a_token_bucket(self):
+        governor = Governor(rate=10, burst=1)
+        with StubServer(lambda request: (200, OK)) as server:
+            api = swagger_client.VariablesApi(self.client(server, governor))
+            start = time.time()
+            for _ in range(6):
+                api.search_variables('token')
+        self.assertGreaterEqual(time.time() - start, 0.49)
+        self.assertGreater(governor.as_dict()['rate_wait_time'], 0.2)
+
+    def test_overloads_decrease_the_limit_once_per_round_trip(self):
+        responses = [(503, 'busy')] * 4
+
+        def handler(request):
+            time.sleep(0.02)
+            return responses.pop() if responses else (200, OK)
+
+        limit = AdaptiveLimit(8, maximum=8)
+        governor = Governor(limits={'reads': limit})
+        with StubServer(handler) as server:
+            api = swagger_client.VariablesApi(self.client(server, governor))
+
+            def call():
+                try:
+                    api.search_variables('token')
+                except ApiException:
+                    pass
+            # 4 overloads sent together halve the limit once
+            self.run_concurrently(call, 4)
+        self.assertEqual(limit.overloads, 4)
+        self.assertEqual(limit.decreases, 1)
+        self.assertEqual(int(limit.limit), 4)
+
+    def test_streamed_downloads_keep_their_slot(self):
+        transfers = AdaptiveLimit(1, maximum=1)
+        governor = Governor(limits={'transfers': transfers})
+        with StubServer(lambda request: (200, b'x' * 100000)) as server:
+            api = swagger_client.DataApi(self.client(server, governor))
+            response = api.get_data_file('http://file/1', 'token',
+                                         _preload_content=False)
+            # the headers are in, the body is still to be read
+            self.assertEqual(transfers.in_flight, 1)
+            response.read()
+            # urllib3 releases the connection once the body is read
+            self.assertEqual(transfers.in_flight, 0)
+            response.release_conn()
+
+            response = api.get_data_file('http://file/1', 'token',
+                                         _preload_content=False)
+            response.read()
+            # released once, by the read, then by hand, counted once
+            response.release_conn()
+        self.assertEqual(transfers.as_dict()['in_flight'], 0)
+        self.assertEqual(transfers.requests, 2)
+
+    def test_retries_free_the_slot_and_take_a_token(self):
+        failures = [(503, 'busy', {'Retry-After': '1'})]
+
+        def handler(request):
+            if request.path == '/core/variables' and failures:
+                return failures.pop()
+            return 200, OK
+
+        reads = AdaptiveLimit(1, maximum=1)
+        governor = Governor(rate=0.001, burst=10, limits={'reads': reads})
+        with StubServer(handler) as server:
+            client = self.client(server, governor)
+            client.configuration.retry_policy = RetryPolicy(retries=1,
+                                                            jitter=0)
+            client.rest_client = client.create_rest_client(
+                client.configuration)
+            api = swagger_client.VariablesApi(client)
+            pool = ThreadPool(1)
+            try:
+                retried = pool.apply_async(api.search_variables, ('token',))
+                time.sleep(0.2)
+                # the first request waits for its retry, not in its slot
+                start = time.time()
+                api.get_datatypes()
+                self.assertLess(time.time() - start, 0.5)
+                retried.get()
+            finally:
+                pool.close()
+                pool.join()
+        # a slot and a token for each attempt
+        self.assertEqual(reads.requests, 3)
+        self.assertEqual(round(governor.bucket._tokens), 10 - 3)
+
+    def test_aimd(self):
+        limit = AdaptiveLimit(4, minimum=1, maximum=6, target_latency=1.0)
+        for _ in range(4):
+            limit.acquire()
+            limit.release(time.time(), 0.1)
+        self.assertEqual(int(limit.limit), 4)
+        self.assertGreater(limit.limit, 4.9)
+        limit.acquire()
+        limit.release(time.time(), 2.0)
+        self.assertAlmostEqual(limit.limit, 2.47, places=1)
+        for _ in range(100):
+            limit.acquire()
+            limit.release(time.time(), 0.1)
+        self.assertEqual(limit.limit, 6)
+
+    def test_latency_alone_is_no_overload(self):
+        # fast lookups and slow searches of one group, without errors
+        limit = Governor().limits['reads']
+        for i in range(200):
+            limit.acquire()
+            limit.release(time.time(), 0.4 if i % 2 else 0.02)
+        self.assertEqual(limit.decreases, 0)
+        self.assertGreater(limit.limit, 8)
+
+    def test_groups(self):
+        governor = Governor()
+        self.assertEqual(governor.group('GET', 'http://h/core/data'), 'reads')
+        self.assertEqual(governor.group('POST', 'http://h/core/data'),
+                         'writes')
+        self.assertEqual(governor.group('DELETE', 'http://h/core/data/1'),
+                         'writes')
+        self.assertEqual(
+            governor.group('POST', 'http://h/core/variables/by_uris'),
+            'reads')
+        for path in ['/core/data/count', '/core/data/search',
+                     '/core/data/by_targets', '/ontology/uris_labels',
+                     '/core/devices/export_by_uris',
+                     '/core/experiments/x/data/import_validation']:
+            self.assertEqual(governor.group('POST', 'http://h' + path),
+                             'reads', path)
+        self.assertEqual(
+            governor.group('POST', 'http://h/core/data/import',
+                           [('file', ('a.csv', b'', 'text/csv'))]),
+            'transfers')
+        self.assertEqual(governor.group('GET', 'http://h/core/datafiles/1',
+                                        _preload_content=False),
+                         'transfers')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+from dateutil.parser import isoparse
+
+import swagger_client
+from swagger_client.harvest import DataHarvester, harvest_data
+
+from .stub_server import StubServer
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+ROWS = [{'uri': 'http://data/%d' % i,
+         'date': (START + datetime.timedelta(hours=i)).strftime(
+             '%Y-%m-%dT%H:%M:%SZ'),
+         'variable': 'http://variable/1', 'value': i,
+         'provenance': {'uri': 'http://provenance/1'}}
+        for i in range(200)]
+
+
+def data_handler(request):
+    start = isoparse(request.param('start_date'))
+    end = isoparse(request.param('end_date'))
+    rows = [row for row in ROWS if start <= isoparse(row['date']) <= end]
+    if request.path == '/core/data/count':
+        limit = int(request.param('count_limit'))
+        return 200, {'metadata': {}, 'result': min(len(rows), limit)}
+    assert request.param('order_by') == 'date=asc'
+    page = int(request.param('page'))
+    page_size = int(request.param('page_size'))
+    result = rows[page * page_size:(page + 1) * page_size]
+    pagination = {'totalCount': len(rows),
+                  'hasNextPage': (page + 1) * page_size < len(rows)}
+    return 200, {'metadata': {'pagination': pagination}, 'result': result}
+
+
+class TestDataHarvester(unittest.TestCase):
+    """DataHarvester unit tests"""
+
+    def api(self, server):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        return swagger_client.DataApi(swagger_client.ApiClient(configuration))
+
+    def test_windows_are_split_and_merged_in_date_order(self):
+        with StubServer(data_handler) as server:
+            data = list(harvest_data(self.api(server), 'token',
+                                     '2024-01-01T00:00:00Z',
+                                     '2024-01-10T00:00:00Z',
+                                     threshold=30, parallelism=3,
+                                     page_size=20,
+                                     variables=['http://variable/1']))
+        self.assertEqual([d.uri for d in data], [r['uri'] for r in ROWS])
+        counts = [r for r in server.requests if r.path == '/core/data/count']
+        self.assertGreater(len(counts), 3)
+        for request in counts:
+            self.assertEqual(request.param('count_limit'), '31')
+            self.assertEqual(request.json(), [])
+        searches = [r for r in server.requests if r.path == '/core/data']
+        self.assertEqual(searches[0].query['variables'],
+                         ['http://variable/1'])
+
+    def test_small_range_is_fetched_as_one_window(self):
+        with StubServer(data_handler) as server:
+            harvester = DataHarvester(
+                self.api(server), 'token', START,
+                START + datetime.timedelta(hours=9, minutes=59),
+                parallelism=1, page_size=4)
+            data = list(harvester)
+        self.assertEqual([d.value for d in data], list(range(10)))
+        self.assertEqual([r.path for r in server.requests],
+                         ['/core/data/count'] + ['/core/data'] * 3)
+
+    def test_split(self):
+        harvester = DataHarvester(None, 'token', START, START,
+                                  min_window=datetime.timedelta(hours=1))
+        end = START + datetime.timedelta(hours=3)
+        windows = harvester.split(START, end, 3)
+        self.assertEqual(windows[0][0], START)
+        self.assertEqual(windows[-1][1], end)
+        for (_, previous_end), (start, _) in zip(windows, windows[1:]):
+            self.assertEqual(start - previous_end,
+                             datetime.timedelta(milliseconds=1))
+        self.assertEqual(harvester.split(START, end, 4), [(START, end)])
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, DataHarvester, None, 'token',
+                          '2024-01-02', '2024-01-01')
+        self.assertRaises(ValueError, DataHarvester, None, 'token',
+                          START, START, threshold=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
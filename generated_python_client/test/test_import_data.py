@@ -0,0 +1,272 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import swagger_client
+from swagger_client.data_csv import CsvLayout
+from swagger_client.retry import RetryPolicy
+
+from .stub_server import StubServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '..', '..')))
+from utils import import_data  # noqa: E402
+
+OK = {'metadata': {}, 'result': []}
+DECIMAL = 'http://www.w3.org/2001/XMLSchema#decimal'
+INTEGER = 'http://www.w3.org/2001/XMLSchema#integer'
+
+
+class Variable(object):
+
+    def __init__(self, name, datatype=DECIMAL):
+        self.uri = 'http://variable/' + name
+        self.datatype = datatype
+
+
+class Resolver(object):
+
+    def get(self, reference):
+        return None
+
+    def uri(self, reference):
+        return reference
+
+
+class References(object):
+    """The lookups of import_data.References, without a server."""
+
+    def __init__(self, datatypes=None):
+        self.experiments = self.devices = Resolver()
+        self.variables = self
+        self.datatypes = datatypes or {}
+
+    def get(self, reference):
+        return Variable(reference, self.datatypes.get(reference, DECIMAL))
+
+    def target(self, reference):
+        return 'http://so/' + reference
+
+
+class DataServer(object):
+    """Handler of add_list_data recording the values written, answering
+    `reply(points)` when it returns a response."""
+
+    def __init__(self, reply=None):
+        self.reply = reply
+        self.values = []
+
+    def __call__(self, request):
+        points = request.json()
+        if self.reply is not None:
+            response = self.reply(points)
+            if response is not None:
+                return response
+        self.values.extend(p['value'] for p in points)
+        return 201, OK
+
+
+class TestImportData(unittest.TestCase):
+    """utils/import_data.py checkpoint, resume and reject unit tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.csv')
+        self.journal_path = self.path + '.journal'
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_file(self, rows, variables=('height',)):
+        with open(self.path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['target', 'date'] + list(variables))
+            writer.writerow(['Target', 'Date'] + ['Variable'] * len(variables))
+            writer.writerow(['String', 'Date'] + ['Number'] * len(variables))
+            writer.writerows(rows)
+
+    def journal(self):
+        return import_data.ImportJournal(
+            self.journal_path, import_data.ImportJournal.hash_file(self.path))
+
+    def upload(self, server, journal, rejects=None, references=None):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        # no retries, so that failed batches fail at once
+        configuration.retry_policy = RetryPolicy(retries=0)
+        data_api = swagger_client.DataApi(
+            swagger_client.ApiClient(configuration))
+        rows = import_data.read_rows(self.path, journal.checkpoint_offset,
+                                     journal.checkpoint_row)
+        points = import_data.parse_data_points(
+            rows, CsvLayout.read(self.path), references or References(),
+            'http://prov/1',
+            start=(journal.checkpoint_row, journal.checkpoint_offset),
+            rejects=rejects)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return import_data.upload_data_points(
+                data_api, 'token', points, batch_size=5, concurrency=1,
+                queue_depth=1, journal=journal, rejects=rejects)
+
+    def test_journal_of_another_file_is_not_resumed(self):
+        self.write_file([['a', '2024-01-01', '1']])
+        journal = self.journal()
+        self.assertFalse(journal.open())
+        journal.checkpoint(4, 100)
+        journal.close()
+
+        journal = self.journal()
+        self.assertTrue(journal.open())
+        self.assertEqual((journal.checkpoint_row, journal.checkpoint_offset),
+                         (4, 100))
+        journal.close()
+
+        self.write_file([['a', '2024-01-01', '2']])
+        journal = self.journal()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(journal.open())
+        journal.close()
+        self.assertEqual((journal.checkpoint_row, journal.checkpoint_offset),
+                         (0, 0))
+        with open(self.journal_path) as f:
+            self.assertEqual(f.read().splitlines(),
+                             ['{"sha256": "%s"}' % journal.file_hash])
+
+    def test_torn_and_completed_journals(self):
+        self.write_file([['a', '2024-01-01', '1']])
+        journal = self.journal()
+        journal.open()
+        journal.checkpoint(4, 100)
+        journal.close()
+        with open(self.journal_path, 'a') as f:
+            f.write('{"row": 5, "off')
+
+        journal = self.journal()
+        self.assertTrue(journal.open())
+        self.assertEqual(journal.checkpoint_row, 4)
+        self.assertFalse(journal.completed)
+        journal.complete()
+        journal.close()
+
+        journal = self.journal()
+        self.assertTrue(journal.open())
+        self.assertTrue(journal.completed)
+        journal.close()
+        self.assertFalse(self.journal().open(restart=True))
+
+    def test_resume_after_failed_batch(self):
+        values = [float(i) for i in range(40)]
+        self.write_file([['so%d' % i, '2024-01-01T00:00:%02dZ' % i, str(v)]
+                         for i, v in enumerate(values)])
+        posts = []
+
+        def down_after_two_batches(points):
+            posts.append(points)
+            if len(posts) > 2:
+                return 503, 'Service Unavailable'
+
+        journal = self.journal()
+        journal.open()
+        first = DataServer(down_after_two_batches)
+        with StubServer(first) as server:
+            _, finished = self.upload(server, journal)
+        journal.close()
+        self.assertFalse(finished)
+        self.assertEqual(first.values, values[:len(first.values)])
+        self.assertGreaterEqual(len(first.values), 10)
+
+        # the checkpoint is the row of the last value written
+        journal = self.journal()
+        self.assertTrue(journal.open())
+        rows = import_data.read_rows(self.path, journal.checkpoint_offset,
+                                     journal.checkpoint_row)
+        row_number, _, row = next(rows)
+        self.assertEqual(float(row[2]), values[len(first.values)])
+        self.assertEqual(row_number, journal.checkpoint_row + 1)
+
+        second = DataServer()
+        with StubServer(second) as server:
+            _, finished = self.upload(server, journal)
+        journal.close()
+        self.assertTrue(finished)
+        # no value written twice, none missing
+        self.assertEqual(first.values + second.values, values)
+
+    def test_reject_file(self):
+        self.write_file([['so%d' % i, '2024-01-01', str(i), str(10 * i)]
+                         for i in range(12)], variables=('height', 'width'))
+
+        def duplicate(points):
+            if any(p['value'] == 70 for p in points):
+                return 409, {'title': 'DUPLICATE_DATA_KEY'}
+
+        journal = self.journal()
+        journal.open()
+        rejects = import_data.RejectFile(self.path + '.rejected.csv',
+                                         self.path)
+        data = DataServer(duplicate)
+        with StubServer(data) as server:
+            _, finished = self.upload(server, journal, rejects)
+        journal.close()
+        rejects.close()
+        self.assertTrue(finished)
+        self.assertEqual(len(data.values), 23)
+        self.assertNotIn(70, data.values)
+        self.assertEqual(rejects.rows, 1)
+        with open(rejects.path, newline='') as f:
+            rows = list(csv.reader(f))
+        with open(self.path, newline='') as f:
+            header = list(csv.reader(f))[:3]
+        # the header rows, then the rejected value alone in its row
+        self.assertEqual(rows, header + [['so7', '2024-01-01', '', '70']])
+
+    def test_missing_and_unparsable_values(self):
+        self.write_file([['so0', '2024-01-01', '1', '10'],
+                         ['so1', '2024-01-01', 'NA', '11'],
+                         ['so2', '2024-01-01', '2', 'NA'],
+                         ['so3', '2024-01-01', 'abc', '13'],
+                         ['so4', '2024-01-01', '4', '1.5']],
+                        variables=('height', 'count'))
+        journal = self.journal()
+        journal.open()
+        rejects = import_data.RejectFile(self.path + '.rejected.csv',
+                                         self.path)
+        data = DataServer()
+        with StubServer(data) as server:
+            _, finished = self.upload(server, journal, rejects,
+                                      References({'count': INTEGER}))
+        journal.close()
+        rejects.close()
+        self.assertTrue(finished)
+        # missing values are skipped, the other values of their row written
+        self.assertEqual(sorted(data.values), [1, 2, 10, 11])
+        with open(rejects.path, newline='') as f:
+            rows = list(csv.reader(f))[3:]
+        # every row not imported
+        self.assertEqual(rows, [['so3', '2024-01-01', 'abc', '13'],
+                                ['so4', '2024-01-01', '4', '1.5']])
+        self.assertEqual(rejects.rows, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+import urllib3
+
+import swagger_client
+from swagger_client import json_codec
+from swagger_client.rest import RESTResponse
+
+
+def available_codecs():
+    codecs = []
+    for name in sorted(json_codec.CODECS):
+        try:
+            codecs.append(json_codec.get_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+class TestJSONCodec(unittest.TestCase):
+    """json_codec unit tests"""
+
+    def test_get_codec_auto_falls_back_to_an_installed_backend(self):
+        codec = json_codec.get_codec('auto')
+        self.assertIn(codec.name, json_codec.AUTO_ORDER)
+        self.assertIsInstance(json_codec.get_codec('json'),
+                              json_codec.JSONCodec)
+
+    def test_standard_library_by_default(self):
+        self.assertEqual(json_codec.get_codec(None).name, 'json')
+        self.assertEqual(swagger_client.ApiClient().codec.name, 'json')
+
+    def test_get_codec_returns_instances_unchanged(self):
+        codec = json_codec.JSONCodec()
+        self.assertIs(json_codec.get_codec(codec), codec)
+
+    def test_get_codec_rejects_unknown_names(self):
+        self.assertRaises(ValueError, json_codec.get_codec, 'yaml')
+
+    def test_round_trip_from_bytes(self):
+        payload = {'uri': 'http://opensilex.org/id/1', 'value': 1.5,
+                   'label': u'été', 'items': [1, None, True]}
+        raw = json.dumps(payload).encode('utf8')
+        for codec in available_codecs():
+            self.assertEqual(codec.loads(raw), payload, codec.name)
+            self.assertEqual(json.loads(codec.dumps(payload)), payload,
+                             codec.name)
+
+    def test_invalid_json_raises_value_error(self):
+        for codec in available_codecs():
+            self.assertRaises(ValueError, codec.loads, b'not json')
+
+
+class TestRESTResponseBody(unittest.TestCase):
+    """RESTResponse keeps the raw body and decodes it lazily"""
+
+    def make_response(self, body):
+        return RESTResponse(urllib3.HTTPResponse(body=body, status=200,
+                                                 preload_content=True))
+
+    def test_data_is_decoded_on_access(self):
+        response = self.make_response(u'"é"'.encode('utf8'))
+        self.assertIsInstance(response.raw_data, bytes)
+        self.assertEqual(response.data, u'"é"')
+
+    def test_deserialize_parses_raw_bytes_with_every_codec(self):
+        body = json.dumps([{'uri': 'http://opensilex.org/id/1',
+                            'name': 'plant', 'rdf_type': 'vocabulary:Plant'}])
+        for codec in available_codecs():
+            configuration = swagger_client.Configuration()
+            configuration.json_codec = codec
+            client = swagger_client.ApiClient(configuration)
+            response = self.make_response(body.encode('utf8'))
+            result = client.deserialize(response, 'list[NamedResourceDTO]')
+            self.assertEqual(result[0].uri, 'http://opensilex.org/id/1')
+            # the str copy of the body was never built
+            self.assertIsNone(response._data)
+
+    def test_deserialize_falls_back_to_text(self):
+        client = swagger_client.ApiClient()
+        response = self.make_response(b'plain text')
+        self.assertEqual(client.deserialize(response, 'str'), 'plain text')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import subprocess
+import sys
+import unittest
+
+import swagger_client
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "imports are eager before 3.7")
+class TestLazyImport(unittest.TestCase):
+    """lazy_import unit tests"""
+
+    def run_python(self, code):
+        return subprocess.check_output([sys.executable, '-c', code],
+                                       cwd=ROOT).decode('utf8').split()
+
+    def test_import_loads_no_api_or_model_module(self):
+        loaded = self.run_python(
+            'import sys, swagger_client\n'
+            'swagger_client.DataApi\n'
+            'print(" ".join(m for m in sys.modules\n'
+            '               if m.startswith("swagger_client.")))')
+        self.assertIn('swagger_client.api.data_api', loaded)
+        self.assertNotIn('swagger_client.api.variables_api', loaded)
+        self.assertFalse([m for m in loaded
+                          if m.startswith('swagger_client.models.')])
+
+    def test_attributes_resolve_to_defining_modules(self):
+        from swagger_client.api.data_api import DataApi
+        from swagger_client.models.data_get_search_dto import \
+            DataGetSearchDTO
+        self.assertIs(swagger_client.DataApi, DataApi)
+        self.assertIs(swagger_client.api.DataApi, DataApi)
+        self.assertIs(swagger_client.DataGetSearchDTO, DataGetSearchDTO)
+        self.assertIs(swagger_client.models.DataGetSearchDTO,
+                      DataGetSearchDTO)
+        self.assertIs(swagger_client.ApiClient,
+                      swagger_client.api_client.ApiClient)
+
+    def test_dir_and_all_list_lazy_attributes(self):
+        self.assertIn('VariablesApi', dir(swagger_client))
+        self.assertIn('Configuration', swagger_client.__all__)
+        self.assertIn('DataGetSearchDTO', dir(swagger_client.models))
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        self.assertRaises(AttributeError, getattr, swagger_client, 'Nope')
+        self.assertRaises(AttributeError, getattr, swagger_client.models,
+                          'NopeDTO')
+        self.assertFalse(hasattr(swagger_client, '__wrapped__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import swagger_client
+from swagger_client.multipart import FileContent, MultipartEncoder
+
+from .stub_server import StubRequest, StubServer
+
+
+class RecordingFile(io.BytesIO):
+    """Binary file object recording the size of its reads."""
+
+    def __init__(self, content, seekable=True):
+        io.BytesIO.__init__(self, content)
+        self.reads = []
+        self._seekable = seekable
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return io.BytesIO.read(self, size)
+
+    def tell(self):
+        if not self._seekable:
+            raise io.UnsupportedOperation('tell')
+        return io.BytesIO.tell(self)
+
+
+def parse(encoder, body):
+    return StubRequest('POST', '/', {}, {'Content-Type': encoder.content_type},
+                       body).files()
+
+
+class TestMultipartEncoder(unittest.TestCase):
+    """MultipartEncoder unit tests"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.csv')
+        self.content = os.urandom(300000)
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def client(self, server):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        return swagger_client.ApiClient(configuration)
+
+    def test_files_are_read_by_chunks(self):
+        source = RecordingFile(self.content)
+        encoder = MultipartEncoder(
+            [('provenance', 'http://provenance/1'),
+             ('file', ('data.csv', FileContent(source), 'text/csv')),
+             ('note', ('note.txt', u'\xe9t\xe9', None))],
+            chunk_size=4096)
+        chunks = list(encoder)
+        self.assertLessEqual(max(len(chunk) for chunk in chunks), 4096)
+        self.assertEqual(set(source.reads), set([4096]))
+        body = b''.join(chunks)
+        self.assertEqual(encoder.length(), len(body))
+        files = parse(encoder, body)
+        self.assertEqual(files['file'], ('data.csv', self.content))
+        self.assertEqual(files['note'], ('note.txt', u'\xe9t\xe9'.encode()))
+        self.assertEqual(files['provenance'][1], b'http://provenance/1')
+        # the file object is left where it was, so the body can be resent
+        self.assertEqual(encoder.to_bytes(), body)
+
+    def test_file_path_is_streamed_with_content_length(self):
+        def handler(request):
+            return 200, {'metadata': {}, 'result': {}}
+
+        with StubServer(handler) as server:
+            api = swagger_client.DataApi(self.client(server))
+            api.validate_csv('http://provenance/1', self.path, 'token')
+        request = server.requests[0]
+        self.assertEqual(int(request.headers['Content-Length']),
+                         len(request.body))
+        self.assertEqual(request.files()['file'], ('data.csv', self.content))
+
+    def test_unknown_size_is_sent_chunked(self):
+        def handler(request):
+            return 200, {'metadata': {}, 'result': {}}
+
+        source = RecordingFile(self.content, seekable=False)
+        with StubServer(handler) as server:
+            api = swagger_client.DataApi(self.client(server))
+            api.validate_csv('http://provenance/1',
+                             ('data.csv', FileContent(source), 'text/csv'),
+                             'token')
+        request = server.requests[0]
+        self.assertEqual(request.headers['Transfer-Encoding'], 'chunked')
+        self.assertIsNone(request.headers['Content-Length'])
+        self.assertEqual(request.files()['file'], ('data.csv', self.content))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.models.metadata_dto import MetadataDTO
+from swagger_client.models.pagination_dto import PaginationDTO
+from swagger_client.pagination import Paginator, paginate, search_all
+from swagger_client.rest import ApiException
+
+from .stub_server import StubServer
+
+
+def variables_handler(total, envelope=True):
+    def handler(request):
+        page = int(request.param('page', 0))
+        page_size = int(request.param('page_size', 20))
+        start = page * page_size
+        rows = [{'uri': 'http://variable/%d' % i, 'name': 'v%d' % i}
+                for i in range(start, min(start + page_size, total))]
+        if not envelope:
+            return 200, rows
+        total_pages = (total + page_size - 1) // page_size
+        pagination = {'pageSize': page_size, 'currentPage': page,
+                      'totalCount': total, 'totalPages': total_pages,
+                      'hasNextPage': page + 1 < total_pages}
+        return 200, {'metadata': {'pagination': pagination}, 'result': rows}
+    return handler
+
+
+class Envelope(object):
+
+    def __init__(self, result, **pagination):
+        self.result = result
+        self.metadata = MetadataDTO(pagination=PaginationDTO(**pagination))
+
+
+class FakeSearch(object):
+    """Stands in for a generated search method returning envelopes."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def __call__(self, authorization, page=0, page_size=20, async_req=False):
+        self.calls.append(page)
+        result = self.pages[page]
+
+        class Request(object):
+            def get(self):
+                return result
+        return Request() if async_req else result
+
+
+class TestPagination(unittest.TestCase):
+    """Paginator unit tests"""
+
+    def api(self, server):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        return swagger_client.VariablesApi(
+            swagger_client.ApiClient(configuration))
+
+    def test_iterates_all_pages(self):
+        with StubServer(variables_handler(25)) as server:
+            variables = list(paginate(self.api(server).search_variables,
+                                      'token', name='v', page_size=10))
+        self.assertEqual([v.uri for v in variables],
+                         ['http://variable/%d' % i for i in range(25)])
+        self.assertEqual(sorted(int(r.param('page')) for r in server.requests),
+                         [0, 1, 2])
+        self.assertEqual(server.requests[0].param('name'), 'v')
+        self.assertEqual(server.requests[0].headers['Authorization'], 'token')
+
+    def test_exact_multiple_stops_on_last_page(self):
+        with StubServer(variables_handler(20)) as server:
+            pages = list(Paginator(self.api(server).search_variables,
+                                   'token', page_size=10, prefetch=3).pages())
+        self.assertEqual([len(page) for page in pages], [10, 10])
+        self.assertEqual(len(server.requests), 2)
+
+    def test_bare_list_stops_on_empty_page(self):
+        with StubServer(variables_handler(20, envelope=False)) as server:
+            pages = list(Paginator(self.api(server).search_variables,
+                                   'token', page_size=10).pages())
+        self.assertEqual([len(page) for page in pages], [10, 10])
+
+    def test_prefetch_overlaps_consumption(self):
+        # page 1 is answered only once page 0 is being consumed
+        requested = threading.Event()
+        consumed = threading.Event()
+        handler = variables_handler(15)
+
+        def slow_handler(request):
+            if request.param('page') == '1':
+                requested.set()
+                self.assertTrue(consumed.wait(5))
+            return handler(request)
+
+        with StubServer(slow_handler) as server:
+            api = self.api(server)
+            pages = Paginator(api.search_variables, 'token',
+                              page_size=10, prefetch=2).pages()
+            self.assertEqual(len(next(pages)), 10)
+            self.assertTrue(requested.wait(5))
+            consumed.set()
+            self.assertEqual(len(next(pages)), 5)
+            self.assertRaises(StopIteration, next, pages)
+
+    def test_envelope_pagination(self):
+        search = FakeSearch([
+            Envelope([1, 2], total_pages=3, has_next_page=True),
+            Envelope([3, 4], total_pages=3, has_next_page=True),
+            Envelope([5], total_pages=3, has_next_page=False),
+        ])
+        self.assertEqual(list(paginate(search, 'token', page_size=2,
+                                       prefetch=4)), [1, 2, 3, 4, 5])
+        self.assertEqual(search.calls, [0, 1, 2])
+
+        search = FakeSearch([Envelope([1, 2], has_next_page=False)])
+        self.assertEqual(list(paginate(search, 'token', page_size=2)), [1, 2])
+        self.assertEqual(search.calls, [0])
+
+    def test_start_page(self):
+        search = FakeSearch([[1, 2], [3, 4], [5]])
+        self.assertEqual(list(paginate(search, 'token', page=1, page_size=2,
+                                       prefetch=0)), [3, 4, 5])
+        self.assertEqual(search.calls, [1, 2])
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, Paginator, None, page_size=0)
+        self.assertRaises(ValueError, Paginator, None, prefetch=-1)
+
+
+class TestFanOut(unittest.TestCase):
+    """search_all unit tests"""
+
+    def api(self, server):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        return swagger_client.VariablesApi(
+            swagger_client.ApiClient(configuration))
+
+    def uris(self, total):
+        return ['http://variable/%d' % i for i in range(total)]
+
+    def test_pages_fetched_concurrently_in_order(self):
+        lock = threading.Lock()
+        active = [0, 0]
+        handler = variables_handler(95)
+
+        def slow_handler(request):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return handler(request)
+
+        with StubServer(slow_handler) as server:
+            variables = list(search_all(self.api(server).search_variables,
+                                        'token', page_size=10,
+                                        parallelism=4))
+        self.assertEqual([v.uri for v in variables], self.uris(95))
+        self.assertEqual(sorted(int(r.param('page')) for r in server.requests),
+                         list(range(10)))
+        self.assertGreater(active[1], 1)
+
+    def test_unordered(self):
+        with StubServer(variables_handler(95)) as server:
+            variables = list(search_all(self.api(server).search_variables,
+                                        'token', page_size=10,
+                                        parallelism=3, ordered=False))
+        self.assertEqual(sorted(v.uri for v in variables),
+                         sorted(self.uris(95)))
+
+    def test_failed_page_is_retried_alone(self):
+        handler = variables_handler(50)
+        failures = []
+
+        def flaky_handler(request):
+            if request.param('page') == '3' and not failures:
+                failures.append(request)
+                return 503, 'unavailable'
+            return handler(request)
+
+        with StubServer(flaky_handler) as server:
+            variables = list(search_all(self.api(server).search_variables,
+                                        'token', page_size=10, backoff=0))
+        self.assertEqual([v.uri for v in variables], self.uris(50))
+        pages = [int(r.param('page')) for r in server.requests]
+        self.assertEqual(sorted(pages), [0, 1, 2, 3, 3, 4])
+
+    def test_client_errors_are_raised(self):
+        handler = variables_handler(50)
+
+        def failing_handler(request):
+            if request.param('page') == '2':
+                return 400, 'bad request'
+            return handler(request)
+
+        with StubServer(failing_handler) as server:
+            with self.assertRaises(ApiException) as raised:
+                list(search_all(self.api(server).search_variables, 'token',
+                                page_size=10, backoff=0))
+        self.assertEqual(raised.exception.status, 400)
+        self.assertEqual(
+            [r.param('page') for r in server.requests].count('2'), 1)
+
+    def test_without_pagination_pages_are_walked(self):
+        with StubServer(variables_handler(25, envelope=False)) as server:
+            variables = list(search_all(self.api(server).search_variables,
+                                        'token', page_size=10))
+        self.assertEqual([v.uri for v in variables], self.uris(25))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from multiprocessing.pool import ThreadPool
+import socket
+import time
+import unittest
+
+import urllib3
+
+import swagger_client
+from swagger_client import pooling
+
+from .stub_server import StubServer
+
+
+def slow_handler(request):
+    time.sleep(0.1)
+    return 200, {'metadata': {}, 'result': []}
+
+
+class TestPooling(unittest.TestCase):
+    """Connection pool configuration and statistics unit tests"""
+
+    def client(self, server, **settings):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        for name, value in settings.items():
+            setattr(configuration, name, value)
+        return swagger_client.ApiClient(configuration)
+
+    def get_concurrently(self, client, server, count):
+        pool = ThreadPool(count)
+        try:
+            pool.map(lambda _: client.rest_client.GET(server.url + '/'),
+                     range(count))
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_sequential_requests_reuse_one_connection(self):
+        with StubServer(lambda request: (200, {})) as server:
+            client = self.client(server)
+            for _ in range(5):
+                client.rest_client.GET(server.url + '/')
+            stats = client.pool_stats.as_dict()
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['connections_created'], 1)
+        self.assertEqual(stats['connections_reused'], 4)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['max_in_use'], 1)
+
+    def test_bursts_beyond_maxsize_discard_unless_blocking(self):
+        with StubServer(slow_handler) as server:
+            client = self.client(server, connection_pool_maxsize=1)
+            self.get_concurrently(client, server, 4)
+            stats = client.pool_stats
+            self.assertEqual(stats.max_in_use, 4)
+            self.assertEqual(stats.connections_created, 4)
+            self.assertEqual(stats.discarded, 3)
+
+            client = self.client(server, connection_pool_maxsize=1,
+                                 connection_pool_block=True)
+            self.get_concurrently(client, server, 4)
+            stats = client.pool_stats
+            self.assertEqual(stats.max_in_use, 1)
+            self.assertEqual(stats.connections_created, 1)
+            self.assertEqual(stats.connections_reused, 3)
+            self.assertEqual(stats.discarded, 0)
+            self.assertGreater(stats.wait_time, 0.1)
+            self.assertGreater(stats.max_wait_time, 0.1)
+
+    def test_blocking_pool_timeout(self):
+        with StubServer(slow_handler) as server:
+            client = self.client(server, connection_pool_maxsize=1,
+                                 connection_pool_block=True,
+                                 connection_pool_timeout=0.01)
+            with self.assertRaises(urllib3.exceptions.EmptyPoolError):
+                self.get_concurrently(client, server, 2)
+
+    def test_configured_timeouts_and_keepalive(self):
+        with StubServer(slow_handler) as server:
+            client = self.client(server, read_timeout=0.01,
+                                 connection_pool_num_pools=2,
+                                 tcp_keepalive=30)
+            manager = client.rest_client.pool_manager
+            self.assertEqual(manager.pools._maxsize, 2)
+            self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                          manager.connection_pool_kw['socket_options'])
+            with self.assertRaises(urllib3.exceptions.HTTPError):
+                client.rest_client.GET(server.url + '/')
+            # an explicit timeout still wins
+            client.rest_client.GET(server.url + '/', _request_timeout=5)
+
+    def test_keepalive_socket_factory(self):
+        create = pooling.keepalive_socket_factory(30)
+        sock = create((socket.AF_INET, socket.SOCK_STREAM, 0, '',
+                       ('127.0.0.1', 0)))
+        try:
+            self.assertEqual(sock.getsockopt(socket.SOL_SOCKET,
+                                             socket.SO_KEEPALIVE), 1)
+        finally:
+            sock.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
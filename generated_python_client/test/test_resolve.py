@@ -0,0 +1,133 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import re
+import unittest
+
+import swagger_client
+from swagger_client.resolve import (is_uri, name_pattern,
+                                    scientific_object_resolver,
+                                    variable_resolver)
+
+from .stub_server import StubServer
+
+VARIABLES = [{'uri': 'http://variable/%d' % i, 'name': 'Variable %d' % i}
+             for i in range(10)]
+VARIABLES.append({'uri': 'http://variable/dup', 'name': 'Variable 1'})
+
+
+def variables_handler(request):
+    if request.path == '/core/variables/by_uris':
+        uris = request.query['uris']
+        return 200, {'metadata': {}, 'result': [
+            v for v in VARIABLES if v['uri'] in uris]}
+    pattern = re.compile(request.param('name'))
+    return 200, {'metadata': {}, 'result': [
+        v for v in VARIABLES if pattern.search(v['name'])]}
+
+
+class TestResourceResolver(unittest.TestCase):
+    """ResourceResolver unit tests"""
+
+    def client(self, server):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        return swagger_client.ApiClient(configuration)
+
+    def test_names_and_uris_are_resolved_at_once(self):
+        with StubServer(variables_handler) as server:
+            variables = variable_resolver(
+                swagger_client.VariablesApi(self.client(server)), 'token',
+                batch_size=3)
+            references = ['http://variable/%d' % i for i in range(5)] + [
+                'Variable 7', 'Variable 8', 'Variable 8', 'Variable 1',
+                'Unknown', 'http://variable/unknown']
+            unknown = variables.resolve(references)
+            self.assertEqual(unknown, set(['Variable 1', 'Unknown',
+                                           'http://variable/unknown']))
+            # 6 URIs by 3, then 4 distinct names, then the details of the
+            # 2 variables found by name, by 3
+            self.assertEqual(len(server.requests), 2 + 4 + 1)
+            self.assertEqual(server.requests[-1].query['uris'],
+                             ['http://variable/7', 'http://variable/8'])
+            self.assertEqual(variables.uri('Variable 8'), 'http://variable/8')
+            self.assertEqual(variables.uri('http://variable/3'),
+                             'http://variable/3')
+            self.assertIsNone(variables.get('Unknown'))
+            self.assertEqual(variables.ambiguous, set(['Variable 1']))
+            self.assertEqual(len(server.requests), 7)
+            self.assertEqual(server.requests[0].headers['Authorization'],
+                             'token')
+
+    def test_unknown_uri_in_chunk_is_looked_up_alone(self):
+        def handler(request):
+            uris = request.json()
+            if 'http://so/unknown' in uris:
+                return 404, 'Not Found'
+            return 200, {'metadata': {}, 'result': [
+                {'uri': uri, 'name': uri} for uri in uris]}
+
+        with StubServer(handler) as server:
+            objects = scientific_object_resolver(
+                swagger_client.ScientificObjectsApi(self.client(server)),
+                'token', experiment='http://experiment/1')
+            unknown = objects.resolve(['http://so/1', 'http://so/unknown',
+                                       'http://so/2'])
+        self.assertEqual(unknown, set(['http://so/unknown']))
+        self.assertEqual(objects.uri('http://so/2'), 'http://so/2')
+        self.assertEqual(len(server.requests), 1 + 3)
+        self.assertEqual(server.requests[0].param('experiment'),
+                         'http://experiment/1')
+
+    def test_prefixed_names_are_looked_up_by_name_first(self):
+        objects = [{'uri': 'http://so/12', 'name': 'Plot:12'},
+                   {'uri': 'dev:so1', 'name': 'Plant 1'}]
+
+        def handler(request):
+            if request.path.endswith('/by_uris'):
+                uris = request.json()
+                return 200, {'metadata': {}, 'result': [
+                    o for o in objects if o['uri'] in uris]}
+            name = re.compile(request.param('name'))
+            return 200, {'metadata': {}, 'result': [
+                o for o in objects if name.search(o['name'])]}
+
+        with StubServer(handler) as server:
+            resolver = scientific_object_resolver(
+                swagger_client.ScientificObjectsApi(self.client(server)),
+                'token')
+            unknown = resolver.resolve(['Plot:12', 'dev:so1', 'A:1'])
+        self.assertEqual(unknown, set(['A:1']))
+        self.assertEqual(resolver.uri('Plot:12'), 'http://so/12')
+        self.assertEqual(resolver.uri('dev:so1'), 'dev:so1')
+        # 3 names, then the 2 found by none, as URIs
+        self.assertEqual(len(server.requests), 3 + 1)
+        self.assertEqual(server.requests[-1].json(), ['A:1', 'dev:so1'])
+
+    def test_is_uri(self):
+        self.assertTrue(is_uri('http://www.opensilex.org/id/so1'))
+        self.assertTrue(is_uri('HTTPS://www.opensilex.org/id/so1'))
+        self.assertTrue(is_uri('urn:uuid:6e8bc430-9c3a-11d9-9669'))
+        self.assertTrue(is_uri('ftp://host/file'))
+        self.assertFalse(is_uri('dev:so1'))
+        self.assertFalse(is_uri('Plot:12'))
+        self.assertFalse(is_uri('A:1'))
+        self.assertFalse(is_uri('Plant 1'))
+        self.assertFalse(is_uri('Height: plant'))
+        self.assertEqual(name_pattern('a.b (c)'), r'^a\.b\ \(c\)$')
+
+
+if __name__ == '__main__':
+    unittest.main()
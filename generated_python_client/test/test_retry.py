@@ -0,0 +1,163 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import socket
+import time
+import unittest
+
+import urllib3
+
+import swagger_client
+from swagger_client.pagination import FanOut
+from swagger_client.rest import ApiException
+from swagger_client.retry import RetryPolicy
+
+from .stub_server import StubServer
+
+OK = {'metadata': {}, 'result': []}
+
+
+def failing(*replies):
+    """Handler answering `replies` in turn, then 200."""
+    replies = list(replies)
+
+    def handler(request):
+        if replies:
+            reply = replies.pop(0)
+            if callable(reply):
+                return reply(request)
+            return reply
+        return 200, OK
+    return handler
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """RetryPolicy unit tests"""
+
+    def client(self, host, policy, **settings):
+        configuration = swagger_client.Configuration()
+        configuration.host = host
+        configuration.retry_policy = policy
+        for name, value in settings.items():
+            setattr(configuration, name, value)
+        return swagger_client.ApiClient(configuration)
+
+    def test_idempotent_requests_are_retried(self):
+        policy = RetryPolicy(retries=3, backoff=0.001)
+        with StubServer(failing((503, 'busy'), (502, 'bad gateway'))) as server:
+            api = swagger_client.VariablesApi(self.client(server.url, policy))
+            api.search_variables('token')
+        self.assertEqual(len(server.requests), 3)
+        stats = policy.stats.as_dict()
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['attempts'], 3)
+        self.assertEqual(stats['reasons'], {'503': 1, '502': 1})
+        self.assertEqual(stats['amplification'], 3.0)
+        self.assertLess(stats['sleep_time'], 0.01)
+
+    def test_posts_are_retried_only_when_marked_safe(self):
+        policy = RetryPolicy(retries=3, backoff=0.001)
+        with StubServer(failing((503, 'busy'))) as server:
+            api = swagger_client.DataApi(self.client(server.url, policy))
+            with self.assertRaises(ApiException) as context:
+                api.add_list_data('token', body=[])
+            self.assertEqual(context.exception.status, 503)
+            self.assertEqual(len(server.requests), 1)
+
+            server.handler = failing((503, 'busy'))
+            policy.mark_safe(r'^/core/data$')
+            api.add_list_data('token', body=[])
+            self.assertEqual(len(server.requests), 3)
+        self.assertEqual(policy.stats.retries, 1)
+
+    def test_retry_after_and_giving_up(self):
+        policy = RetryPolicy(retries=1, backoff=0.001, max_retry_after=5)
+        throttled = (429, 'slow down', {'Retry-After': '1'})
+        with StubServer(failing(throttled, throttled)) as server:
+            api = swagger_client.VariablesApi(self.client(server.url, policy))
+            start = time.time()
+            with self.assertRaises(ApiException):
+                api.search_variables('token')
+            self.assertGreaterEqual(time.time() - start, 1)
+            self.assertEqual(len(server.requests), 2)
+            self.assertEqual(policy.stats.gave_up, 1)
+            self.assertGreaterEqual(policy.stats.retry_after, 1)
+
+            # longer than max_retry_after: fails at once
+            server.handler = failing((503, 'down', {'Retry-After': '3600'}))
+            with self.assertRaises(ApiException):
+                api.search_variables('token')
+            self.assertEqual(len(server.requests), 3)
+
+    def test_connection_errors_and_read_timeouts(self):
+        def slow(request):
+            time.sleep(0.3)
+            return 200, OK
+
+        policy = RetryPolicy(retries=2, backoff=0.001)
+        with StubServer(failing(slow)) as server:
+            client = self.client(server.url, policy, read_timeout=0.1)
+            swagger_client.VariablesApi(client).search_variables('token')
+        self.assertEqual(policy.stats.reasons, {'ReadTimeoutError': 1})
+
+        # nothing listens on the port: even a POST is sent again
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        policy = RetryPolicy(retries=2, backoff=0.001)
+        api = swagger_client.DataApi(
+            self.client('http://127.0.0.1:%d' % port, policy))
+        with self.assertRaises(urllib3.exceptions.HTTPError):
+            api.add_list_data('token', body=[])
+        self.assertEqual(policy.stats.attempts, 3)
+        self.assertEqual(policy.stats.reasons, {'NewConnectionError': 2})
+        self.assertEqual(policy.stats.gave_up, 1)
+
+    def test_client_errors_are_not_retried(self):
+        policy = RetryPolicy(retries=3, backoff=0.001)
+        with StubServer(failing((400, 'bad request'))) as server:
+            api = swagger_client.VariablesApi(self.client(server.url, policy))
+            with self.assertRaises(ApiException):
+                api.search_variables('token')
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(policy.stats.retries, 0)
+
+
+    def test_read_only_posts_are_safe_by_default(self):
+        policy = RetryPolicy(retries=3, backoff=0.001)
+        with StubServer(failing((503, 'busy'))) as server:
+            api = swagger_client.DataApi(self.client(server.url, policy))
+            api.count_data('token')
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(policy.stats.reasons, {'503': 1})
+
+    def test_helpers_leave_retries_to_the_policy(self):
+        policy = RetryPolicy(retries=2, backoff=0.001)
+        with StubServer(failing(*[(503, 'busy')] * 20)) as server:
+            api = swagger_client.VariablesApi(self.client(server.url, policy))
+            pages = FanOut(api.search_variables, 'token', retries=3,
+                           backoff=0.001)
+            with self.assertRaises(ApiException):
+                list(pages)
+        # the policy's attempts only, not multiplied by FanOut's retries
+        self.assertEqual(len(server.requests), 3)
+        stats = policy.stats.as_dict()
+        self.assertEqual((stats['requests'], stats['attempts']), (1, 3))
+        self.assertEqual(stats['gave_up'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
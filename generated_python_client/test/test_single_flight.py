@@ -0,0 +1,87 @@
+# coding: utf-8
+
+"""
+    OpenSilex API
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: 1.4.7
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+from multiprocessing.pool import ThreadPool
+import time
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+
+from .stub_server import StubServer
+
+
+def variable_handler(request):
+    time.sleep(0.2)
+    if request.path.endswith('unknown'):
+        return 404, 'Not Found'
+    return 200, {'metadata': {}, 'result': {'uri': 'http://variable/1',
+                                            'name': 'Height'}}
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Coalescing of identical concurrent GETs unit tests"""
+
+    def api(self, server, coalesce=True):
+        configuration = swagger_client.Configuration()
+        configuration.host = server.url
+        configuration.coalesce_requests = coalesce
+        return swagger_client.VariablesApi(
+            swagger_client.ApiClient(configuration))
+
+    def run_concurrently(self, calls):
+        pool = ThreadPool(len(calls))
+        try:
+            return pool.map(lambda call: call(), calls)
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_identical_gets_share_one_request(self):
+        with StubServer(variable_handler) as server:
+            api = self.api(server)
+            results = self.run_concurrently(
+                [lambda: api.get_variable('http://variable/1', 'token')] * 5 +
+                [lambda: api.get_variable('http://variable/1', 'other')])
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual([r.name for r in results], ['Height'] * 6)
+        # every caller gets objects of its own
+        self.assertEqual(len(set(id(r.result) for r in results)), 6)
+        self.assertEqual(api.api_client.single_flight.as_dict(),
+                         {'calls': 2, 'shared': 4, 'in_flight': 0})
+
+    def test_errors_are_shared(self):
+        def call():
+            try:
+                api.get_variable('http://variable/unknown', 'token')
+            except ApiException as e:
+                return e.status
+
+        with StubServer(variable_handler) as server:
+            api = self.api(server)
+            self.assertEqual(self.run_concurrently([call] * 3), [404] * 3)
+        self.assertEqual(len(server.requests), 1)
+
+    def test_disabled_by_default(self):
+        with StubServer(variable_handler) as server:
+            api = self.api(server, coalesce=False)
+            self.run_concurrently(
+                [lambda: api.get_variable('http://variable/1', 'token')] * 3)
+        self.assertEqual(len(server.requests), 3)
+        self.assertIsNone(api.api_client.single_flight)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -115,17 +115,9 @@ def get_authenticated_client(host=None, username=None, password=None, interactiv
         auth_dto = AuthenticationDTO(identifier=user_to_use, password=password_to_use)
         response = auth_api.authenticate(body=auth_dto)
         
-        # Check if we got a token
-        token = None
-        if hasattr(response, 'token') and response.token:
-            token = response.token
-        elif hasattr(response, '_token') and response._token:
-            token = response._token
-        elif hasattr(response, 'result'):
-            if hasattr(response.result, 'token'):
-                token = response.result.token
-            elif isinstance(response.result, str):
-                token = response.result
+        # The envelope returned by the client reads through to its
+        # TokenGetDTO result
+        token = response.token if response is not None else None
                 
         if not token:
             print("Swagger client returned no token, trying raw HTTP approach...")
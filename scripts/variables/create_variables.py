@@ -9,6 +9,7 @@ import argparse
 import os
 import sys
 import swagger_client
+from swagger_client.pagination import paginate
 from swagger_client.rest import ApiException
 
 def create_variables_from_csv(client: swagger_client.ApiClient, csv_file_path: str):
@@ -123,15 +124,16 @@ def list_existing_variables(client: swagger_client.ApiClient, name_pattern: str
     variables_api = swagger_client.VariablesApi(client)
     
     try:
-        # Search for variables
-        response = variables_api.search_variables(
+        # Search for variables, page by page
+        variables = list(paginate(
+            variables_api.search_variables,
             authorization=client.configuration.api_key['Authorization'],
             name=name_pattern,
             page_size=100
-        )
+        ))
         
-        print(f"\nFound {len(response.result)} variables:")
-        for var in response.result:
+        print(f"\nFound {len(variables)} variables:")
+        for var in variables:
             print(f"  - {var.name} ({var.uri})")
             print(f"    Entity: {var.entity.name}")
             print(f"    Characteristic: {var.characteristic.name}")
@@ -1,100 +1,656 @@
+"""
+Import data from a CSV file into OpenSILEX.
+
+The file follows the OpenSILEX data format (see data/csv_format.txt): three
+header rows, the first one naming the columns, then one row per target and
+date with one column per variable. The experiment, target and device
+columns are optional and hold names or URIs; every distinct name is
+resolved once, before the upload, by a few batched requests (see
+swagger_client.resolve).
+
+Rows are read lazily and turned into batches of DataCreationDTO, which
+`concurrency` background threads upload with `add_list_data` while the
+following rows are still being parsed (see swagger_client.bulk). At most
+`queue_depth` batches wait for upload, so memory stays bounded by batch size
+times queue depth whatever the size of the file.
+
+Progress is checkpointed in a journal next to the file (see ImportJournal):
+running the same import again resumes after the last row imported.
+
+With --server-import, the file is sent instead to the server's own CSV
+import by chunks of rows, each with the header rows (see
+swagger_client.csv_import).
+"""
 
 import csv
 import argparse
+import collections
+import hashlib
+import itertools
+import json
 import os
+import re
 import sys
+import threading
+import time
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import swagger_client
+from swagger_client.bulk import BulkDataWriter, Watermark, is_duplicate, is_transient
+from swagger_client.configuration import ValidationContext
+from swagger_client.csv_import import ChunkedCsvImporter
+from swagger_client.data_csv import (HEADER_ROWS, MISSING_VALUES, CsvLayout, cell,
+                                     datatype_kind, detect_delimiter)
+from swagger_client.resolve import (device_resolver, experiment_resolver,
+                                    facility_resolver, is_uri,
+                                    scientific_object_resolver,
+                                    variable_resolver)
 from swagger_client.rest import ApiException
+from scripts.Authentication.authenticate import authenticate_and_get_client
 
-def import_csv_data(client: swagger_client.ApiClient, file_path: str):
-    # Create API instances
-    data_api = swagger_client.DataApi(client)
-    variables_api = swagger_client.VariablesApi(client)
-    scientific_objects_api = swagger_client.ScientificObjectsApi(client)
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CONCURRENCY = 4
+DEFAULT_QUEUE_DEPTH = 8
+DEFAULT_CHUNK_ROWS = 50000
+# Seconds between two throughput reports
+REPORT_INTERVAL = 5.0
 
-    try:
-        # Fetch a valid scientific object URI
-        scientific_objects_response = scientific_objects_api.search_scientific_objects(page_size=1)
-        if not scientific_objects_response or not scientific_objects_response.result:
-            print("Could not fetch a scientific object.")
-            return
-        valid_target_uri = scientific_objects_response.result[0].uri
-        print(f"Using scientific object URI: {valid_target_uri}")
-
-        # Search for an existing "Leaf Width Manual"
-        mock_variable_name = "Leaf Width Manual"
-        search_mock_var_response = variables_api.search_variables(name=mock_variable_name)
-        valid_variable_uri = None
-        if search_mock_var_response and search_mock_var_response.result:
-            for var in search_mock_var_response.result:
-                if var.name == mock_variable_name:
-                    valid_variable_uri = var.uri
-                    print(f"Found existing mock variable: {valid_variable_uri}")
-                    break
-        
-        if not valid_variable_uri:
-            print("Could not obtain a valid variable URI.")
-            return
-        
-        print(f"Using variable URI: {valid_variable_uri}")
 
-        # Create a default provenance
-        provenance_data = swagger_client.ProvenanceCreationDTO(
-            uri="http://www.opensilex.org/id/provenance/importer",
-            name="Data Importer",
-            description="Provenance for data imported from a CSV file"
-        )
-        try:
-            provenance_response = data_api.create_provenance(provenance_data)
-            provenance_uri = provenance_response.result[0]
-        except ApiException as e:
-            if e.status == 409: # Conflict, already exists
-                search_provenance_response = data_api.search_provenances(name="Data Importer")
-                if search_provenance_response and search_provenance_response.result:
-                    provenance_uri = search_provenance_response.result[0].uri
-                else:
-                    print(f"Failed to find provenance: {e}")
-                    return
+class Throughput:
+    """
+    Counts imported rows and reports rows/sec, from any thread
+    """
+
+    def __init__(self, interval=REPORT_INTERVAL):
+        self.interval = interval
+        self.rows = 0
+        self.failed = 0
+        self.start = time.monotonic()
+        self._last_report = self.start
+        self._lock = threading.Lock()
+
+    def add(self, rows, failed=False):
+        with self._lock:
+            if failed:
+                self.failed += rows
             else:
-                print(f"Failed to create provenance: {e}")
+                self.rows += rows
+            now = time.monotonic()
+            if now - self._last_report < self.interval:
                 return
+            self._last_report = now
+        print(f"  {self.rows} values imported ({self.rate():.0f} values/sec)")
+
+    def rate(self):
+        elapsed = time.monotonic() - self.start
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def summary(self):
+        elapsed = time.monotonic() - self.start
+        return (f"{self.rows} values imported, {self.failed} values failed "
+                f"in {elapsed:.1f}s ({self.rate():.0f} values/sec)")
+
+
+class ImportJournal:
+    """
+    Checkpoints of the import of a file, in a JSON lines journal.
+
+    The first line identifies the file by the SHA-256 of its content, so a
+    journal is only resumed for the very file it was written for. Each
+    following line records the row number and byte offset up to which every
+    row has been imported; the last line marks a completed import.
+    """
+
+    def __init__(self, path, file_hash):
+        self.path = path
+        self.file_hash = file_hash
+        self.checkpoint_row = 0
+        self.checkpoint_offset = 0
+        self.completed = False
+        self._file = None
+
+    @staticmethod
+    def hash_file(file_path, chunk_size=1 << 20):
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def open(self, restart=False):
+        """
+        Reads the journal, if any, and opens it for the next checkpoints.
+        Returns True when resuming an earlier import.
+        """
+        entries = []
+        # bytes of the complete lines read
+        size = 0
+        if not restart and os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # torn last line of a crashed import
+                        break
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        break
+                    size += len(line)
+        if entries and entries[0].get('sha256') != self.file_hash:
+            print(f"The file changed since {self.path} was written, starting over.")
+            entries = []
+
+        if entries:
+            for entry in entries[1:]:
+                if entry.get('complete'):
+                    self.completed = True
+                elif 'offset' in entry:
+                    self.checkpoint_row = entry['row']
+                    self.checkpoint_offset = entry['offset']
+            self._file = open(self.path, 'a')
+            # drop a torn line, which the next checkpoint would corrupt
+            self._file.truncate(size)
+            return True
+
+        self._file = open(self.path, 'w')
+        self._append({'sha256': self.file_hash})
+        return False
 
-        data_points = []
-        with open(file_path, 'r') as csvfile:
-            reader = csv.reader(csvfile)
-            for _ in range(3):
-                next(reader)
-            
-            for row in reader:
-                if not row:
+    def checkpoint(self, row, offset):
+        self.checkpoint_row = row
+        self.checkpoint_offset = offset
+        self._append({'row': row, 'offset': offset})
+
+    def complete(self):
+        self.completed = True
+        self._append({'complete': True})
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, entry):
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+class References:
+    """
+    Resolution cache of the experiments, targets, devices and variables of
+    a file. Targets are looked up among the scientific objects, then the
+    facilities; unknown target URIs are kept as they are, as they may be
+    events.
+    """
+
+    def __init__(self, client, authorization):
+        self.client = client
+        self.authorization = authorization
+        self.experiments = experiment_resolver(
+            swagger_client.ExperimentsApi(client), authorization)
+        self.scientific_objects = scientific_object_resolver(
+            swagger_client.ScientificObjectsApi(client), authorization)
+        self.facilities = facility_resolver(
+            swagger_client.OrganizationsApi(client), authorization)
+        self.devices = device_resolver(
+            swagger_client.DevicesApi(client), authorization)
+        self.variables = variable_resolver(
+            swagger_client.VariablesApi(client), authorization)
+
+    def within(self, experiment):
+        """
+        Looks the scientific objects up within an experiment
+        """
+        self.scientific_objects = scientific_object_resolver(
+            swagger_client.ScientificObjectsApi(self.client), self.authorization,
+            experiment=experiment)
+
+    def resolve(self, layout, rows):
+        """
+        Resolves every reference of the layout and rows at once. Returns the
+        list of (kind, reference) that could not be resolved
+        """
+        experiments, targets, devices = layout.references(rows)
+        unknown = [('variable', v) for v in self.variables.resolve(
+            reference for _, reference, _ in layout.variables)]
+        unknown += [('experiment', e) for e in self.experiments.resolve(experiments)]
+        unknown += [('device', d) for d in self.devices.resolve(devices)]
+        others = self.scientific_objects.resolve(targets)
+        unknown += [('target', t) for t in self.facilities.resolve(others)
+                    if not is_uri(t)]
+        return sorted(unknown)
+
+    def requests(self):
+        return sum(resolver.requests for resolver in (
+            self.experiments, self.scientific_objects, self.facilities,
+            self.devices, self.variables))
+
+    def target(self, reference):
+        for resolver in (self.scientific_objects, self.facilities):
+            uri = resolver.uri(reference)
+            if uri is not None:
+                return uri
+        return reference if is_uri(reference) else None
+
+
+def parse_value(text, datatype):
+    """
+    Converts a cell to a value of the datatype of its variable (an XSD
+    datatype URI), or returns None for a missing value
+    """
+    kind = datatype_kind(datatype)
+    if kind in ('decimal', 'double', 'float'):
+        if text in MISSING_VALUES:
+            return None
+        return float(text)
+    if kind in ('integer', 'int', 'long'):
+        if text in MISSING_VALUES:
+            return None
+        return int(text)
+    if kind == 'boolean':
+        if text.lower() in ('true', '1'):
+            return True
+        if text.lower() in ('false', '0'):
+            return False
+        raise ValueError(f"invalid boolean: {text!r}")
+    # dates and strings
+    return text
+
+
+def parse_raw_data(text):
+    return [float(v) for v in re.split(r'[\s,;|]+', text.strip('[] ')) if v]
+
+
+def read_rows(file_path, offset=0, row_number=0, delimiter=','):
+    """
+    Yields (row number, byte offset after the row, row) for each data row of
+    the CSV file, lazily, starting at `offset` (a row boundary), where the
+    row number is `row_number`
+    """
+    with open(file_path, 'rb') as csvfile:
+        csvfile.seek(offset)
+        position = [offset]
+
+        def lines():
+            for line in csvfile:
+                position[0] += len(line)
+                yield line.decode('utf-8')
+
+        reader = csv.reader(lines(), delimiter=delimiter)
+        if offset == 0:
+            for _ in range(HEADER_ROWS):
+                next(reader, None)
+        for row in reader:
+            if row:
+                yield row_number + reader.line_num, position[0], row
+
+
+def parse_data_points(rows, layout, references, provenance_uri, experiment=None,
+                      start=(0, 0), rejects=None):
+    """
+    Yields (DataCreationDTO, row number, byte offset, row) for each value of
+    each parsable row, one per variable column. The row number and offset
+    are those after the row for its last value, and before it for the
+    others, so that a checkpoint never falls within a row; `start` is the
+    (row number, offset) the rows start after. The row of a
+    value keeps only the cells of its variable, to be written to the reject
+    file. Rows that can't be parsed are written to `rejects`, a RejectFile
+    """
+    # One validation context shared by every DTO instead of a Configuration
+    # per DTO
+    context = ValidationContext()
+    # (experiments, devices) -> provenance shared by the rows
+    provenances = {}
+    variables = []
+    for column, reference, raw_column in layout.variables:
+        variable = references.variables.get(reference)
+        if variable is not None:
+            variables.append((column, variable, raw_column))
+    variable_columns = [c for c, _, r in layout.variables] + [
+        r for _, _, r in layout.variables if r is not None]
+    previous = start
+    for line_number, offset, row in rows:
+        try:
+            experiments = tuple(references.experiments.uri(cell(row, i))
+                                for i in layout.experiments if cell(row, i))
+            devices = tuple(references.devices.get(cell(row, i))
+                            for i in layout.devices if cell(row, i))
+            if None in experiments or None in devices:
+                raise ValueError("unknown experiment or device")
+            if experiment is not None and experiment not in experiments:
+                experiments += (experiment,)
+            target = None
+            if layout.target is not None and cell(row, layout.target):
+                target = references.target(cell(row, layout.target))
+                if target is None:
+                    raise ValueError("unknown target")
+            if target is None and not devices:
+                raise ValueError("a target or a device is required")
+            date = cell(row, layout.date)
+            if not date:
+                raise ValueError("the date is required")
+
+            key = (experiments, tuple(d.uri for d in devices))
+            provenance = provenances.get(key)
+            if provenance is None:
+                provenance = provenances[key] = swagger_client.DataProvenanceModel(
+                    uri=provenance_uri,
+                    experiments=list(experiments) or None,
+                    prov_was_associated_with=[swagger_client.ProvEntityModel(
+                        uri=d.uri, rdf_type=d.rdf_type, _configuration=context)
+                        for d in devices] or None,
+                    _configuration=context)
+
+            points = []
+            for column, variable, raw_column in variables:
+                text = cell(row, column)
+                if not text:
                     continue
-                
-                try:
-                    data_points.append(swagger_client.DataCreationDTO(
-                        target=valid_target_uri,
-                        variable=valid_variable_uri,
-                        date=row[3],
-                        value=float(row[4]),
-                        provenance=provenance_uri
-                    ))
-                except (IndexError, ValueError) as e:
-                    print(f"Error parsing row: {row} - {e}")
+                value = parse_value(text, getattr(variable, 'datatype', None))
+                if value is None:
                     continue
+                raw_data = None
+                if raw_column is not None and cell(row, raw_column):
+                    raw_data = parse_raw_data(cell(row, raw_column))
+                points.append((column, raw_column, swagger_client.DataCreationDTO(
+                    target=target,
+                    variable=variable.uri,
+                    _date=date,
+                    value=value,
+                    raw_data=raw_data,
+                    provenance=provenance,
+                    _configuration=context
+                )))
+        except (IndexError, ValueError) as e:
+            print(f"Error parsing row {line_number}: {row} - {e}")
+            if rejects is not None:
+                rejects.write([row])
+            continue
+
+        for i, (column, raw_column, point) in enumerate(points):
+            if len(points) > 1:
+                kept = (column, raw_column)
+                reject_row = [value if index not in variable_columns or index in kept
+                              else '' for index, value in enumerate(row)]
+            else:
+                reject_row = row
+            if i < len(points) - 1:
+                yield point, previous[0], previous[1], reject_row
+            else:
+                yield point, line_number, offset, reject_row
+        previous = (line_number, offset)
+
+
+class RejectFile:
+    """
+    CSV file collecting the rows that could not be parsed or were rejected
+    by the server, after the header rows of the imported file, so that it
+    can be fixed and imported again
+    """
+
+    def __init__(self, path, file_path, delimiter=',', append=False):
+        self.path = path
+        self.rows = 0
+        self._lock = threading.Lock()
+        exists = append and os.path.exists(path)
+        self._file = open(path, 'a' if exists else 'w', newline='')
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        if not exists:
+            with open(file_path, 'r', newline='') as csvfile:
+                reader = csv.reader(csvfile, delimiter=delimiter)
+                for _ in range(HEADER_ROWS):
+                    self._writer.writerow(next(reader, []))
+
+    def write(self, rows):
+        with self._lock:
+            self._writer.writerows(rows)
+            self._file.flush()
+            self.rows += len(rows)
+
+    def close(self):
+        self._file.close()
+
+
+def upload_data_points(data_api, authorization, data_points, batch_size=DEFAULT_BATCH_SIZE,
+                       concurrency=DEFAULT_CONCURRENCY, queue_depth=DEFAULT_QUEUE_DEPTH,
+                       journal=None, rejects=None):
+    """
+    Uploads the (data point, row number, offset, row) of `data_points` with
+    a BulkDataWriter: `concurrency` batches are sent at once while the next
+    ones are being built, and the batch size adapts to the server latency.
+
+    A batch rejected because some of its data already exists is bisected
+    until the duplicate rows are isolated, so that every other row is
+    imported. Rows rejected by the server are reported and written to the
+    reject file. When the server can't be reached, the upload stops. Each
+    time every row up to some point is done with, the position is
+    checkpointed in the journal. Returns the Throughput of the upload, and
+    whether it went through the whole file.
+    """
+    throughput = Throughput()
+    # (row number, offset, row) of the points written and not yet done with
+    positions = collections.deque()
+    watermark = Watermark()
+    lock = threading.Lock()
+    stopped = threading.Event()
+
+    def done(batch):
+        with lock:
+            value = watermark.add(batch)
+            if value is None:
+                return
+            position = None
+            for _ in range(value - done.count):
+                position = positions.popleft()
+            done.count = value
+            if journal is not None:
+                journal.checkpoint(position[0], position[1])
+    done.count = 0
+
+    def on_success(batch):
+        throughput.add(len(batch))
+        done(batch)
+
+    def on_error(batch, error):
+        throughput.add(len(batch), failed=True)
+        if is_transient(error):
+            # keep the rows for the next run
+            print(f"Batch of {len(batch)} rows failed, stopping: {error}")
+            stopped.set()
+            writer.cancel()
+            return
+        with lock:
+            first = batch.start - done.count
+            rejected = list(itertools.islice(positions, first, first + len(batch)))
+        if is_duplicate(error):
+            print(f"Row {rejected[0][0]} already exists.")
+        else:
+            body = getattr(error, 'body', None) or str(error)
+            print(f"Rows {rejected[0][0]} to {rejected[-1][0]} rejected: {body}")
+        if rejects is not None:
+            rejects.write([row for _, _, row in rejected])
+        done(batch)
+
+    writer = BulkDataWriter(data_api, authorization, concurrency=concurrency,
+                            batch_size=batch_size, queue_depth=queue_depth,
+                            bisect_on=is_duplicate, on_success=on_success,
+                            on_error=on_error)
+    with writer:
+        for point, row_number, offset, row in data_points:
+            if stopped.is_set():
+                break
+            positions.append((row_number, offset, row))
+            writer.write(point)
+    return throughput, not stopped.is_set()
+
+
+def validate_file(file_path, layout, references, delimiter):
+    """
+    Checks the whole file locally before anything is uploaded, see
+    swagger_client.csv_validation. Writes the errors found next to the file
+    and returns whether there are none
+    """
+    try:
+        from swagger_client.csv_validation import DataCsvValidator
+    except ImportError as e:
+        print(f"Skipping local validation: {e}")
+        return True
+    datatypes = {}
+    for _, reference, _ in layout.variables:
+        variable = references.variables.get(reference)
+        if variable is not None:
+            datatypes[reference] = variable.datatype
+    start = time.monotonic()
+    report = DataCsvValidator(datatypes).validate(file_path, delimiter)
+    print(f"Validated {file_path} in {time.monotonic() - start:.1f}s: {report.summary()}")
+    if report.valid:
+        return True
+    errors_path = file_path + '.errors.csv'
+    report.write_csv(errors_path)
+    print(f"Errors written to {errors_path}, fix them or import with --skip-validation.")
+    return False
+
+
+def import_with_server(data_api, authorization, file_path, provenance_uri, experiment,
+                       concurrency, chunk_rows):
+    """
+    Imports the file with the server's CSV import, by chunks of `chunk_rows`
+    rows sent `concurrency` at once: every chunk is validated first, and
+    nothing is imported unless the whole file is valid
+    """
+    importer = ChunkedCsvImporter(data_api, authorization, provenance_uri,
+                                  experiment=experiment, chunk_rows=chunk_rows,
+                                  concurrency=concurrency)
+    start = time.monotonic()
+    result = importer.import_file(file_path)
+    elapsed = time.monotonic() - start
+    for chunk, error in result.failed:
+        print(f"Chunk of rows {chunk.first_row + 1} to {chunk.first_row + chunk.rows} "
+              f"failed: {getattr(error, 'body', None) or error}")
+    if not result.valid:
+        if result.report is not None:
+            errors = result.report.data_errors or result.report.errors
+            print(f"The server rejected {file_path}:")
+            for attr in errors.swagger_types:
+                value = getattr(errors, attr)
+                if attr.endswith('errors') and value:
+                    rows = sorted(value, key=lambda key: int(key) if key.isdigit() else 0)
+                    print(f"  {len(rows)} rows with {attr}, first: {rows[:10]}")
+                elif attr in ('missing_headers', 'empty_headers') and value:
+                    print(f"  {attr}: {value}")
+        return
+    print(f"{result.rows_imported} rows imported in {result.chunks} chunks "
+          f"in {elapsed:.1f}s.")
+
+
+def find_provenance(data_api, authorization):
+    """
+    Returns the URI of the importer provenance, creating it if needed
+    """
+    provenance_data = swagger_client.ProvenanceCreationDTO(
+        uri="http://www.opensilex.org/id/provenance/importer",
+        name="Data Importer",
+        description="Provenance for data imported from a CSV file"
+    )
+    try:
+        return data_api.create_provenance(authorization, body=provenance_data).result
+    except ApiException as e:
+        if e.status != 409:  # Conflict, already exists
+            raise
+    provenances = data_api.search_provenance(authorization, name="Data Importer")
+    if not provenances:
+        return None
+    return provenances[0].uri
+
 
-        if not data_points:
-            print("No data points to import.")
+def import_csv_data(client: swagger_client.ApiClient, authorization: str, file_path: str,
+                    batch_size: int = DEFAULT_BATCH_SIZE, concurrency: int = DEFAULT_CONCURRENCY,
+                    queue_depth: int = DEFAULT_QUEUE_DEPTH, journal_path: str = None,
+                    restart: bool = False, reject_path: str = None,
+                    experiment: str = None, validate: bool = True,
+                    server_import: bool = False, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    data_api = swagger_client.DataApi(client)
+
+    try:
+        delimiter = detect_delimiter(file_path)
+        try:
+            layout = CsvLayout.read(file_path, delimiter)
+        except ValueError as e:
+            print(f"Invalid header in {file_path}: {e}")
             return
 
-        print(f"Attempting to import {len(data_points)} data points...")
+        references = References(client, authorization)
+        if experiment is not None:
+            experiment = references.experiments.uri(experiment)
+            if experiment is None:
+                print("Unknown experiment.")
+                return
+            print(f"Using experiment URI: {experiment}")
+            references.within(experiment)
+
+        # Create a default provenance
         try:
-            data_api.add_data_list(data_points)
-            print("Data imported successfully!")
+            provenance_uri = find_provenance(data_api, authorization)
         except ApiException as e:
-            if "DUPLICATE_DATA_KEY" in e.body:
-                print("Data already exists, skipping import.")
+            print(f"Failed to create provenance: {e}")
+            return
+        if not provenance_uri:
+            print("Failed to find provenance.")
+            return
+
+        if server_import:
+            import_with_server(data_api, authorization, file_path, provenance_uri,
+                               experiment, concurrency, chunk_rows)
+            return
+        if layout.annotation is not None:
+            print("The Annotation column is not imported.")
+
+        journal = ImportJournal(journal_path or file_path + '.journal',
+                                ImportJournal.hash_file(file_path))
+        rejects = None
+        try:
+            resuming = journal.open(restart)
+            if resuming:
+                if journal.completed:
+                    print(f"{file_path} was already imported, see {journal.path}.")
+                    return
+                print(f"Resuming after row {journal.checkpoint_row}.")
+
+            unknown = references.resolve(layout, read_rows(
+                file_path, journal.checkpoint_offset, journal.checkpoint_row, delimiter))
+            print(f"Resolved names and URIs in {references.requests()} requests.")
+            for kind, reference in unknown:
+                print(f"Unknown {kind}: {reference}")
+            if all(references.variables.get(v) is None for _, v, _ in layout.variables):
+                print("No known variable in the file.")
+                return
+            if validate and not validate_file(file_path, layout, references, delimiter):
+                return
+
+            rejects = RejectFile(reject_path or file_path + '.rejected.csv',
+                                 file_path, delimiter, append=resuming)
+            print(f"Importing {file_path} with {concurrency} concurrent uploads...")
+            rows = read_rows(file_path, journal.checkpoint_offset, journal.checkpoint_row,
+                             delimiter)
+            data_points = parse_data_points(
+                rows, layout, references, provenance_uri, experiment,
+                start=(journal.checkpoint_row, journal.checkpoint_offset),
+                rejects=rejects)
+            throughput, finished = upload_data_points(
+                data_api, authorization, data_points, batch_size, concurrency,
+                queue_depth, journal, rejects)
+            print(throughput.summary())
+            if rejects.rows:
+                print(f"{rejects.rows} rejected rows written to {rejects.path}.")
+            if finished:
+                journal.complete()
             else:
-                print(f"Data import failed: {e.body}")
+                print(f"Import stopped after row {journal.checkpoint_row}, "
+                      f"run it again to resume.")
+        finally:
+            journal.close()
+            if rejects is not None:
+                rejects.close()
 
     except ApiException as e:
         print(f"An API error occurred: {e.body}")
@@ -102,23 +658,44 @@ def import_csv_data(client: swagger_client.ApiClient, file_path: str):
 def main():
     parser = argparse.ArgumentParser(description="Import data from a CSV file into OpenSILEX.")
     parser.add_argument("file_path", help="The full path to the CSV file to import.")
+    parser.add_argument("--host", default="http://localhost:8080/rest", help="The OpenSILEX API host.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Initial number of rows sent per add_list_data call.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Number of add_list_data calls in flight.")
+    parser.add_argument("--queue-depth", type=int, default=DEFAULT_QUEUE_DEPTH,
+                        help="Number of batches built ahead of the upload.")
+    parser.add_argument("--journal", help="Checkpoint journal (default: <file_path>.journal).")
+    parser.add_argument("--restart", action="store_true",
+                        help="Import the whole file again, ignoring the journal.")
+    parser.add_argument("--reject-file",
+                        help="CSV file receiving the rejected rows "
+                             "(default: <file_path>.rejected.csv).")
+    parser.add_argument("--experiment",
+                        help="Experiment (name or URI) of every row, in which "
+                             "targets are looked up.")
+    parser.add_argument("--skip-validation", action="store_true",
+                        help="Upload without checking the whole file first.")
+    parser.add_argument("--server-import", action="store_true",
+                        help="Send the file to the server's CSV import, by chunks, "
+                             "instead of uploading data points.")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="Number of rows per chunk with --server-import.")
     args = parser.parse_args()
 
-    configuration.host = "http://localhost:8080"
-    client = swagger_client.ApiClient(configuration)
-
     # Authenticate
-    auth_api = swagger_client.AuthenticationApi(client)
-    try:
-        auth_response = auth_api.authenticate("admin@opensilex.org", "admin")
-        client.configuration.api_key['Authorization'] = auth_response.result.token
-        client.configuration.api_key_prefix['Authorization'] = 'Bearer'
-        print("Authentication successful.")
-    except ApiException as e:
-        print(f"Authentication failed: {e.body}")
+    client, token = authenticate_and_get_client(host=args.host)
+    if not client:
+        print("Authentication failed.")
         return
+    print("Authentication successful.")
 
-    import_csv_data(client, args.file_path)
+    import_csv_data(client, f"Bearer {token}", args.file_path,
+                    batch_size=args.batch_size, concurrency=args.concurrency,
+                    queue_depth=args.queue_depth, journal_path=args.journal,
+                    restart=args.restart, reject_path=args.reject_file,
+                    experiment=args.experiment, validate=not args.skip_validation,
+                    server_import=args.server_import, chunk_rows=args.chunk_rows)
 
     # No explicit logout in swagger client, token will expire
 